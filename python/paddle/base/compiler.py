@@ -534,10 +534,14 @@ class IpuDynamicPatcher:
                     ipu_strategy, concrete_program, item.class_instance
                 )
 
-                self._caches[item_id] = (
-                    concrete_program,
-                    partial_program_from(
-                        concrete_program, item.class_instance is not None
+                self._add(
+                    item_id,
+                    item,
+                    (
+                        concrete_program,
+                        partial_program_from(
+                            concrete_program, item.class_instance is not None
+                        ),
                     ),
                 )
                 # Note: raise warnings if number of traced program is more than `max_tracing_count`
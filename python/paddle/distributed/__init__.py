@@ -114,6 +114,7 @@ from . import rpc  # noqa: F401
 
 from .checkpoint.save_state_dict import save_state_dict
 from .checkpoint.load_state_dict import load_state_dict
+from .checkpoint.compact_state_dict import compact_state_dict
 
 __all__ = [
     "io",
@@ -172,6 +173,7 @@ __all__ = [
     "Partial",
     "save_state_dict",
     "load_state_dict",
+    "compact_state_dict",
     "shard_optimizer",
     "shard_scaler",
     "ShardingStage1",
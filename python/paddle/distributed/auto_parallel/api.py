@@ -2422,6 +2422,7 @@ class ShardDataloader:
                 timeout=dataloader.timeout,
                 worker_init_fn=dataloader.worker_init_fn,
                 persistent_workers=dataloader._persistent_workers,
+                in_order=dataloader.in_order,
             )
         # Note(lizhiyu): In dygraph mode, the flag "pin_memory" is defualt "True", but it decrease the speed of `AutoParallel`
         self._dataloader.pin_memory = False
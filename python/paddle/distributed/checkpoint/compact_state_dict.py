@@ -0,0 +1,93 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import paddle
+from paddle.distributed.fleet.utils.log_util import logger
+
+from .load_state_dict import get_checkpoint_files, get_storage_local_tensor
+from .metadata import Metadata
+
+
+def compact_state_dict(path, output_path) -> None:
+    """
+    Merge a checkpoint saved by `save_state_dict` in incremental mode with the chunks it references
+    from its base checkpoints, and save the result as a self-contained checkpoint to output_path.
+    The base checkpoints are no longer needed to load from output_path.
+
+    Args:
+        path(str): The directory of the checkpoint to compact.
+        output_path(str): The directory to save the compacted checkpoint, it should be different from path.
+
+    Example:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('requires checkpoint files')
+            >>> import paddle.distributed as dist
+            >>> dist.compact_state_dict("./checkpoint_3", "./checkpoint_3_full")
+            >>> # doctest: -SKIP
+    """
+    assert os.path.abspath(path) != os.path.abspath(
+        output_path
+    ), "The output_path should be different from path."
+    if not os.path.exists(output_path):
+        os.makedirs(output_path, exist_ok=True)
+
+    metadata_files, _ = get_checkpoint_files(path, use_cache=False)
+    storage_state_dicts = {}
+    for metadata_file in metadata_files:
+        unique_id = metadata_file.split(".")[0]
+        metadata = paddle.load(os.path.join(path, metadata_file))
+        incremental = metadata.chunk_hashes is not None
+        output_state_dicts = {}
+        output_metadata = Metadata(
+            state_dict_metadata=metadata.state_dict_metadata,
+            storage_metadata={},
+            flat_mapping=metadata.flat_mapping,
+            chunk_hashes=metadata.chunk_hashes,
+        )
+        for tensor_index, file_name in metadata.storage_metadata.items():
+            if file_name not in storage_state_dicts:
+                # tensor archive files are memory mapped, the chunks are copied when saving
+                storage_state_dicts[file_name] = paddle.load(
+                    os.path.join(path, file_name), return_numpy=True
+                )
+            value = get_storage_local_tensor(
+                storage_state_dicts[file_name], tensor_index
+            )
+            # keep the rank prefix of the file name which stores the chunk, and
+            # name the file by the unique_id of the metadata as save_state_dict,
+            # so the files of different metadata do not collide
+            rank = os.path.basename(file_name).split("_")[0]
+            output_file = f"{rank}_{unique_id}.distcp"
+            output_state_dict = output_state_dicts.setdefault(output_file, {})
+            if incremental:
+                output_state_dict.setdefault(tensor_index.tensor_key, {})[
+                    tensor_index.global_offset
+                ] = value
+            else:
+                output_state_dict[tensor_index.tensor_key] = value
+            output_metadata.storage_metadata[tensor_index] = output_file
+
+        for output_file, output_state_dict in output_state_dicts.items():
+            paddle.save(
+                output_state_dict,
+                os.path.join(output_path, output_file),
+                use_archive_format=True,
+            )
+        paddle.save(output_metadata, os.path.join(output_path, metadata_file))
+        logger.debug(
+            f"compact {metadata_file} of {path} into files:{list(output_state_dicts.keys())}"
+        )
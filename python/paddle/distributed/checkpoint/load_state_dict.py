@@ -12,14 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import copy
 import os
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
+import numpy as np
+
 import paddle
 from paddle.distributed.communication.group import is_initialized
 from paddle.distributed.fleet.utils.log_util import logger
+from paddle.framework.io import (
+    _is_tensor_archive,
+    _load_tensor_archive_index,
+)
 
 from .metadata import LocalTensorIndex, LocalTensorMetadata
 from .utils import (
@@ -39,6 +46,10 @@ class ReadItem:
 
 PATH_TO_CHECKPOINT_FILES: Dict[str, Tuple[list, list]] = {}
 
+# storage slices closer than this in a file are fetched by a single read
+MERGE_READ_GAP = 1024 * 1024
+NUM_READ_THREADS = 8
+
 
 def get_checkpoint_files(path, use_cache=True):
     global PATH_TO_CHECKPOINT_FILES
@@ -87,6 +98,15 @@ def get_rank_to_files(path, state_dict, process_group, use_dist):
         missing_keys = set(state_dict.keys())
         return {}, missing_keys
 
+    # The files referenced from the base checkpoint of incremental save
+    referenced_files = [
+        file
+        for file in necessary_data_files_set
+        if file not in local_data_files
+        and os.path.isfile(os.path.join(path, file))
+    ]
+    local_data_files = local_data_files + referenced_files
+
     # allgather all accessible files
     global_data_files = []
     if use_dist:
@@ -374,6 +394,177 @@ def get_read_items(path, state_dict, process_group, use_dist):
     return global_read_items
 
 
+def get_storage_local_tensor(storage_state_dict, local_tensor_index):
+    """
+    Get the local tensor from the state_dict stored in a data file. The local tensors saved in
+    incremental mode are split into chunks, which are stored as {tensor_key: {global_offset: chunk}}.
+    """
+    assert local_tensor_index.tensor_key in storage_state_dict
+    value = storage_state_dict[local_tensor_index.tensor_key]
+    if isinstance(value, dict):
+        assert local_tensor_index.global_offset in value
+        value = value[local_tensor_index.global_offset]
+    return value
+
+
+def get_storage_chunk_key(item: ReadItem):
+    """
+    The identifier of the storage slice read by item, ranks reading the same slice share it.
+    """
+    return (item.local_tensor_index, item.storage_offset, item.lengths)
+
+
+def get_storage_chunk_span(entry, storage_offset, lengths):
+    """
+    Compute the byte range [begin, end) of the slice (storage_offset, lengths) of a tensor stored
+    in tensor archive, and the byte strides of the stored tensor.
+
+    Example:
+        The stored tensor is float32 with shape [4, 8] at offset 64, the slice with storage_offset (1, 2)
+        and lengths (2, 4) covers bytes [64 + (1 * 8 + 2) * 4, 64 + (2 * 8 + 5 + 1) * 4) = [104, 152),
+        strides is [32, 4].
+    """
+    itemsize = np.dtype(entry['dtype']).itemsize
+    strides = []
+    stride = itemsize
+    for dim in reversed(entry['shape']):
+        strides.insert(0, stride)
+        stride *= dim
+    if 0 in lengths:
+        return entry['offset'], entry['offset'], strides
+    first = sum(o * s for o, s in zip(storage_offset, strides))
+    last = sum(
+        (o + l - 1) * s for o, l, s in zip(storage_offset, lengths, strides)
+    )
+    return entry['offset'] + first, entry['offset'] + last + itemsize, strides
+
+
+def get_read_plan(path, file_to_read_items):
+    """
+    Merge the storage slices to read in each file into byte ranges.
+
+    Args:
+        path(str): The checkpoint directory.
+        file_to_read_items(Dict[str, List[ReadItem]]): The read items of each tensor archive file.
+
+    Returns:
+        List[Tuple[str, int, int, list]]: The byte ranges (file_name, begin, end, slices) to read. Each slice
+        in the range is (storage_chunk_key, dtype, lengths, offset in the range, strides).
+    """
+    read_plan = []
+    for file_name, items in file_to_read_items.items():
+        structure, entries = _load_tensor_archive_index(
+            os.path.join(path, file_name)
+        )
+        slices = []
+        for item in items:
+            ref = get_storage_local_tensor(structure, item.local_tensor_index)
+            entry = entries[ref.index]
+            begin, end, strides = get_storage_chunk_span(
+                entry, item.storage_offset, item.lengths
+            )
+            slices.append(
+                (
+                    begin,
+                    end,
+                    get_storage_chunk_key(item),
+                    entry['dtype'],
+                    item.lengths,
+                    strides,
+                )
+            )
+        slices.sort(key=lambda x: x[0])
+        ranges = []
+        for begin, end, key, dtype, lengths, strides in slices:
+            if len(ranges) > 0 and begin <= ranges[-1][1] + MERGE_READ_GAP:
+                ranges[-1][1] = max(ranges[-1][1], end)
+            else:
+                ranges.append([begin, end, []])
+            ranges[-1][2].append((key, dtype, lengths, begin, strides))
+        for begin, end, members in ranges:
+            read_plan.append(
+                (
+                    file_name,
+                    begin,
+                    end,
+                    [
+                        (key, dtype, lengths, offset - begin, strides)
+                        for key, dtype, lengths, offset, strides in members
+                    ],
+                )
+            )
+    logger.debug(f"read_plan:{[plan[:3] for plan in read_plan]}")
+    return read_plan
+
+
+def read_storage_chunks(path, read_plan):
+    """
+    Read the byte ranges in read_plan with a thread pool.
+
+    Returns:
+        Dict[tuple, numpy.ndarray]: mapping from storage_chunk_key to the slice of the stored tensor.
+    """
+
+    def read_range(file_name, begin, end):
+        with open(os.path.join(path, file_name), 'rb') as f:
+            f.seek(begin)
+            return f.read(end - begin)
+
+    storage_chunks = {}
+    with concurrent.futures.ThreadPoolExecutor(NUM_READ_THREADS) as pool:
+        futures = [
+            pool.submit(read_range, file_name, begin, end)
+            for file_name, begin, end, _ in read_plan
+        ]
+        for (_, _, _, slices), future in zip(read_plan, futures):
+            data = future.result()
+            for key, dtype, lengths, offset, strides in slices:
+                if 0 in lengths:
+                    storage_chunks[key] = np.zeros(lengths, dtype=dtype)
+                else:
+                    storage_chunks[key] = np.ndarray(
+                        lengths,
+                        dtype=dtype,
+                        buffer=data,
+                        offset=offset,
+                        strides=strides,
+                    )
+    return storage_chunks
+
+
+def load_storage_chunk_tensor(
+    path, item, file_name, storage_file_to_state_dict
+):
+    if file_name not in storage_file_to_state_dict:
+        # The value in state_dict is not distributed tensor but a normal tensor.
+        storage_file_to_state_dict[file_name] = paddle.load(
+            os.path.join(path, file_name)
+        )
+    storage_state_dict = storage_file_to_state_dict[file_name]
+    storage_local_tensor = get_storage_local_tensor(
+        storage_state_dict, item.local_tensor_index
+    )
+    storage_offsets = item.storage_offset
+    storage_lengths = item.lengths
+    storage_ends = [
+        storage_offset + storage_length
+        for storage_offset, storage_length in zip(
+            storage_offsets, storage_lengths
+        )
+    ]
+    # The storage_chunk_tensor and storage_local_tensor share the same memory.
+    if len(storage_lengths) > 0:
+        storage_chunk_tensor = paddle.slice(
+            storage_local_tensor,
+            list(range(len(storage_lengths))),
+            storage_offsets,
+            storage_ends,
+        )
+    else:
+        storage_chunk_tensor = storage_local_tensor
+    return storage_chunk_tensor
+
+
 def load_state_dict(
     state_dict,
     path,
@@ -462,43 +653,53 @@ def load_state_dict(
             if v.place.is_cpu_place():
                 state_dict_in_cpu.append(k)
                 flat_state_dict[k] = v.cuda()
+        # Only the overlapping slices of tensor archive files are read,
+        # files in the legacy format are loaded as a whole.
+        file_to_read_items = {}
+        legacy_files = set()
         for item in read_items:
             assert (
                 item.local_tensor_index in load_infos
             ), f"item:{item}, load_infos:{load_infos}"
+            src_rank, file_name = load_infos[item.local_tensor_index]
+            if (
+                src_rank != paddle.distributed.get_rank()
+                or file_name in legacy_files
+            ):
+                continue
+            if file_name in file_to_read_items or _is_tensor_archive(
+                os.path.join(path, file_name)
+            ):
+                file_to_read_items.setdefault(file_name, {})[
+                    get_storage_chunk_key(item)
+                ] = item
+            else:
+                legacy_files.add(file_name)
+        storage_chunks = read_storage_chunks(
+            path,
+            get_read_plan(
+                path,
+                {
+                    file_name: list(items.values())
+                    for file_name, items in file_to_read_items.items()
+                },
+            ),
+        )
+        for item in read_items:
             src_rank, file_name = load_infos[item.local_tensor_index]
             storage_chunk_tensor = None
             cur_chunk_tensor = None
             # The src rank need to load the state_dict.
             if src_rank == paddle.distributed.get_rank():
-                if file_name not in storage_file_to_state_dict:
-                    # The value in state_dict is not distributed tensor but a normal tensor.
-                    storage_file_to_state_dict[file_name] = paddle.load(
-                        os.path.join(path, file_name)
-                    )
-                storage_state_dict = storage_file_to_state_dict[file_name]
-                assert item.local_tensor_index.tensor_key in storage_state_dict
-                storage_local_tensor = storage_state_dict[
-                    item.local_tensor_index.tensor_key
-                ]
-                storage_offsets = item.storage_offset
-                storage_lengths = item.lengths
-                storage_ends = [
-                    storage_offset + storage_length
-                    for storage_offset, storage_length in zip(
-                        storage_offsets, storage_lengths
-                    )
-                ]
-                # The storage_chunk_tensor and storage_local_tensor share the same memory.
-                if len(storage_lengths) > 0:
-                    storage_chunk_tensor = paddle.slice(
-                        storage_local_tensor,
-                        list(range(len(storage_lengths))),
-                        storage_offsets,
-                        storage_ends,
+                chunk_key = get_storage_chunk_key(item)
+                if chunk_key in storage_chunks:
+                    storage_chunk_tensor = paddle.to_tensor(
+                        storage_chunks[chunk_key]
                     )
                 else:
-                    storage_chunk_tensor = storage_local_tensor
+                    storage_chunk_tensor = load_storage_chunk_tensor(
+                        path, item, file_name, storage_file_to_state_dict
+                    )
             # The read item rank need to be assigned
             if item.rank == paddle.distributed.get_rank():
                 assert (
@@ -41,3 +41,5 @@ class Metadata:
     state_dict_metadata: Dict[str, List[LocalTensorMetadata]] = None
     storage_metadata: Dict[LocalTensorIndex, str] = None
     flat_mapping: Dict[str, Tuple[str]] = None
+    # the hash of every stored chunk, only recorded by incremental save
+    chunk_hashes: Dict[LocalTensorIndex, str] = None
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import os
 
+import numpy as np
+
 import paddle
 from paddle.distributed.communication.group import is_initialized
 from paddle.distributed.fleet.utils.log_util import logger
@@ -24,6 +27,10 @@ from .utils import (
     flatten_state_dict,
 )
 
+# the local tensors are split along the first dim into chunks of about this
+# size in incremental save, unchanged chunks are not written again
+INCREMENTAL_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def check_state_dict(state_dict, process_group):
     local_keys = list(state_dict.keys())
@@ -54,12 +61,15 @@ def merge_state_dict_metadata(global_state_dict_metadata):
     out = {}
     for state_dict in global_state_dict_metadata:
         for key, val in state_dict.items():
-            if key in out:
-                if val in out[key]:
-                    continue
-                out[key].append(val)
-            else:
-                out[key] = [val]
+            # the tensor is split into a list of chunks in incremental save
+            vals = val if isinstance(val, list) else [val]
+            for val in vals:
+                if key in out:
+                    if val in out[key]:
+                        continue
+                    out[key].append(val)
+                else:
+                    out[key] = [val]
     return out
 
 
@@ -93,19 +103,89 @@ def dedup_tensor(
     """
 
     for tensor_index, file_name in global_storage_metadata.items():
-        rank = int(file_name.split(".")[0].split("_")[0])
         if (
-            tensor_index in local_storage_metadata
-            and rank != paddle.distributed.get_rank()
+            tensor_index not in local_storage_metadata
+            or local_storage_metadata[tensor_index] == file_name
         ):
+            continue
+        # saved by another rank or referenced from the base checkpoint
+        value = local_state_dict.get(tensor_index.tensor_key)
+        if isinstance(value, dict):
+            value.pop(tensor_index.global_offset, None)
+            if len(value) == 0:
+                local_state_dict.pop(tensor_index.tensor_key)
+        elif value is not None:
             local_state_dict.pop(tensor_index.tensor_key)
 
 
+def compute_chunk_hash(array):
+    chunk_hash = hashlib.blake2b(digest_size=16)
+    chunk_hash.update(f"{array.dtype.str}{array.shape}".encode())
+    chunk_hash.update(np.ascontiguousarray(array).reshape(-1).view(np.uint8))
+    return chunk_hash.hexdigest()
+
+
+def split_chunks(local_tensor, local_shape, global_offset):
+    """
+    Split the local tensor along the first dim into chunks of about INCREMENTAL_CHUNK_SIZE bytes.
+
+    Returns:
+        List[Tuple[LocalTensorMetadata, int, int]]: the metadata of each chunk, and its begin and end row in local tensor.
+    """
+    if len(local_shape) == 0 or local_shape[0] == 0:
+        return [(LocalTensorMetadata(global_offset, local_shape), 0, 0)]
+    row_size = max(
+        1, int(np.prod(local_shape[1:])) * local_tensor.element_size()
+    )
+    step = max(1, INCREMENTAL_CHUNK_SIZE // row_size)
+    chunks = []
+    for begin in range(0, local_shape[0], step):
+        end = min(begin + step, local_shape[0])
+        chunks.append(
+            (
+                LocalTensorMetadata(
+                    (global_offset[0] + begin,) + tuple(global_offset[1:]),
+                    (end - begin,) + tuple(local_shape[1:]),
+                ),
+                begin,
+                end,
+            )
+        )
+    return chunks
+
+
+def load_base_metadata(base_path, path):
+    """
+    Load the storage metadata and chunk hashes of the base checkpoint. The file names
+    are converted to be relative to path, so references of references are resolved
+    to the file which stores the data. If the base checkpoint is saved several times,
+    the metadata with larger unique_id, which is saved later, takes precedence.
+    """
+    storage_metadata = {}
+    chunk_hashes = {}
+    metadata_files = sorted(
+        (file for file in os.listdir(base_path) if file.endswith(".metadata")),
+        key=lambda file: int(file.split(".")[0]),
+    )
+    for file in metadata_files:
+        metadata = paddle.load(os.path.join(base_path, file))
+        if metadata.chunk_hashes is None:
+            continue
+        chunk_hashes.update(metadata.chunk_hashes)
+        for tensor_index, file_name in metadata.storage_metadata.items():
+            storage_metadata[tensor_index] = os.path.relpath(
+                os.path.join(base_path, file_name), path
+            )
+    return storage_metadata, chunk_hashes
+
+
 def save_state_dict(
     state_dict,
     path,
     process_group=None,
     coordinator_rank=0,
+    incremental=False,
+    base_path=None,
 ) -> None:
     """
     Save the state_dict of model to path.
@@ -115,6 +195,8 @@ def save_state_dict(
         path(str): The directory to save state_dict.
         process_group(paddle.distributed.collective.Group): ProcessGroup to be used for cross-rank synchronization. Use the default process group which contains all cards.
         coordinator_rank(int): The rank used to save non distributed values. Rank0 is used by default.
+        incremental(bool): Whether to save in incremental mode. The local tensors are split into chunks and the hash of every chunk is recorded in the metadata. False by default.
+        base_path(str): The directory of a checkpoint saved in incremental mode. Only used when incremental is True. The chunks unchanged since the base checkpoint are not written again but referenced from it, and `load_state_dict` reads them from the base checkpoint transparently, so the base checkpoint should be kept until it is merged by `compact_state_dict`. None by default.
 
     Examples:
         .. code-block:: python
@@ -126,7 +208,9 @@ def save_state_dict(
             >>> mesh = dist.ProcessMesh([0, 1])
             >>> sharded_w1 = dist.shard_tensor(w1, mesh, [dist.Shard(0), dist.Replicate()])
             >>> state_dict = {"w1": sharded_w1}
-            >>> dist.save_state_dict(state_dict, "./checkpoint")
+            >>> dist.save_state_dict(state_dict, "./checkpoint", incremental=True)
+            >>> # only save the chunks changed since "./checkpoint"
+            >>> dist.save_state_dict(state_dict, "./checkpoint_1", incremental=True, base_path="./checkpoint")
             >>> # doctest: -SKIP
 
     """
@@ -144,6 +228,15 @@ def save_state_dict(
         if not os.path.exists(path):
             os.makedirs(path, exist_ok=True)
 
+        assert (
+            base_path is None or incremental
+        ), "base_path is only supported in incremental mode."
+        base_storage_metadata, base_chunk_hashes = (
+            load_base_metadata(base_path, path)
+            if base_path is not None
+            else ({}, {})
+        )
+
         use_dist = True if paddle.distributed.get_world_size() > 1 else False
 
         if use_dist and process_group is None and not is_initialized():
@@ -166,6 +259,7 @@ def save_state_dict(
         local_state_dict = {}
         local_state_dict_metadata = {}
         local_storage_metadata = {}
+        local_chunk_hashes = {}
         for key, val in flat_state_dict.items():
             if isinstance(val, paddle.Tensor):
                 # Case1: not initialized means this tensor is placed in another mesh which do not contain this rank
@@ -198,6 +292,41 @@ def save_state_dict(
                         else ()
                     )
                     local_tensor = val
+                if incremental:
+                    local_state_dict_metadata[key] = []
+                    local_array = local_tensor.numpy()
+                    for chunk_metadata, begin, end in split_chunks(
+                        local_tensor, local_shape, global_offset
+                    ):
+                        tensor_index = LocalTensorIndex(
+                            key, tuple(chunk_metadata.global_offset)
+                        )
+                        chunk_hash = compute_chunk_hash(
+                            local_array[begin:end]
+                            if len(local_shape) > 0
+                            else local_array
+                        )
+                        local_state_dict_metadata[key].append(chunk_metadata)
+                        local_chunk_hashes[tensor_index] = chunk_hash
+                        if (
+                            tensor_index in base_storage_metadata
+                            and base_chunk_hashes.get(tensor_index)
+                            == chunk_hash
+                        ):
+                            local_storage_metadata[
+                                tensor_index
+                            ] = base_storage_metadata[tensor_index]
+                            continue
+                        with paddle.no_grad():
+                            local_state_dict.setdefault(key, {})[
+                                tensor_index.global_offset
+                            ] = (
+                                local_tensor[begin:end]
+                                if len(local_shape) > 0
+                                else local_tensor
+                            )
+                        local_storage_metadata[tensor_index] = file_name
+                    continue
                 local_state_dict[key] = local_tensor
                 local_state_dict_metadata[key] = LocalTensorMetadata(
                     global_offset, local_shape
@@ -209,6 +338,7 @@ def save_state_dict(
         global_state_dict_metadata = []
         global_storage_metadata = []
         global_flatten_mapping = []
+        global_chunk_hashes = []
         if use_dist:
             paddle.distributed.all_gather_object(
                 global_state_dict_metadata,
@@ -221,16 +351,23 @@ def save_state_dict(
             paddle.distributed.all_gather_object(
                 global_flatten_mapping, mapping, process_group
             )
+            if incremental:
+                paddle.distributed.all_gather_object(
+                    global_chunk_hashes, local_chunk_hashes, process_group
+                )
         else:
             global_state_dict_metadata.append(local_state_dict_metadata)
             global_storage_metadata.append(local_storage_metadata)
             global_flatten_mapping.append(mapping)
+            global_chunk_hashes.append(local_chunk_hashes)
 
         metadata.state_dict_metadata = merge_state_dict_metadata(
             global_state_dict_metadata
         )
         metadata.storage_metadata = dedup_key_in_dict(global_storage_metadata)
         metadata.flat_mapping = dedup_key_in_dict(global_flatten_mapping)
+        if incremental:
+            metadata.chunk_hashes = dedup_key_in_dict(global_chunk_hashes)
         if coordinator_rank == paddle.distributed.get_rank():
             logger.debug(f"metadata:{metadata}")
             paddle.save(metadata, os.path.join(path, f"{unique_id}.metadata"))
@@ -238,4 +375,9 @@ def save_state_dict(
         dedup_tensor(
             local_state_dict, local_storage_metadata, metadata.storage_metadata
         )
-        paddle.save(local_state_dict, os.path.join(path, file_name))
+        # tensor archive lets load_state_dict read the needed slices only
+        paddle.save(
+            local_state_dict,
+            os.path.join(path, file_name),
+            use_archive_format=True,
+        )
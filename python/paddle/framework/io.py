@@ -13,13 +13,16 @@
 # limitations under the License.
 
 import collections
+import concurrent.futures
 import copyreg
+import itertools
 import os
 import pickle
+import struct
 import sys
 import threading
 import warnings
-from collections.abc import Iterable
+from collections.abc import ItemsView, Iterable, ValuesView
 
 import numpy as np
 
@@ -35,6 +38,7 @@ from paddle.base.framework import (
     _create_tensor,
     _current_expected_place,
     _dygraph_tracer,
+    convert_to_proto_type,
     in_dygraph_mode,
 )
 
@@ -62,13 +66,27 @@ def clear_async_save_task_queue():
             task.join()
 
 
-def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
+def async_save(
+    obj,
+    path,
+    protocol=4,
+    sync_other_task=False,
+    use_archive_format=False,
+    num_threads=4,
+    max_host_memory=None,
+    fsync=False,
+    **configs,
+):
     '''
     async version of paddle.save.
     Note:
         currently only support dygraph mode.
     Note:
         any argument passed through configs will be overridden by default setting.
+    Note:
+        when ``path`` is a file path, the object is written to a temporary file in the same
+        directory first and renamed to ``path`` when finished, so ``path`` never holds a partially
+        written checkpoint.
     Args:
         obj(Object) : The object to be saved.
         path(str|BytesIO) : The path/buffer of the object to be saved.
@@ -76,6 +94,15 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
         protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 5.
                                  Default: 4
         sync_other_task(bool) : Determine whether to wait other async save task to be finished before this one be put in queue.
+        use_archive_format(bool, optional): If True, save ``obj`` in the tensor archive format of ``paddle.save``.
+          Tensors are copied to host in chunks and written by a pool of threads, instead of copying the whole
+          ``obj`` to host before saving. Only supported when ``path`` is a file path. Default: False
+        num_threads(int, optional): The number of threads writing the archive, only used when ``use_archive_format``
+          is True. Default: 4
+        max_host_memory(int, optional): The upper limit in bytes of host memory used by the chunks which are not yet
+          written, only used when ``use_archive_format`` is True. ``async_save`` waits for the writing threads when
+          the limit is reached. None means no limit. Default: None
+        fsync(bool, optional): If True, flush the saved file to disk before renaming it to ``path``. Default: False
         **configs(dict, optional): compatible argument to paddle.save, but will be overridden by default setting.
     Examples:
         .. code-block:: python
@@ -91,6 +118,16 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
                 # do some calculations here
             # wait if any async_save task has not been done
             paddle.clear_async_task_queue()
+
+            # write with 8 threads and at most 1GB host memory
+            paddle.async_save(
+                layer_state_dict,
+                "emb.pdparams",
+                use_archive_format=True,
+                num_threads=8,
+                max_host_memory=1 << 30,
+                fsync=True,
+            )
     '''
     if not in_dygraph_mode():
         raise ValueError(
@@ -100,6 +137,35 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
         warnings.warn(
             "configs are not supported in async mode, will be overridden by default settings."
         )
+    if not isinstance(obj, (dict, core.eager.Tensor)):
+        # other types are currently not supported
+        raise TypeError(
+            f"currently async_save does not support this type: {type(obj)}"
+        )
+    if use_archive_format and not _is_file_path(path):
+        raise ValueError(
+            "`use_archive_format` of async_save only supports saving to file path."
+        )
+    if not isinstance(num_threads, int) or num_threads < 1:
+        raise ValueError(
+            f"`num_threads` should be a positive integer, but received {num_threads}."
+        )
+    if max_host_memory is not None and (
+        not isinstance(max_host_memory, int) or max_host_memory < 1
+    ):
+        raise ValueError(
+            f"`max_host_memory` should be None or a positive integer, but received {max_host_memory}."
+        )
+
+    if sync_other_task:
+        clear_async_save_task_queue()
+
+    if use_archive_format:
+        t = _async_save_tensor_archive(
+            obj, path, protocol, num_threads, max_host_memory, fsync
+        )
+        async_save_queue.append(t)
+        return
 
     # TODO: make this part async
     def move_state_dict_to_cpu(sd):
@@ -111,16 +177,14 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
 
     if isinstance(obj, dict):
         move_state_dict_to_cpu(obj)
-    elif isinstance(obj, core.eager.Tensor):
-        obj = obj.pin_memory() if core.is_compiled_with_cuda() else obj
     else:
-        # other types are currently not supported
-        raise TypeError(
-            f"currently async_save does not support this type: {type(obj)}"
+        obj = obj.pin_memory() if core.is_compiled_with_cuda() else obj
+    if _is_file_path(path):
+        t = threading.Thread(
+            target=_save_and_replace, args=(obj, path, protocol, fsync)
         )
-    if sync_other_task:
-        clear_async_save_task_queue()
-    t = threading.Thread(target=save, args=(obj, path, protocol))
+    else:
+        t = threading.Thread(target=save, args=(obj, path, protocol))
     t.start()
     async_save_queue.append(t)
 
@@ -338,7 +402,11 @@ def _parse_load_config(configs):
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'use_archive_format',
+        'pickle_protocol',
+    ]
 
     # input check
     for key in configs:
@@ -355,6 +423,7 @@ def _parse_save_config(configs):
 
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
+    inner_config.use_archive_format = configs.get('use_archive_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
 
     return inner_config
@@ -720,6 +789,488 @@ def _save_binary_var(obj, path):
         )
 
 
+# NOTE: [ Tensor archive format ]
+# `paddle.save(obj, path, use_archive_format=True)` writes a container that
+# `paddle.load` can map into memory instead of unpickling it as a whole:
+#
+#   [header: magic, index offset, index length]
+#   [raw tensor blob, aligned to _ARCHIVE_ALIGN bytes]
+#   ...
+#   [pickled index: nested structure with tensors replaced by
+#    _ArchiveTensorRef, and (kind, name, dtype, shape, offset, nbytes)
+#    of every blob]
+#
+# Tensors are copied to host and written one at a time, so saving never holds
+# more than one host copy of a tensor. The index is written last because the
+# blob sizes are only known after the device-to-host copy; its position is
+# patched into the header afterwards. All offsets are relative to the header.
+_ARCHIVE_MAGIC = b'PDARCHV1'
+_ARCHIVE_HEADER = struct.Struct('<8sQQ')
+_ARCHIVE_ALIGN = 64
+
+
+class _ArchiveTensorRef:
+    __slots__ = ['index']
+
+    def __init__(self, index):
+        self.index = index
+
+
+def _tensor_to_numpy(tensor):
+    if not tensor._is_initialized():
+        raise ValueError(
+            "The saved tensor is not initialized. If you used group sharded, please use save_group_sharded_model."
+        )
+    if isinstance(tensor, core.LoDTensor):
+        p = core.Place()
+        p.set_place(paddle.CPUPlace())
+        if tensor._place().is_custom_place():
+            return np.array(paddle._C_ops.npu_identity(tensor, -1)._copy(p))
+        return np.array(tensor._copy(p))
+    if tensor.is_dense() and tensor.place.is_custom_place():
+        return np.array(paddle._C_ops.npu_identity(tensor, -1).cpu())
+    return np.array(tensor.cpu())
+
+
+def _flatten_archive_obj(obj, write_blob):
+    # replace every Tensor and numpy.ndarray in `obj` with the
+    # _ArchiveTensorRef returned by `write_blob(value, kind, name)`
+    if isinstance(obj, core.SelectedRows):
+        raise NotImplementedError(
+            "`paddle.save` do not support saving 'SelectedRows'."
+        )
+    if isinstance(obj, (paddle.nn.Layer, Program)):
+        raise ValueError(
+            f"`use_archive_format` does not support saving {type(obj)} object."
+        )
+    if isinstance(obj, core.eager.Tensor):
+        return write_blob(obj, 'tensor', obj.name)
+    if isinstance(obj, core.LoDTensor):
+        return write_blob(obj, 'tensor', None)
+    if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        return write_blob(obj, 'ndarray', None)
+    if type(obj) in (dict, collections.OrderedDict):
+        return type(obj)(
+            (k, _flatten_archive_obj(v, write_blob)) for k, v in obj.items()
+        )
+    if type(obj) in (list, tuple):
+        return type(obj)(_flatten_archive_obj(v, write_blob) for v in obj)
+    return obj
+
+
+def _save_tensor_archive(obj, path, protocol):
+    if not isinstance(protocol, int):
+        raise ValueError(
+            f"The 'protocol' MUST be `int`, but received {type(protocol)}"
+        )
+
+    if protocol < 2 or protocol > 4:
+        raise ValueError(
+            f"Expected 1<'protocol'<5, but received protocol={protocol}"
+        )
+
+    entries = []
+
+    with _open_file_buffer(path, 'wb') as f:
+        start = f.tell()
+
+        def write_blob(value, kind, name):
+            array = _tensor_to_numpy(value) if kind == 'tensor' else value
+            if not array.flags.c_contiguous:
+                array = np.ascontiguousarray(array)
+            pos = f.tell() - start
+            offset = (
+                (pos + _ARCHIVE_ALIGN - 1) // _ARCHIVE_ALIGN * _ARCHIVE_ALIGN
+            )
+            f.write(b'\0' * (offset - pos))
+            if array.nbytes > 0:
+                f.write(array.reshape(-1).view(np.uint8).data)
+            entries.append(
+                {
+                    'kind': kind,
+                    'name': name,
+                    'dtype': array.dtype.str,
+                    'shape': list(array.shape),
+                    'offset': offset,
+                    'nbytes': array.nbytes,
+                }
+            )
+            return _ArchiveTensorRef(len(entries) - 1)
+
+        f.write(_ARCHIVE_HEADER.pack(_ARCHIVE_MAGIC, 0, 0))
+        structure = _flatten_archive_obj(obj, write_blob)
+        index = pickle.dumps(
+            {'structure': structure, 'entries': entries}, protocol=protocol
+        )
+        index_offset = f.tell() - start
+        f.write(index)
+        end = f.tell()
+        f.seek(start)
+        f.write(_ARCHIVE_HEADER.pack(_ARCHIVE_MAGIC, index_offset, len(index)))
+        f.seek(end)
+
+
+# NOTE: [ Parallel async save ]
+# `async_save(..., use_archive_format=True)` splits the tensors into chunks
+# of at most _ASYNC_SAVE_CHUNK_SIZE bytes. The caller copies the chunks to
+# host one by one (so the saved values are a consistent snapshot once
+# `async_save` returns) and a thread pool writes them to their final offset in
+# the archive. The host copies in flight are bounded by `max_host_memory`; the
+# caller only waits when the writers fall behind.
+_ASYNC_SAVE_CHUNK_SIZE = 64 * 1024 * 1024
+_async_save_counter = itertools.count()
+
+
+class _HostMemoryBudget:
+    def __init__(self, capacity=None):
+        self._capacity = capacity
+        self._used = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, nbytes):
+        with self._cond:
+            # a single chunk larger than the capacity is let through alone
+            while (
+                self._capacity is not None
+                and self._used > 0
+                and self._used + nbytes > self._capacity
+            ):
+                self._cond.wait()
+            self._used += nbytes
+
+    def release(self, nbytes):
+        with self._cond:
+            self._used -= nbytes
+            self._cond.notify_all()
+
+
+def _pwrite(fd, data, offset, lock):
+    view = memoryview(data).cast('B')
+    if hasattr(os, 'pwrite'):
+        while len(view) > 0:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+    else:
+        with lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            while len(view) > 0:
+                view = view[os.write(fd, view) :]
+
+
+def _fsync_dir(path):
+    # make the rename durable, directories can not be opened on Windows
+    if sys.platform == 'win32':
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _async_save_tmp_path(path):
+    return f"{path}.tmp.{os.getpid()}.{next(_async_save_counter)}"
+
+
+def _save_and_replace(obj, path, protocol, fsync):
+    tmp_path = _async_save_tmp_path(path)
+    try:
+        save(obj, tmp_path, protocol)
+        if fsync:
+            with open(tmp_path, 'rb') as f:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if fsync:
+        _fsync_dir(path)
+
+
+def _async_save_tensor_archive(
+    obj, path, protocol, num_threads, max_host_memory, fsync
+):
+    if not isinstance(protocol, int):
+        raise ValueError(
+            f"The 'protocol' MUST be `int`, but received {type(protocol)}"
+        )
+
+    if protocol < 2 or protocol > 4:
+        raise ValueError(
+            f"Expected 1<'protocol'<5, but received protocol={protocol}"
+        )
+
+    dirname = os.path.dirname(path)
+    if dirname and not os.path.exists(dirname):
+        os.makedirs(dirname, exist_ok=True)
+
+    chunk_size = _ASYNC_SAVE_CHUNK_SIZE
+    if max_host_memory is not None:
+        chunk_size = max(1, min(chunk_size, max_host_memory))
+    budget = _HostMemoryBudget(max_host_memory)
+    tmp_path = _async_save_tmp_path(path)
+    fd = os.open(
+        tmp_path,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+        0o644,
+    )
+    lock = threading.Lock()
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
+    futures = []
+    entries = []
+    end = _ARCHIVE_HEADER.size
+
+    def write_chunk(array, offset):
+        try:
+            _pwrite(fd, array, offset, lock)
+        finally:
+            budget.release(array.nbytes)
+
+    def submit_chunk(array, offset):
+        if not array.flags.c_contiguous:
+            array = np.ascontiguousarray(array)
+        array = array.reshape(-1).view(np.uint8)
+        futures.append(pool.submit(write_chunk, array, offset))
+
+    def write_blob(value, kind, name):
+        nonlocal end
+        offset = (end + _ARCHIVE_ALIGN - 1) // _ARCHIVE_ALIGN * _ARCHIVE_ALIGN
+        entry = {
+            'kind': kind,
+            'name': name,
+            'dtype': None,
+            'shape': None,
+            'offset': offset,
+            'nbytes': 0,
+        }
+        if isinstance(value, core.eager.Tensor):
+            numel = value._numel()
+            itemsize = core.size_of_dtype(convert_to_proto_type(value.dtype))
+            nbytes = numel * itemsize
+        else:
+            # numpy.ndarray and LoDTensor are copied as a whole
+            nbytes = chunk_size
+
+        if nbytes <= chunk_size:
+            budget.acquire(nbytes)
+            if kind == 'tensor':
+                array = _tensor_to_numpy(value)
+            else:
+                array = np.array(value)
+            budget.release(nbytes - array.nbytes)
+            entry['dtype'] = array.dtype.str
+            entry['shape'] = list(array.shape)
+            entry['nbytes'] = array.nbytes
+            submit_chunk(array, offset)
+        else:
+            if not value._is_initialized():
+                raise ValueError(
+                    "The saved tensor is not initialized. If you used group sharded, please use save_group_sharded_model."
+                )
+            step = max(1, chunk_size // itemsize)
+            with paddle.no_grad():
+                flat = value.reshape([-1])
+                for begin in range(0, numel, step):
+                    length = min(step, numel - begin)
+                    budget.acquire(length * itemsize)
+                    array = _tensor_to_numpy(flat[begin : begin + length])
+                    entry['dtype'] = array.dtype.str
+                    submit_chunk(array, offset + begin * itemsize)
+            entry['shape'] = list(value.shape)
+            entry['nbytes'] = nbytes
+        end = offset + entry['nbytes']
+        entries.append(entry)
+        return _ArchiveTensorRef(len(entries) - 1)
+
+    def finish(index):
+        try:
+            for future in futures:
+                future.result()
+            _pwrite(fd, index, end, lock)
+            _pwrite(
+                fd,
+                _ARCHIVE_HEADER.pack(_ARCHIVE_MAGIC, end, len(index)),
+                0,
+                lock,
+            )
+            if fsync:
+                os.fsync(fd)
+        except:
+            pool.shutdown()
+            os.close(fd)
+            os.remove(tmp_path)
+            raise
+        pool.shutdown()
+        os.close(fd)
+        os.replace(tmp_path, path)
+        if fsync:
+            _fsync_dir(path)
+
+    try:
+        structure = _flatten_archive_obj(obj, write_blob)
+        index = pickle.dumps(
+            {'structure': structure, 'entries': entries}, protocol=protocol
+        )
+    except:
+        pool.shutdown()
+        os.close(fd)
+        os.remove(tmp_path)
+        raise
+
+    t = threading.Thread(target=finish, args=(index,))
+    t.start()
+    return t
+
+
+def _is_tensor_archive(path):
+    with _open_file_buffer(path, 'rb') as f:
+        start = f.tell()
+        magic = f.read(len(_ARCHIVE_MAGIC))
+        f.seek(start)
+    return magic == _ARCHIVE_MAGIC
+
+
+class _LazyTensorDict(dict):
+    """
+    A dict loaded from tensor archive, values stored as archive blobs are
+    converted to Tensor on first access and cached afterwards.
+    """
+
+    def __init__(self, items, materialize):
+        super().__init__(items)
+        self._materialize = materialize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, _ArchiveTensorRef):
+            value = self._materialize(value)
+            super().__setitem__(key, value)
+        return value
+
+    # NOTE: overriding __iter__ stops `dict(d)`, `d.update()` and `{**d}`
+    # from copying the raw values without going through __getitem__.
+    def __iter__(self):
+        return super().__iter__()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            super().pop(key)
+            return value
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def copy(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+
+def _read_tensor_archive_index(f):
+    start = f.tell()
+    _, index_offset, index_length = _ARCHIVE_HEADER.unpack(
+        f.read(_ARCHIVE_HEADER.size)
+    )
+    f.seek(start + index_offset)
+    index = pickle.loads(f.read(index_length))
+    return index, index_offset, index_length
+
+
+def _load_tensor_archive_index(path):
+    """
+    Read the index of a tensor archive file without reading any tensor data.
+    Returns the saved structure, in which each tensor is replaced by an
+    ``_ArchiveTensorRef``, and the list of blob entries it refers to.
+    """
+    with open(path, 'rb') as f:
+        index, _, _ = _read_tensor_archive_index(f)
+    return index['structure'], index['entries']
+
+
+def _load_tensor_archive(path, return_numpy):
+    with _open_file_buffer(path, 'rb') as f:
+        start = f.tell()
+        index, index_offset, index_length = _read_tensor_archive_index(f)
+        if _is_file_path(path):
+            # copy-on-write mapping, modifying the arrays never touches the file
+            data = np.memmap(path, dtype=np.uint8, mode='c').view(np.ndarray)
+        else:
+            f.seek(start)
+            data = np.frombuffer(
+                bytearray(f.read(index_offset)), dtype=np.uint8
+            )
+            f.seek(start + index_offset + index_length)
+
+    entries = index['entries']
+
+    def load_array(ref):
+        entry = entries[ref.index]
+        array = data[entry['offset'] : entry['offset'] + entry['nbytes']]
+        return array.view(np.dtype(entry['dtype'])).reshape(entry['shape'])
+
+    def materialize(ref):
+        array = load_array(ref)
+        if return_numpy or entries[ref.index]['kind'] == 'ndarray':
+            return array
+        name = entries[ref.index]['name']
+        if in_dygraph_mode():
+            tensor = paddle.to_tensor(array)
+            if name:
+                tensor.name = name
+            return tensor
+        return _to_LodTensor(array)
+
+    def unflatten(obj):
+        if isinstance(obj, _ArchiveTensorRef):
+            return materialize(obj)
+        if type(obj) in (dict, collections.OrderedDict):
+            if return_numpy or not any(
+                isinstance(v, _ArchiveTensorRef) for v in obj.values()
+            ):
+                return type(obj)((k, unflatten(v)) for k, v in obj.items())
+            return _LazyTensorDict(
+                (
+                    (k, v if isinstance(v, _ArchiveTensorRef) else unflatten(v))
+                    for k, v in obj.items()
+                ),
+                materialize,
+            )
+        if type(obj) in (list, tuple):
+            return type(obj)(unflatten(v) for v in obj)
+        return obj
+
+    return unflatten(index['structure'])
+
+
 def save(obj, path, protocol=4, **configs):
     '''
     Save an object to the specified path.
@@ -746,6 +1297,9 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          use_archive_format(bool): If True, save the object as a tensor archive, which stores the raw data of every Tensor
+          in an aligned blob after a small pickled index. ``paddle.load`` maps the archive into memory and only converts a
+          Tensor when it is accessed, which reduces peak host memory when loading large checkpoints. Default: False
 
     Returns:
         None
@@ -877,6 +1431,16 @@ def save(obj, path, protocol=4, **configs):
             f"Type of `use_binary_format` should be bool, but received {type(config.use_binary_format)}."
         )
 
+    if not isinstance(config.use_archive_format, bool):
+        raise TypeError(
+            f"Type of `use_archive_format` should be bool, but received {type(config.use_archive_format)}."
+        )
+
+    if config.use_binary_format and config.use_archive_format:
+        raise ValueError(
+            "`use_binary_format` and `use_archive_format` can not be set to True at the same time."
+        )
+
     if config.use_binary_format:
         _save_binary_var(obj, path)
     else:
@@ -887,7 +1451,10 @@ def save(obj, path, protocol=4, **configs):
                 "'pickle_protocol' is a deprecated argument. Please use 'protocol' instead."
             )
 
-        if isinstance(obj, Program):
+        if config.use_archive_format:
+            _save_tensor_archive(obj, path, protocol)
+
+        elif isinstance(obj, Program):
             obj.desc.flush()
             with _open_file_buffer(path, "wb") as f:
                 f.write(obj.desc.serialize_to_string())
@@ -1002,6 +1569,8 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            If ``path`` is saved with ``use_archive_format=True``, the returned numpy.ndarray is a copy-on-write view of the
+            memory mapped file, and the Tensors in returned dict are created on first access.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1124,6 +1693,9 @@ def load(path, **configs):
 
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
+        if _is_tensor_archive(path):
+            return _load_tensor_archive(path, config.return_numpy)
+
         exception_type = pickle.UnpicklingError
         try:
             with _open_file_buffer(path, 'rb') as f:
@@ -857,17 +857,10 @@ class DynamicGraphAdapter:
                 self.model._optimizer.minimize(final_loss)
                 self.model.network.clear_gradients()
 
-        metrics = []
-        for metric in self.model._metrics:
-            metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
-
-        return (
-            ([to_numpy(l) for l in losses], metrics)
-            if len(metrics) > 0
-            else [to_numpy(l) for l in losses]
-        )
+        metrics = self._update_metrics(outputs, labels)
+        losses = self._fetch(losses)
+
+        return (losses, metrics) if len(metrics) > 0 else losses
 
     def eval_batch(self, inputs, labels=None):
         self.model.network.eval()
@@ -917,20 +910,36 @@ class DynamicGraphAdapter:
                     self._merge_count[self.mode + '_total'] += samples
                     self._merge_count[self.mode + '_batch'] = samples
 
-        metrics = []
-        for metric in self.model._metrics:
-            # cut off padding value.
-            metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
+        # cut off padding value.
+        metrics = self._update_metrics(outputs, labels)
 
         if self.model._loss and len(metrics):
-            return [to_numpy(l) for l in losses], metrics
+            return self._fetch(losses), metrics
         elif self.model._loss:
-            return [to_numpy(l) for l in losses]
+            return self._fetch(losses)
         else:
             return metrics
 
+    def _keep_on_device(self):
+        return self.model._metrics_sync_interval > 1
+
+    def _fetch(self, tensors):
+        # NOTE: Fetching the tensors as numpy arrays waits for the device, so
+        # they are kept on the device if the metrics are synchronized
+        # periodically.
+        if self._keep_on_device():
+            return [t.detach() for t in tensors]
+        return [to_numpy(t) for t in tensors]
+
+    def _update_metrics(self, outputs, labels):
+        metrics = []
+        for metric in self.model._metrics:
+            metric_outs = to_list(metric.compute(*(to_list(outputs) + labels)))
+            if not (self._keep_on_device() and metric._support_tensor_update):
+                metric_outs = [to_numpy(m) for m in metric_outs]
+            metrics.append(metric.update(*metric_outs))
+        return metrics
+
     def predict_batch(self, inputs):
         self.model.network.eval()
         self.mode = 'test'
@@ -1172,6 +1181,7 @@ class Model:
         self._input_info = None
         self._is_shape_inferred = False
         self._test_dataloader = None
+        self._metrics_sync_interval = 1
         self.stop_training = False
 
         if not in_dynamic_mode():
@@ -1668,7 +1678,12 @@ class Model:
             self._adapter._amp_configs[key] = amp_configs[key]
 
     def prepare(
-        self, optimizer=None, loss=None, metrics=None, amp_configs=None
+        self,
+        optimizer=None,
+        loss=None,
+        metrics=None,
+        amp_configs=None,
+        metrics_sync_interval=1,
     ):
         """
 
@@ -1700,11 +1715,25 @@ class Model:
                 for details. For convenience, 'amp_configs' could be set to
                 'O1' or 'O2' if no more parameters are needed. 'amp_configs'
                 could be None in float32 training. Default: None.
+            metrics_sync_interval (int, optional): The interval of steps to
+                fetch the losses and metrics to the host in `fit` and
+                `evaluate`. If it is greater than 1 in dynamic graph mode,
+                the built-in metrics accumulate their states on the device,
+                `train_batch` and `eval_batch` return the losses as Tensors,
+                and the logs of the steps between the intervals keep the
+                previous values, so that the device is not waited for every
+                step. Default: 1.
 
         Returns:
             None
 
         """
+        if metrics_sync_interval < 1:
+            raise ValueError(
+                "'metrics_sync_interval' should be at least 1, but received "
+                f"{metrics_sync_interval}."
+            )
+        self._metrics_sync_interval = metrics_sync_interval
         self._place = _get_device()
         if isinstance(self._place, base.CUDAPlace):
             global _parallel_context_initialized
@@ -2292,6 +2321,7 @@ class Model:
         logs={},
     ):
         outputs = []
+        outs = None
         for step, data in enumerate(data_loader):
             # Data might come from different types of data_loader and have
             # different format, as following:
@@ -2325,22 +2355,9 @@ class Model:
                     )
 
                 outs = getattr(self, mode + '_batch')(*_inputs)
-
-                if self._metrics and self._loss:
-                    metrics = [[float(l) for l in outs[0]]]
-                elif self._loss:
-                    metrics = [[float(l) for l in outs]]
-                else:
-                    metrics = []
-
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
-
-                assert len(self._metrics_name()) == len(metrics)
-                for k, v in zip(self._metrics_name(), metrics):
-                    logs[k] = v
+                if (step + 1) % self._metrics_sync_interval == 0:
+                    self._update_logs(outs, logs)
+                    outs = None
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2367,6 +2384,9 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+        # The logs of the last steps are not synchronized yet
+        if mode != 'predict' and outs is not None:
+            self._update_logs(outs, logs)
         self._reset_metrics()
 
         if mode == 'predict':
@@ -2476,6 +2496,23 @@ class Model:
 
         return out_specs
 
+    def _update_logs(self, outs, logs):
+        if self._metrics and self._loss:
+            metrics = [[float(l) for l in outs[0]]]
+        elif self._loss:
+            metrics = [[float(l) for l in outs]]
+        else:
+            metrics = []
+
+        # metrics
+        for metric in self._metrics:
+            res = metric.accumulate()
+            metrics.extend(to_list(res))
+
+        assert len(self._metrics_name()) == len(metrics)
+        for k, v in zip(self._metrics_name(), metrics):
+            logs[k] = v
+
     def _reset_metrics(self):
         for metric in self._metrics:
             metric.reset()
@@ -16,6 +16,7 @@
 
 from .dataloader import (
     BatchSampler,
+    CachedDataset,
     ChainDataset,
     ComposeDataset,
     ConcatDataset,
@@ -52,4 +53,5 @@ __all__ = [
     'Subset',
     'SubsetRandomSampler',
     'ConcatDataset',
+    'CachedDataset',
 ]
@@ -17,6 +17,7 @@ from .batch_sampler import (  # noqa: F401
     DistributedBatchSampler,
 )
 from .dataset import (  # noqa: F401
+    CachedDataset,
     ChainDataset,
     ComposeDataset,
     ConcatDataset,
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import math
 
 import numpy as np
@@ -98,6 +99,11 @@ class BatchSampler(Sampler):
             [53, 17, 22, 86, 52, 3, 92, 33]
     """
 
+    # batch number to skip in the next iteration and batch number
+    # generated in the current iteration, see state_dict
+    _num_skip_batches = 0
+    _num_yielded_batches = 0
+
     def __init__(
         self,
         dataset=None,
@@ -139,13 +145,25 @@ class BatchSampler(Sampler):
         self.drop_last = drop_last
 
     def __iter__(self):
+        num_skip_batches = self._num_skip_batches
+        self._num_skip_batches = 0
+        self._num_yielded_batches = num_skip_batches
+
+        sampler_iter = iter(self.sampler)
+        if num_skip_batches > 0:
+            # only sample indices are skipped, no data is touched
+            sampler_iter = itertools.islice(
+                sampler_iter, num_skip_batches * self.batch_size, None
+            )
         batch_indices = []
-        for idx in self.sampler:
+        for idx in sampler_iter:
             batch_indices.append(idx)
             if len(batch_indices) == self.batch_size:
+                self._num_yielded_batches += 1
                 yield batch_indices
                 batch_indices = []
         if not self.drop_last and len(batch_indices) > 0:
+            self._num_yielded_batches += 1
             yield batch_indices
 
     def __len__(self):
@@ -153,6 +171,51 @@ class BatchSampler(Sampler):
         num_samples += int(not self.drop_last) * (self.batch_size - 1)
         return num_samples // self.batch_size
 
+    def state_dict(self):
+        """
+        Get the state of the batch sampler, which contains the state of
+        :attr:`sampler` and the batch number generated in the current
+        iteration.
+
+        Returns:
+            dict: state of the batch sampler.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> from paddle.io import BatchSampler, RandomSampler
+
+                >>> sampler = RandomSampler(range(100))
+                >>> bs = BatchSampler(sampler=sampler, batch_size=8)
+                >>> bs_iter = iter(bs)
+                >>> first = next(bs_iter)
+                >>> state = bs.state_dict()
+                >>> second = next(bs_iter)
+
+                >>> # restore and skip the first batch
+                >>> bs.load_state_dict(state)
+                >>> print(next(iter(bs)) == second)
+                True
+        """
+        return {
+            'sampler': self.sampler.state_dict(),
+            'num_consumed_batches': self._num_yielded_batches,
+        }
+
+    def load_state_dict(self, state_dict):
+        """
+        Restore the batch sampler state got from :code:`state_dict`, the
+        next iteration generates the same batches as the iteration the
+        state was got from, and skips the consumed batches directly.
+
+        Args:
+            state_dict(dict): state of the batch sampler.
+        """
+        if 'sampler' in state_dict:
+            self.sampler.load_state_dict(state_dict['sampler'])
+        self._num_skip_batches = state_dict.get('num_consumed_batches', 0)
+
 
 class _InfiniteIterableSampler:
     def __init__(self, dataset, batch_size=1):
@@ -266,6 +329,9 @@ class DistributedBatchSampler(BatchSampler):
 
         self.drop_last = drop_last
         self.epoch = 0
+        # epoch used by the current iteration, self.epoch is increased
+        # once an iteration starts if shuffle is True
+        self._iter_epoch = 0
         self.num_samples = int(math.ceil(len(self.dataset) * 1.0 / self.nranks))
         self.total_size = self.num_samples * self.nranks
 
@@ -282,6 +348,7 @@ class DistributedBatchSampler(BatchSampler):
             ]
 
         assert len(indices) == self.total_size
+        self._iter_epoch = self.epoch
         if self.shuffle:
             np.random.RandomState(self.epoch).shuffle(indices)
             self.epoch += 1
@@ -314,15 +381,20 @@ class DistributedBatchSampler(BatchSampler):
             indices = _get_indices_by_batch_size(indices)
 
         assert len(indices) == self.num_samples
-        _sample_iter = iter(indices)
+        num_skip_batches = self._num_skip_batches
+        self._num_skip_batches = 0
+        self._num_yielded_batches = num_skip_batches
+        _sample_iter = iter(indices[num_skip_batches * self.batch_size :])
 
         batch_indices = []
         for idx in _sample_iter:
             batch_indices.append(idx)
             if len(batch_indices) == self.batch_size:
+                self._num_yielded_batches += 1
                 yield batch_indices
                 batch_indices = []
         if not self.drop_last and len(batch_indices) > 0:
+            self._num_yielded_batches += 1
             yield batch_indices
 
     def __len__(self):
@@ -330,6 +402,31 @@ class DistributedBatchSampler(BatchSampler):
         num_samples += int(not self.drop_last) * (self.batch_size - 1)
         return num_samples // self.batch_size
 
+    def state_dict(self):
+        """
+        Get the state of the batch sampler, which contains the epoch of
+        the current iteration and the batch number generated in it.
+
+        Returns:
+            dict: state of the batch sampler.
+        """
+        return {
+            'epoch': self._iter_epoch,
+            'num_consumed_batches': self._num_yielded_batches,
+        }
+
+    def load_state_dict(self, state_dict):
+        """
+        Restore the batch sampler state got from :code:`state_dict`, the
+        next iteration uses the saved epoch and skips the consumed batches.
+
+        Args:
+            state_dict(dict): state of the batch sampler.
+        """
+        if 'epoch' in state_dict:
+            self.epoch = state_dict['epoch']
+        self._num_skip_batches = state_dict.get('num_consumed_batches', 0)
+
     def set_epoch(self, epoch):
         """
         Sets the epoch number. When :attr:`shuffle=True`, this number is used
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import numbers
+import os
 from collections.abc import Mapping, Sequence
 
 import numpy as np
@@ -109,3 +111,129 @@ def default_convert_fn(batch):
         return [default_convert_fn(d) for d in batch]
     else:
         return batch
+
+
+# max number of cached batch buffers in _BufferedCollateFn, buffers of
+# the least recently used signature are released when exceeded
+_MAX_COLLATE_BUFFERS = 64
+
+
+def _use_collate_buffer():
+    return os.environ.get('FLAGS_reuse_collate_buffer', False) in [
+        1,
+        '1',
+        True,
+        'True',
+        'true',
+    ]
+
+
+class _BufferedCollateFn:
+    """
+    Batch collating function which behaves as :code:`default_collate_fn`,
+    but stacks numpy array fields into an output buffer preallocated by
+    (field path, shape, dtype) signature, each sample is copied into the
+    buffer in place.
+
+    If :attr:`reuse_buffer` is True, the buffer of a signature is reused
+    by following batches, this is only safe when the output batch is
+    copied before next batch is collated, e.g. in single-process mode or
+    when the output is copied into shared memory in workers.
+
+    Args:
+        reuse_buffer(bool): whether to reuse output buffers across batches.
+    """
+
+    def __init__(self, reuse_buffer=True):
+        self._reuse_buffer = reuse_buffer
+        self._buffers = collections.OrderedDict()
+        self.reset_stats()
+
+    def __call__(self, batch):
+        self._stats['batches'] += 1
+        return self._collate(batch, ())
+
+    def _collate(self, batch, path):
+        sample = batch[0]
+        if isinstance(sample, np.ndarray):
+            return self._stack(batch, path)
+        elif isinstance(sample, (paddle.Tensor, core.eager.Tensor)):
+            return paddle.stack(batch, axis=0)
+        elif isinstance(sample, numbers.Number):
+            batch = np.array(batch)
+            return batch
+        elif isinstance(sample, (str, bytes)):
+            return batch
+        elif isinstance(sample, Mapping):
+            return {
+                key: self._collate([d[key] for d in batch], path + (key,))
+                for key in sample
+            }
+        elif isinstance(sample, Sequence):
+            sample_fields_num = len(sample)
+            if not all(
+                len(sample) == sample_fields_num for sample in iter(batch)
+            ):
+                raise RuntimeError(
+                    "fields number not same among samples in a batch"
+                )
+            return [
+                self._collate(fields, path + (i,))
+                for i, fields in enumerate(zip(*batch))
+            ]
+
+        raise TypeError(
+            "batch data con only contains: tensor, numpy.ndarray, "
+            f"dict, list, number, but got {type(sample)}"
+        )
+
+    def _get_buffer(self, path, shape, dtype):
+        key = (path, shape, dtype.str)
+        if self._reuse_buffer and key in self._buffers:
+            self._buffers.move_to_end(key)
+            self._stats['reuses'] += 1
+            return self._buffers[key]
+
+        buffer = np.empty(shape, dtype=dtype)
+        self._stats['allocations'] += 1
+        if self._reuse_buffer:
+            self._buffers[key] = buffer
+            if len(self._buffers) > _MAX_COLLATE_BUFFERS:
+                self._buffers.popitem(last=False)
+        return buffer
+
+    def _stack(self, batch, path):
+        sample = batch[0]
+        if any(
+            s.shape != sample.shape or s.dtype != sample.dtype for s in batch
+        ):
+            # let numpy report shape mismatch or promote dtypes
+            self._stats['allocations'] += 1
+            self._stats['copies'] += len(batch)
+            return np.stack(batch, axis=0)
+
+        buffer = self._get_buffer(
+            path, (len(batch),) + sample.shape, sample.dtype
+        )
+        for i, s in enumerate(batch):
+            buffer[i] = s
+        self._stats['copies'] += len(batch)
+        self._stats['bytes_copied'] += buffer.nbytes
+        return buffer
+
+    def stats(self):
+        """
+        Get collating statistics, a dict contains batch number, output
+        buffer allocation and reuse number, sample copy number and bytes
+        copied into output buffers.
+        """
+        return dict(self._stats)
+
+    def reset_stats(self):
+        self._stats = {
+            'batches': 0,
+            'allocations': 0,
+            'reuses': 0,
+            'copies': 0,
+            'bytes_copied': 0,
+        }
@@ -36,9 +36,22 @@ from ..multiprocess_utils import (
     _set_SIGCHLD_handler,
 )
 from .batch_sampler import _InfiniteIterableSampler
-from .collate import default_collate_fn, default_convert_fn
+from .collate import (
+    _BufferedCollateFn,
+    _use_collate_buffer,
+    default_collate_fn,
+    default_convert_fn,
+)
 from .flat import _flatten_batch, _restore_batch
+from .sampler import Sampler
+from .shm_ring import (
+    _SharedMemoryRing,
+    _shm_ring_slot_size,
+    _ShmRingBatch,
+    _use_shm_ring,
+)
 from .worker import (
+    _CollateStats,
     _DatasetKind,
     _IterableDatasetStopIteration,
     _ResumeIteration,
@@ -64,6 +77,26 @@ from .worker import (
 _loader = None
 
 
+def _defining_class(obj, name):
+    for cls in type(obj).__mro__:
+        if name in vars(cls):
+            return cls
+    return None
+
+
+def _can_resume_sampler(batch_sampler):
+    """
+    Whether the batch sampler skips the consumed batches by itself after
+    `load_state_dict`, which holds only if its `__iter__` is the one the
+    `load_state_dict` is written for.
+    """
+    state_cls = _defining_class(batch_sampler, 'load_state_dict')
+    iter_cls = _defining_class(batch_sampler, '__iter__')
+    if state_cls in (None, Sampler) or iter_cls is None:
+        return False
+    return issubclass(state_cls, iter_cls)
+
+
 def _clear_loader():
     global _loader
     if _loader is not None:
@@ -104,12 +137,42 @@ class _DataLoaderIterBase:
         self._worker_init_fn = loader.worker_init_fn
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
-
-        self._sampler_iter = iter(self._index_sampler)
+        self._in_order = loader.in_order
+
+        # batch number consumed in current epoch and batch number consumed
+        # from each worker for IterableDataset, see state_dict
+        self._num_consumed_batches = 0
+        self._worker_consumed_batches = [0] * max(self._num_workers, 1)
+        # batch number consumed in this iterator, not counting the
+        # batches skipped by resuming from a state_dict
+        self._num_iter_consumed_batches = 0
+        # batch number skipped by resuming from a state_dict
+        self._num_resumed_batches = 0
+        self._resume_state = loader._resume_state
+        loader._resume_state = None
+        if self._resume_state is not None:
+            self._sampler_iter = self._resume_sampler_iter(self._resume_state)
+        else:
+            self._sampler_iter = iter(self._index_sampler)
         if self._auto_collate_batch:
-            self._collate_fn = loader.collate_fn or default_collate_fn
+            if loader.collate_fn is not None:
+                self._collate_fn = loader.collate_fn
+            elif _use_collate_buffer():
+                # NOTE: output buffers can only be reused when batches are
+                # copied before next batch is collated, which is true in
+                # single-process mode and in shared memory mode of workers,
+                # in other cases, batches are pickled asynchronously by the
+                # feeder thread of multiprocessing.Queue
+                self._collate_fn = _BufferedCollateFn(
+                    reuse_buffer=self._num_workers == 0
+                    or self._use_shared_memory
+                )
+            else:
+                self._collate_fn = default_collate_fn
         else:
             self._collate_fn = loader.collate_fn or default_convert_fn
+        # collating statistics sent back from workers, see collate_stats
+        self._worker_collate_stats = {}
 
         # LoDTensorBlockingQueue instance for create_py_reader and a thread
         # to put mini-batch data to self._blocking_queue, mini-batch data
@@ -136,6 +199,100 @@ class _DataLoaderIterBase:
     def __len__(self):
         return len(self._batch_sampler)
 
+    def _resume_sampler_iter(self, state_dict):
+        num_consumed_batches = state_dict.get('num_consumed_batches', 0)
+        self._num_consumed_batches = num_consumed_batches
+        self._num_resumed_batches = num_consumed_batches
+
+        if self._dataset_kind == _DatasetKind.ITER:
+            # IterableDataset is resumed by skipping consumed samples in
+            # each worker, see _worker_num_skip_samples
+            worker_consumed_batches = state_dict.get('worker_consumed_batches')
+            if worker_consumed_batches is not None:
+                if len(worker_consumed_batches) != len(
+                    self._worker_consumed_batches
+                ):
+                    raise ValueError(
+                        "DataLoader state_dict of IterableDataset is saved "
+                        f"with {len(worker_consumed_batches)} workers, but "
+                        f"got num_workers={self._num_workers}"
+                    )
+                self._worker_consumed_batches = list(worker_consumed_batches)
+            return iter(self._index_sampler)
+
+        if self._auto_collate_batch and _can_resume_sampler(
+            self._batch_sampler
+        ):
+            sampler_state = dict(state_dict.get('sampler', {}))
+            sampler_state['num_consumed_batches'] = num_consumed_batches
+            self._batch_sampler.load_state_dict(sampler_state)
+            return iter(self._index_sampler)
+
+        # only indices are skipped, no data is touched
+        return itertools.islice(
+            iter(self._index_sampler), num_consumed_batches, None
+        )
+
+    def _worker_num_skip_samples(self, worker_id):
+        if self._dataset_kind != _DatasetKind.ITER:
+            return 0
+        batch_size = self._index_sampler.batch_size
+        return self._worker_consumed_batches[worker_id] * batch_size
+
+    def _on_consumed_batches(self, worker_ids):
+        self._num_consumed_batches += len(worker_ids)
+        self._num_iter_consumed_batches += len(worker_ids)
+        for worker_id in worker_ids:
+            if worker_id is not None:
+                self._worker_consumed_batches[worker_id] += 1
+
+    def state_dict(self):
+        """
+        Get the iteration state of the DataLoader, which contains the
+        batch number consumed in current epoch, the state of batch sampler
+        and the batch number consumed from each worker for IterableDataset.
+        Load it by :code:`paddle.io.DataLoader.load_state_dict` to resume
+        iteration from the next unconsumed batch.
+
+        Returns:
+            dict: iteration state of the DataLoader.
+        """
+        if self._num_iter_consumed_batches == 0 and self._resume_state:
+            # sampler may not start generating indices of this epoch yet
+            return dict(self._resume_state)
+
+        state = {'num_consumed_batches': self._num_consumed_batches}
+        if self._dataset_kind == _DatasetKind.ITER:
+            state['worker_consumed_batches'] = list(
+                self._worker_consumed_batches
+            )
+        elif (
+            self._auto_collate_batch
+            and self._num_iter_consumed_batches > 0
+            and _can_resume_sampler(self._batch_sampler)
+        ):
+            state['sampler'] = self._batch_sampler.state_dict()
+        return state
+
+    def collate_stats(self):
+        """
+        Get the statistics of the buffer-reusing batch collating enabled by
+        :code:`FLAGS_reuse_collate_buffer`, which contains batch number,
+        output buffer allocation and reuse number, sample copy number and
+        bytes copied into output buffers. In multi-process mode, counters
+        of all workers are summed up.
+
+        Returns:
+            dict|None: collating statistics of this iterator, None if the
+            buffer-reusing batch collating is not used.
+        """
+        if not isinstance(self._collate_fn, _BufferedCollateFn):
+            return None
+        stats = self._collate_fn.stats()
+        for key, value in list(self._worker_collate_stats.items()):
+            stats[key] += value
+        return stats
+
     def _exit_thread_expectedly(self):
         self._thread_done_event.set()
         if self._blocking_queue:
@@ -163,6 +320,8 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
             self._collate_fn,
             self._drop_last,
         )
+        if self._dataset_kind == _DatasetKind.ITER:
+            self._dataset_fetcher.skip(self._worker_num_skip_samples(0))
 
         # NOTE: _structure_infos used to record the data structure of
         # batch to restore batch structure after reading Tensor
@@ -309,6 +468,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+            self._on_consumed_batches([0] * len(self._places))
             benchmark().after_reader()
 
             return data
@@ -378,6 +538,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._batches_outstanding = 0
         self._task_infos = {}
         self._structure_infos = []
+        # (data index, worker id) of each batch in the same order as
+        # _structure_infos
+        self._batch_infos = []
 
         # indices outstand as _outstanding_capacity at first, and
         # blocking_queue capacity is also _outstanding_capacity.
@@ -389,6 +552,20 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             self._num_workers, len(self._places)
         )
 
+        # NOTE: [ out of order ] if in_order is False, all workers get
+        # indices from a shared task queue, so that an idle worker takes
+        # the next indices instead of waiting behind a slow batch of
+        # another worker, and batches are output once received. Only
+        # batches whose data index is less than _rcvd_idx + _reorder_window
+        # can be output, _rcvd_idx is the first batch not yet output, which
+        # bounds how far batches are reordered. Batches consumed out of
+        # order are tracked by _consumed_idxs to compute the contiguous
+        # consumed prefix for state_dict
+        self._reorder_window = self._outstanding_capacity
+        self._output_idxs = set()
+        self._consumed_idxs = set()
+        self._consumed_prefix = 0
+
         # see _try_put_indices
         self._thread_lock = threading.Lock()
 
@@ -417,6 +594,20 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             (self._worker_shm_buffer_size) * 2 * self._num_workers
         )
 
+        # NOTE: [ shared memory ring ] if FLAGS_use_shm_ring is set, each
+        # worker writes batches into its own preallocated shared memory
+        # ring and only sends (offset, shape, dtype) descriptors through
+        # _data_queue, see shm_ring.py. Rings should be created before
+        # workers start, slot number covers the outstanding batches of
+        # one worker
+        self._shm_rings = None
+        if _use_shm_ring():
+            num_slots = self._outstanding_capacity // self._num_workers + 1
+            self._shm_rings = [
+                _SharedMemoryRing(num_slots, _shm_ring_slot_size())
+                for _ in range(self._num_workers)
+            ]
+
         # init workers and indices queues and put 2 indices in each indices queue
         self._init_workers()
         for _ in range(self._outstanding_capacity):
@@ -434,6 +625,12 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._indices_queues = []
         self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
 
+        # see [ out of order ], all workers share one indices queue
+        task_queue = None
+        if not self._in_order:
+            task_queue = multiprocessing.Queue()
+            task_queue.cancel_join_thread()
+
         # create data_queue for workers
         self._data_queue = multiprocessing.Queue()
 
@@ -443,8 +640,11 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._thread_done_event = threading.Event()
 
         for i in range(self._num_workers):
-            indices_queue = multiprocessing.Queue()
-            indices_queue.cancel_join_thread()
+            if task_queue is not None:
+                indices_queue = task_queue
+            else:
+                indices_queue = multiprocessing.Queue()
+                indices_queue.cancel_join_thread()
             self._indices_queues.append(indices_queue)
             worker = multiprocessing.Process(
                 target=_worker_loop,
@@ -463,6 +663,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._use_shared_memory,
                     self._base_seed,
                     self._worker_shm_buffer_size,
+                    self._shm_rings[i] if self._shm_rings else None,
+                    self._worker_num_skip_samples(i),
                 ),
             )
             worker.daemon = True
@@ -545,11 +747,22 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     data = self._reader.read_next()
 
         # 3. reset all states
+        self._release_cached_ring_batches()
         self._send_idx = 0
         self._rcvd_idx = 0
         self._batches_outstanding = 0
         self._task_infos = {}
         self._structure_infos = []
+        self._batch_infos = []
+        self._output_idxs = set()
+        self._consumed_idxs = set()
+        self._consumed_prefix = 0
+        self._num_consumed_batches = 0
+        self._num_iter_consumed_batches = 0
+        self._num_resumed_batches = 0
+        self._resume_state = None
+        self._worker_consumed_batches = [0] * self._num_workers
+        self._worker_collate_stats = {}
 
         # set all worker status available
         self._worker_status = [True] * self._num_workers
@@ -560,6 +773,36 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
+    def _read_ring_batch(self, ring_batch):
+        # copy fields out of the ring slot and give the slot back to
+        # the worker, LoDTensor.set copies data, so the slot can be
+        # reused as soon as the copy finished
+        ring = self._shm_rings[ring_batch.worker_id]
+        try:
+            tensors = []
+            for arr in ring.read(ring_batch):
+                tmp = core.LoDTensor()
+                tmp.set(arr, core.CPUPlace())
+                tensors.append(tmp)
+            return tensors
+        finally:
+            ring.release(ring_batch)
+
+    def _release_cached_ring_batches(self):
+        # out of order batches cached in _task_infos still hold ring
+        # slots, release them when the cache is discarded
+        if self._shm_rings is None:
+            return
+        for info in self._task_infos.values():
+            if len(info) == 3 and isinstance(info[1], _ShmRingBatch):
+                self._shm_rings[info[1].worker_id].release(info[1])
+
+    def _close_shm_rings(self):
+        if self._shm_rings is not None:
+            for ring in self._shm_rings:
+                ring.close(unlink=True)
+            self._shm_rings = None
+
     def _shutdown_worker(self, worker_id, shutdown=False):
         if self._worker_status[worker_id] or (
             self._persistent_workers and shutdown
@@ -586,6 +829,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     for q in self._indices_queues:
                         q.cancel_join_thread()
                         q.close()
+                self._close_shm_rings()
             finally:
                 core._erase_process_pids(id(self))
                 self._shutdown = True
@@ -612,7 +856,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     try:
                         # pack as LoDTensorArray
                         array = core.LoDTensorArray()
-                        if self._use_shared_memory:
+                        if isinstance(batch, _ShmRingBatch):
+                            for tensor in self._read_ring_batch(batch):
+                                array.append(tensor)
+                        elif self._use_shared_memory:
                             for tensor in batch:
                                 array.append(tensor)
                         else:
@@ -635,7 +882,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         self._exit_thread_unexpectedly()
                         raise e
                     finally:
-                        self._rcvd_idx += 1
+                        if self._in_order:
+                            self._rcvd_idx += 1
 
     def _get_data(self):
         while not self._thread_done_event.is_set():
@@ -672,12 +920,18 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         if self._batches_outstanding < len(self._places):
                             return None
 
-            if (
+            if not self._in_order:
+                idx = self._next_cached_idx()
+                if idx is not None:
+                    info = self._task_infos[idx]
+                    return self._output_out_of_order(idx, info[1], info[2])
+            elif (
                 self._rcvd_idx in self._task_infos
                 and len(self._task_infos[self._rcvd_idx]) == 3
             ):
                 info = self._task_infos.pop(self._rcvd_idx)
                 self._structure_infos.append(info[2])
+                self._batch_infos.append((self._rcvd_idx, info[0]))
                 return info[1]
 
             try:
@@ -738,6 +992,13 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._try_put_indices()
                     continue
 
+                if isinstance(data, _CollateStats):
+                    for key, value in data.stats.items():
+                        self._worker_collate_stats[key] = (
+                            self._worker_collate_stats.get(key, 0) + value
+                        )
+                    continue
+
                 idx, batch, structure = data
 
                 if (
@@ -751,15 +1012,42 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._exit_thread_unexpectedly()
                     batch.reraise()
 
+                if not self._in_order:
+                    if idx < self._rcvd_idx + self._reorder_window:
+                        return self._output_out_of_order(idx, batch, structure)
+                    self._task_infos[idx] += (batch, structure)
+                    continue
+
                 if idx == self._rcvd_idx:
-                    if idx in self._task_infos:
-                        del self._task_infos[idx]
+                    info = self._task_infos.pop(idx, None)
                     self._structure_infos.append(structure)
+                    self._batch_infos.append((idx, info[0] if info else None))
                     return batch
                 else:
                     self._task_infos[idx] += (batch, structure)
                     continue
 
+    def _next_cached_idx(self):
+        # the smallest cached data index inside the reorder window
+        cached_idxs = [
+            idx for idx, info in self._task_infos.items() if len(info) == 3
+        ]
+        if cached_idxs:
+            idx = min(cached_idxs)
+            if idx < self._rcvd_idx + self._reorder_window:
+                return idx
+        return None
+
+    def _output_out_of_order(self, idx, batch, structure):
+        info = self._task_infos.pop(idx, None)
+        self._structure_infos.append(structure)
+        self._batch_infos.append((idx, info[0] if info else None))
+        self._output_idxs.add(idx)
+        while self._rcvd_idx in self._output_idxs:
+            self._output_idxs.remove(self._rcvd_idx)
+            self._rcvd_idx += 1
+        return batch
+
     def _try_put_indices(self):
         assert (
             self._batches_outstanding <= self._outstanding_capacity
@@ -786,11 +1074,25 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             else:
                 return
 
+            # indices are put into the shared task queue in out of order
+            # mode, the worker to get them is unknown
             self._indices_queues[worker_idx].put((self._send_idx, indices))
-            self._task_infos[self._send_idx] = (worker_idx,)
+            self._task_infos[self._send_idx] = (
+                worker_idx if self._in_order else None,
+            )
             self._batches_outstanding += 1
             self._send_idx += 1
 
+    def state_dict(self):
+        state = super().state_dict()
+        if not self._in_order and self._num_iter_consumed_batches > 0:
+            # batches consumed out of order after the first unconsumed
+            # batch will be generated again after resuming
+            state['num_consumed_batches'] = (
+                self._num_resumed_batches + self._consumed_prefix
+            )
+        return state
+
     def __del__(self):
         self._try_shutdown_all()
 
@@ -856,6 +1158,18 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 trace_event.end()
 
     def _on_output_batch(self):
+        batch_infos = [
+            self._batch_infos.pop(0)
+            for _ in range(len(self._places))
+            if self._batch_infos
+        ]
+        self._on_consumed_batches([worker_id for _, worker_id in batch_infos])
+        if not self._in_order:
+            for idx, _ in batch_infos:
+                self._consumed_idxs.add(idx)
+            while self._consumed_prefix in self._consumed_idxs:
+                self._consumed_idxs.remove(self._consumed_prefix)
+                self._consumed_prefix += 1
         for _ in range(len(self._places)):
             self._batches_outstanding -= 1
             self._try_put_indices()
@@ -13,13 +13,25 @@
 # limitations under the License.
 
 import bisect
+import collections
 import math
+import os
+import pickle
+import struct
+import sys
+import time
 import warnings
+from collections.abc import Mapping, Sequence
 from typing import Iterable
 
+import numpy as np
+
 import paddle
 
 from ... import framework
+from ...framework import core
+from .flat import _flatten_batch, _restore_batch
+from .worker import get_worker_info
 
 
 class Dataset:
@@ -671,3 +683,289 @@ class ConcatDataset(Dataset):
         else:
             sample_idx = idx - self.cumulative_sizes[dataset_idx - 1]
         return self.datasets[dataset_idx][sample_idx]
+
+
+def _sample_nbytes(sample):
+    """
+    Estimated bytes of a sample, which is the sum of the bytes of all its
+    leaf fields.
+    """
+    if isinstance(sample, np.ndarray):
+        return sample.nbytes
+    elif isinstance(sample, (paddle.Tensor, core.eager.Tensor)):
+        return int(np.prod(sample.shape)) * sample.element_size()
+    elif hasattr(sample, 'getbands') and hasattr(sample, 'size'):
+        # PIL.Image
+        width, height = sample.size
+        return width * height * len(sample.getbands())
+    elif isinstance(sample, (str, bytes)):
+        return sys.getsizeof(sample)
+    elif isinstance(sample, Mapping):
+        return sum(_sample_nbytes(field) for field in sample.values())
+    elif isinstance(sample, Sequence):
+        return sum(_sample_nbytes(field) for field in sample)
+    return sys.getsizeof(sample)
+
+
+class CachedDataset(Dataset):
+    """
+    Dataset wrapper which caches samples of a map-style dataset by index,
+    so that the decoding cost of :attr:`dataset` is only paid once.
+
+    Samples are looked up in two tiers:
+
+    - memory tier: a LRU cache bounded by :attr:`memory_cache_size` bytes.
+    - disk tier: if :attr:`cache_dir` is set, each sample is also written
+      into a file under :attr:`cache_dir`, array fields of the sample are
+      stored as raw aligned blobs and loaded back with memory map.
+
+    The wrapped :attr:`dataset` should return decoded samples without
+    random augmentation, augmentation should be set as :attr:`transform`,
+    which is applied to the cached sample on every access.
+
+    When used with multi-process :code:`paddle.io.DataLoader`, each worker
+    process holds its own memory tier while the disk tier is shared by all
+    workers, files are written to a temporary path named by worker id and
+    renamed atomically, so concurrent workers never read partial files.
+    Statistics in :code:`stats` are collected per process.
+
+    Args:
+        dataset (Dataset): the map-style dataset to cache samples of.
+        transform (callable, optional): function applied to the cached
+            sample on each access, it should not modify the sample in
+            place. Default None.
+        memory_cache_size (int, optional): capacity in bytes of the memory
+            tier, 0 to disable the memory tier. Default 1GB.
+        cache_dir (str, optional): directory of the disk tier, None to
+            disable the disk tier. Default None.
+
+    Returns:
+        Dataset: A Dataset which returns cached samples of :attr:`dataset`.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io import CachedDataset, Dataset
+
+            >>> class RandomDataset(Dataset):
+            ...     def __init__(self, num_samples):
+            ...         self.num_samples = num_samples
+            ...
+            ...     def __getitem__(self, idx):
+            ...         image = np.random.random([32]).astype('float32')
+            ...         label = np.random.randint(0, 9, (1, )).astype('int64')
+            ...         return image, label
+            ...
+            ...     def __len__(self):
+            ...         return self.num_samples
+            ...
+            >>> dataset = CachedDataset(RandomDataset(10))
+            >>> for epoch in range(2):
+            ...     for i in range(len(dataset)):
+            ...         image, label = dataset[i]
+            >>> print(dataset.stats()['hits'])
+            10
+    """
+
+    def __init__(
+        self,
+        dataset,
+        transform=None,
+        memory_cache_size=1 << 30,
+        cache_dir=None,
+    ):
+        assert not isinstance(
+            dataset, IterableDataset
+        ), "CachedDataset does not support IterableDataset"
+        assert (
+            memory_cache_size >= 0
+        ), "memory_cache_size should be a non-negative value"
+        self.dataset = dataset
+        self.transform = transform
+        self.memory_cache_size = memory_cache_size
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._memory_cache = collections.OrderedDict()
+        self._memory_bytes = 0
+        self.reset_stats()
+
+    def __len__(self):
+        return len(self.dataset)
+
+    def __getitem__(self, idx):
+        sample = self._get_cached(idx)
+        if self.transform is not None:
+            sample = self.transform(sample)
+        return sample
+
+    def _get_cached(self, idx):
+        if idx in self._memory_cache:
+            self._memory_cache.move_to_end(idx)
+            self._stats['hits'] += 1
+            self._stats['memory_hits'] += 1
+            return self._memory_cache[idx][0]
+
+        sample = None
+        if self.cache_dir is not None:
+            sample = self._load_from_disk(idx)
+            if sample is not None:
+                self._stats['hits'] += 1
+                self._stats['disk_hits'] += 1
+
+        if sample is None:
+            self._stats['misses'] += 1
+            start = time.time()
+            sample = self.dataset[idx]
+            self._stats['load_time'] += time.time() - start
+            if self.cache_dir is not None:
+                self._save_to_disk(idx, sample)
+
+        self._put_memory(idx, sample)
+        return sample
+
+    def _put_memory(self, idx, sample):
+        if self.memory_cache_size == 0:
+            return
+        nbytes = _sample_nbytes(sample)
+        if nbytes > self.memory_cache_size:
+            return
+        while self._memory_bytes + nbytes > self.memory_cache_size:
+            _, (_, evicted_nbytes) = self._memory_cache.popitem(last=False)
+            self._memory_bytes -= evicted_nbytes
+            self._stats['evictions'] += 1
+        self._memory_cache[idx] = (sample, nbytes)
+        self._memory_bytes += nbytes
+
+    def _cache_path(self, idx):
+        return os.path.join(self.cache_dir, f'{idx}.sample')
+
+    def _save_to_disk(self, idx, sample):
+        # file layout: [header size(8 bytes)][pickled header][aligned
+        # raw array blobs], header records structure of the sample and
+        # (offset, shape, dtype) of each array field
+        flat_sample, structure = _flatten_batch(sample)
+        fields = []
+        arrays = []
+        for field in flat_sample:
+            if isinstance(field, (paddle.Tensor, core.eager.Tensor)):
+                field = field.numpy()
+            if (
+                isinstance(field, np.ndarray)
+                and not field.dtype.hasobject
+                and field.size > 0
+            ):
+                fields.append(None)
+                arrays.append(np.ascontiguousarray(field))
+            else:
+                fields.append(field)
+                arrays.append(None)
+
+        metas = []
+        offset = 0
+        for arr in arrays:
+            if arr is None:
+                metas.append(None)
+            else:
+                offset = _align_offset(offset)
+                metas.append((offset, arr.shape, arr.dtype.str))
+                offset += arr.nbytes
+        header = pickle.dumps(
+            (structure, fields, metas), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        data_start = _align_offset(8 + len(header))
+
+        worker_info = get_worker_info()
+        worker_id = worker_info.id if worker_info is not None else 0
+        path = self._cache_path(idx)
+        tmp_path = f'{path}.tmp.{os.getpid()}.{worker_id}'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(struct.pack('<Q', len(header)))
+                f.write(header)
+                for arr, meta in zip(arrays, metas):
+                    if arr is None:
+                        continue
+                    f.seek(data_start + meta[0])
+                    f.write(arr.tobytes())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            warnings.warn(f"CachedDataset failed to cache sample {idx}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._stats['disk_bytes_written'] += data_start + offset
+
+    def _load_from_disk(self, idx):
+        path = self._cache_path(idx)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            (header_size,) = struct.unpack('<Q', f.read(8))
+            structure, fields, metas = pickle.loads(f.read(header_size))
+        data_start = _align_offset(8 + header_size)
+
+        flat_sample = []
+        for field, meta in zip(fields, metas):
+            if meta is None:
+                flat_sample.append(field)
+                continue
+            offset, shape, dtype = meta
+            # copy-on-write mapping, so that transforms modifying the
+            # sample never write back to the cache file
+            arr = np.memmap(
+                path,
+                dtype=np.dtype(dtype),
+                mode='c',
+                offset=data_start + offset,
+                shape=shape,
+            )
+            self._stats['disk_bytes_read'] += arr.nbytes
+            flat_sample.append(arr)
+        return _restore_batch(flat_sample, structure)
+
+    def stats(self):
+        """
+        Get cache statistics of current process.
+
+        Returns:
+            dict: cache statistics, contains following keys:
+
+            - hits: sample number got from memory or disk tier.
+            - memory_hits: sample number got from memory tier.
+            - disk_hits: sample number got from disk tier.
+            - misses: sample number loaded from :attr:`dataset`.
+            - evictions: sample number evicted from memory tier.
+            - hit_rate: hits / (hits + misses).
+            - load_time: seconds spent in loading samples from :attr:`dataset`.
+            - memory_bytes: bytes currently held by memory tier.
+            - disk_bytes_read: bytes read from disk tier.
+            - disk_bytes_written: bytes written into disk tier.
+        """
+        stats = dict(self._stats)
+        total = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / total if total > 0 else 0.0
+        stats['memory_bytes'] = self._memory_bytes
+        return stats
+
+    def reset_stats(self):
+        """
+        Reset cache statistics of current process, cached samples are kept.
+        """
+        self._stats = {
+            'hits': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'load_time': 0.0,
+            'disk_bytes_read': 0,
+            'disk_bytes_written': 0,
+        }
+
+
+def _align_offset(offset, alignment=64):
+    return (offset + alignment - 1) // alignment * alignment
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+
 
 class _DatasetFetcher:
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
@@ -40,6 +42,12 @@ class _IterableDatasetFetcher(_DatasetFetcher):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
         self.dataset_iter = iter(dataset)
 
+    def skip(self, num_samples):
+        # advance dataset iterator without collating samples, used to
+        # resume iteration from a DataLoader state_dict
+        for _ in itertools.islice(self.dataset_iter, num_samples):
+            pass
+
     def fetch(self, batch_indices, done_event=None):
         if self.auto_collate_batch:
             data = []
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import warnings
+
 import numpy as np
 
 from ...framework import core
@@ -93,6 +95,27 @@ class Sampler:
     # Not define __len__ method in this base class here for __len__
     # is not needed in same sence, e.g. paddle.io.IterableDataset
 
+    def state_dict(self):
+        """
+        Get the state of the sampler, which can be used to restore the
+        sample order of current iteration by :code:`load_state_dict`.
+        Stateless samplers return an empty dict.
+
+        Returns:
+            dict: state of the sampler.
+        """
+        return {}
+
+    def load_state_dict(self, state_dict):
+        """
+        Restore the sampler state got from :code:`state_dict`, which
+        takes effect in the next iteration of the sampler.
+
+        Args:
+            state_dict(dict): state of the sampler.
+        """
+        pass
+
 
 class SequenceSampler(Sampler):
     """
@@ -204,6 +227,12 @@ class RandomSampler(Sampler):
         self.replacement = replacement
         self._num_samples = num_samples
         self.generator = generator
+        # numpy global random state before drawing indices of the current
+        # iteration, and the state to draw indices from in the next
+        # iteration, which is restored into a private RandomState so that
+        # the global random stream is untouched
+        self._rng_state = None
+        self._resume_rng_state = None
 
         if not isinstance(self.replacement, bool):
             raise TypeError(
@@ -239,13 +268,20 @@ class RandomSampler(Sampler):
                     return
                 yield index
         else:
+            if self._resume_rng_state is not None:
+                rng = np.random.RandomState()
+                rng.set_state(self._resume_rng_state)
+                self._resume_rng_state = None
+            else:
+                rng = np.random
+            self._rng_state = rng.get_state()
             if self.replacement:
-                for index in np.random.choice(
+                for index in rng.choice(
                     np.arange(n), self.num_samples, replace=True
                 ).tolist():
                     yield index
             else:
-                for index in np.random.choice(
+                for index in rng.choice(
                     np.arange(n), self.num_samples, replace=False
                 ).tolist():
                     yield index
@@ -253,6 +289,14 @@ class RandomSampler(Sampler):
     def __len__(self):
         return self.num_samples
 
+    def state_dict(self):
+        if self.generator or self._rng_state is None:
+            return {}
+        return {'rng_state': self._rng_state}
+
+    def load_state_dict(self, state_dict):
+        self._resume_rng_state = state_dict.get('rng_state')
+
 
 def _weighted_sample(weights, num_samples, replacement=True):
     if isinstance(weights, core.LoDTensor):
@@ -342,6 +386,12 @@ class WeightedRandomSampler(Sampler):
         mul = np.prod(self.weights.shape) // self.weights.shape[-1]
         return self.num_samples * mul
 
+    def load_state_dict(self, state_dict):
+        warnings.warn(
+            "WeightedRandomSampler keeps no random state, the samples after "
+            "resuming are drawn independently of the saved iteration."
+        )
+
 
 class SubsetRandomSampler(Sampler):
     r"""
@@ -381,5 +431,12 @@ class SubsetRandomSampler(Sampler):
         for i in randperm(len(self.indices)):
             yield self.indices[i]
 
+    def load_state_dict(self, state_dict):
+        warnings.warn(
+            "SubsetRandomSampler keeps no random state, the order of indices "
+            "after resuming differs from the saved iteration, so consumed "
+            "indices may be sampled again."
+        )
+
     def __len__(self) -> int:
         return len(self.indices)
@@ -0,0 +1,186 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import queue
+
+import numpy as np
+
+import paddle
+
+from ...framework import core
+from ..multiprocess_utils import MP_STATUS_CHECK_INTERVAL
+
+# each field is placed at an offset aligned to this value inside a
+# slot, which keeps numpy views built on the slab well aligned for
+# vectorized copies
+_SHM_RING_ALIGN = 64
+
+# default size of each slot in bytes, shared memory pages are only
+# committed on write, so a generous default costs no physical memory
+_SHM_RING_DEFAULT_SLOT_SIZE = 32 * 1024 * 1024
+
+
+def _use_shm_ring():
+    return os.environ.get('FLAGS_use_shm_ring', False) in [
+        1,
+        '1',
+        True,
+        'True',
+        'true',
+    ]
+
+
+def _shm_ring_slot_size():
+    return int(
+        os.environ.get('FLAGS_shm_ring_slot_size', _SHM_RING_DEFAULT_SLOT_SIZE)
+    )
+
+
+def _align(nbytes):
+    return (nbytes + _SHM_RING_ALIGN - 1) // _SHM_RING_ALIGN * _SHM_RING_ALIGN
+
+
+class _ShmRingBatch:
+    """
+    Descriptor of a flattened batch written into one slot of a
+    :code:`_SharedMemoryRing`, only this small object is sent through
+    the inter-process result queue.
+
+    Args:
+        worker_id(int): id of the worker which owns the ring.
+        slot_id(int): slot index inside the ring.
+        metas(list): list of (offset, shape, dtype) for each field,
+            offset is relative to the beginning of the slot.
+    """
+
+    def __init__(self, worker_id, slot_id, metas):
+        self.worker_id = worker_id
+        self.slot_id = slot_id
+        self.metas = metas
+
+
+class _SharedMemoryRing:
+    """
+    A preallocated shared memory slab split into :attr:`num_slots`
+    fixed size slots, used to transport batches from a DataLoader worker
+    to the main process without pickling the array payload.
+
+    The ring is created in main process before workers start, each
+    worker owns one ring and writes collated batches into a free slot,
+    main process copies fields out of the slot and gives the slot back
+    through :attr:`_free_slots`. Slots are recycled by id rather than in
+    a fixed order, so batches can be consumed in any order.
+
+    Args:
+        num_slots(int): slot number of the ring.
+        slot_size(int): size in bytes of each slot.
+    """
+
+    def __init__(self, num_slots, slot_size):
+        from multiprocessing import shared_memory
+
+        from paddle.incubate import multiprocessing
+
+        assert num_slots > 0, "num_slots should be a positive value"
+        assert slot_size > 0, "slot_size should be a positive value"
+        self.num_slots = num_slots
+        self.slot_size = _align(slot_size)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=self.num_slots * self.slot_size
+        )
+        self._free_slots = multiprocessing.Queue()
+        self._free_slots.cancel_join_thread()
+        for slot_id in range(self.num_slots):
+            self._free_slots.put(slot_id)
+
+    def _slot_fields(self, arrays):
+        metas = []
+        offset = 0
+        for arr in arrays:
+            metas.append((offset, arr.shape, arr.dtype.str))
+            offset += _align(arr.nbytes)
+        return metas, offset
+
+    def _acquire(self, done_event):
+        while not done_event.is_set():
+            try:
+                return self._free_slots.get(timeout=MP_STATUS_CHECK_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _view(self, slot_id, offset, shape, dtype):
+        return np.ndarray(
+            shape,
+            dtype=np.dtype(dtype),
+            buffer=self._shm.buf,
+            offset=slot_id * self.slot_size + offset,
+        )
+
+    def write(self, worker_id, flat_batch, done_event):
+        """
+        Write flattened batch fields into a free slot, called in worker
+        process. Return a :code:`_ShmRingBatch` descriptor, or None if
+        the batch cannot be transported by the ring (a field is not an
+        array or the batch is larger than a slot), callers should fall
+        back to the result queue in this case.
+        """
+        arrays = []
+        for field in flat_batch:
+            if isinstance(field, (paddle.Tensor, core.eager.Tensor)):
+                field = field.numpy()
+            if not isinstance(field, np.ndarray) or field.dtype.hasobject:
+                return None
+            arrays.append(field)
+
+        metas, nbytes = self._slot_fields(arrays)
+        if nbytes > self.slot_size:
+            return None
+
+        slot_id = self._acquire(done_event)
+        if slot_id is None:
+            return None
+
+        for arr, (offset, shape, dtype) in zip(arrays, metas):
+            self._view(slot_id, offset, shape, dtype)[...] = arr
+        return _ShmRingBatch(worker_id, slot_id, metas)
+
+    def read(self, ring_batch):
+        """
+        Return numpy views of the fields described by :attr:`ring_batch`,
+        views are only valid until :code:`release` is called.
+        """
+        return [
+            self._view(ring_batch.slot_id, offset, shape, dtype)
+            for offset, shape, dtype in ring_batch.metas
+        ]
+
+    def release(self, ring_batch):
+        self._free_slots.put(ring_batch.slot_id)
+
+    def close(self, unlink=False):
+        self._free_slots.cancel_join_thread()
+        self._free_slots.close()
+        try:
+            self._shm.close()
+        except BufferError:
+            # views may still be referenced, the slab will be unmapped
+            # once they are garbage collected
+            pass
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
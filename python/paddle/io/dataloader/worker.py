@@ -27,6 +27,7 @@ from ..multiprocess_utils import (
     CleanupFuncRegistrar,
     _cleanup_mmap,
 )
+from .collate import _BufferedCollateFn
 from .fetcher import _IterableDatasetFetcher, _MapDatasetFetcher
 from .flat import _flatten_batch
 
@@ -40,6 +41,12 @@ class _ResumeIteration:
     pass
 
 
+class _CollateStats:
+    def __init__(self, worker_id, stats):
+        self.worker_id = worker_id
+        self.stats = stats
+
+
 class _DatasetKind:
     MAP = 0
     ITER = 1
@@ -283,6 +290,8 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cache_size=0,
+    shm_ring=None,
+    num_skip_samples=0,
 ):
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
@@ -324,6 +333,9 @@ def _worker_loop(
             fetcher = _DatasetKind.create_fetcher(
                 dataset_kind, dataset, auto_collate_batch, collate_fn, drop_last
             )
+            # skip samples consumed before DataLoader state_dict is saved
+            if dataset_kind == _DatasetKind.ITER and num_skip_samples > 0:
+                fetcher.skip(num_skip_samples)
         except:
             init_exception = _WorkerException(worker_id)
 
@@ -380,7 +392,21 @@ def _worker_loop(
             else:
                 if isinstance(batch, _WorkerException):
                     out_queue.put((idx, batch, None))
+                # NOTE: each worker collates with its own copy of collate_fn,
+                # send the counters of this batch to the main process
+                if isinstance(collate_fn, _BufferedCollateFn):
+                    out_queue.put(_CollateStats(worker_id, collate_fn.stats()))
+                    collate_fn.reset_stats()
                 batch, structure = _flatten_batch(batch)
+                # NOTE: [ shared memory ring ] write array payload into
+                # the worker's ring and only send a small descriptor
+                # through out_queue, batches which cannot be written
+                # into a slot fall back to the queue path below
+                if shm_ring is not None:
+                    ring_batch = shm_ring.write(worker_id, batch, done_event)
+                    if ring_batch is not None:
+                        out_queue.put((idx, ring_batch, structure))
+                        continue
                 if use_shared_memory:
 
                     def numpy2lodtensor(arr):
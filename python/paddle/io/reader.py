@@ -18,6 +18,7 @@ import multiprocessing
 import sys
 import time
 import warnings
+import weakref
 
 import paddle
 
@@ -311,6 +312,13 @@ class DataLoader:
         worker_init_fn(callable, optional): init function which will be called with
             worker id on each subprocess starting if not set as None. Default
             None.
+        in_order(bool, optional): whether to output batches in the order of
+            batch indices in multi-process mode. If False, idle workers take
+            the next batch indices from a shared queue and batches are output
+            as soon as they are loaded, a slow batch can fall behind at most
+            :attr:`prefetch_factor` * :attr:`num_workers` batches. This reduces
+            tail latency when loading time of samples varies a lot. Only
+            supported for map-style dataset. Default True.
 
     Returns:
         DataLoader: an iterable object for data iterating, each element of the generated data is a Tensor.
@@ -400,6 +408,7 @@ class DataLoader:
         timeout=0,
         worker_init_fn=None,
         persistent_workers=False,
+        in_order=True,
     ):
         self.return_list = return_list
         self.collate_fn = collate_fn
@@ -456,6 +465,14 @@ class DataLoader:
         else:
             self.dataset_kind = _DatasetKind.MAP
 
+        if not in_order and self.dataset_kind == _DatasetKind.ITER:
+            warnings.warn(
+                "DataLoader in_order=False is not supported for IterableDataset, "
+                "in_order=True will be used instead"
+            )
+            in_order = True
+        self.in_order = in_order
+
         if batch_sampler is not None:
             assert batch_size == 1 and not shuffle and not drop_last, (
                 "batch_size/shuffle/drop_last should not be set when "
@@ -495,6 +512,10 @@ class DataLoader:
 
         self._persistent_workers = persistent_workers
         self._iterator = None
+        # weak reference to the latest iterator for state_dict, and the
+        # state to resume from in the next iterator, see load_state_dict
+        self._last_iterator = None
+        self._resume_state = None
         self.num_workers = AuToTune(self).__call__()
 
     def __len__(self):
@@ -508,15 +529,127 @@ class DataLoader:
 
     def __iter__(self):
         if self.num_workers == 0:
-            return _DataLoaderIterSingleProcess(self)
+            iterator = _DataLoaderIterSingleProcess(self)
         elif self._persistent_workers:
             if self._iterator is None:
                 self._iterator = _DataLoaderIterMultiProcess(self)
             else:
                 self._iterator._reset()
-            return self._iterator
+            iterator = self._iterator
         else:
-            return _DataLoaderIterMultiProcess(self)
+            iterator = _DataLoaderIterMultiProcess(self)
+        self._last_iterator = weakref.ref(iterator)
+        return iterator
 
     def __call__(self):
         return self.__iter__()
+
+    def state_dict(self):
+        """
+        Get the iteration state of the latest iterator of the DataLoader,
+        which records the epoch and random state of the batch sampler, the
+        batch number consumed in current epoch and the progress of each
+        worker for IterableDataset.
+
+        Returns:
+            dict: iteration state of the DataLoader, an empty dict if the
+            DataLoader has not been iterated yet.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> # doctest: +SOLO('can not use multiprocessing testing `paddle.io.DataLoader`')
+                >>> import numpy as np
+                >>> import paddle
+                >>> from paddle.io import Dataset, DataLoader
+
+                >>> class RandomDataset(Dataset):
+                ...     def __getitem__(self, idx):
+                ...         return np.array([idx]).astype('int64')
+                ...
+                ...     def __len__(self):
+                ...         return 100
+                ...
+                >>> loader = DataLoader(RandomDataset(), batch_size=10, shuffle=True)
+                >>> loader_iter = iter(loader)
+                >>> for _ in range(3):
+                ...     data = next(loader_iter)
+                >>> state = loader.state_dict()
+                >>> expected = next(loader_iter)
+
+                >>> # in a restarted job, resume from the 4th batch
+                >>> loader = DataLoader(RandomDataset(), batch_size=10, shuffle=True)
+                >>> loader.load_state_dict(state)
+                >>> data = next(iter(loader))
+                >>> print(bool((data == expected).all()))
+                True
+        """
+        iterator = self._last_iterator() if self._last_iterator else None
+        if iterator is None:
+            return dict(self._resume_state) if self._resume_state else {}
+        return iterator.state_dict()
+
+    def collate_stats(self):
+        """
+        Get the statistics of the buffer-reusing batch collating of the
+        latest iterator of the DataLoader, which is enabled by setting
+        environment variable :code:`FLAGS_reuse_collate_buffer=1` when no
+        :attr:`collate_fn` is given. In multi-process mode, counters of all
+        workers are summed up.
+
+        Returns:
+            dict|None: a dict contains batch number, output buffer allocation
+            and reuse number, sample copy number and bytes copied into output
+            buffers, None if the DataLoader has not been iterated yet or the
+            buffer-reusing batch collating is not used.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> # doctest: +SOLO('can not use multiprocessing testing `paddle.io.DataLoader`')
+                >>> import os
+                >>> import numpy as np
+                >>> import paddle
+                >>> from paddle.io import Dataset, DataLoader
+
+                >>> os.environ['FLAGS_reuse_collate_buffer'] = '1'
+                >>> class RandomDataset(Dataset):
+                ...     def __getitem__(self, idx):
+                ...         return np.random.random([3, 8, 8]).astype('float32')
+                ...
+                ...     def __len__(self):
+                ...         return 100
+                ...
+                >>> loader = DataLoader(RandomDataset(), batch_size=10)
+                >>> loader_iter = iter(loader)
+                >>> for data in loader_iter:
+                ...     pass
+                >>> print(loader.collate_stats()['batches'])
+                10
+        """
+        iterator = self._last_iterator() if self._last_iterator else None
+        if iterator is None:
+            return None
+        return iterator.collate_stats()
+
+    def load_state_dict(self, state_dict):
+        """
+        Load iteration state got from :code:`state_dict`, the next iterator
+        of the DataLoader resumes from the first unconsumed batch, indices
+        of consumed batches are skipped by the batch sampler without reading
+        data from dataset. For IterableDataset, each worker skips the
+        samples it has produced, which requires the same :attr:`num_workers`
+        as the saved state.
+
+        Args:
+            state_dict(dict): iteration state of the DataLoader.
+        """
+        if self._iterator is not None:
+            # persistent workers hold the sampler iterator of current
+            # epoch, shut them down for the resumed iterator to restart
+            self._iterator._try_shutdown_all()
+            self._iterator = None
+        self._last_iterator = None
+        self._resume_state = dict(state_dict) if state_dict else None
@@ -161,7 +161,12 @@ def to_static(
             None. When backend is `CINN`, CINN compiler will be used to speed up
             training and inference.
         kwargs: Support keys including `property`, set `property` to True if the function
-            is python property.
+            is python property. And `background_compile`, set `background_compile` to True
+            to build the program of a new input signature in a background thread, the
+            dygraph function is called until the program is ready. It only works with PIR
+            and `full_graph=True`. The programs are built one by one in the process, so
+            other programs should not be built at the same time by other APIs, such as
+            `paddle.jit.save`.
 
     Returns:
         Tensor(s): containing the numerical result.
@@ -190,6 +195,7 @@ def to_static(
     """
     property = kwargs.get("property", False)
     full_graph = kwargs.get("full_graph", None)
+    background_compile = kwargs.get("background_compile", False)
 
     def decorated(python_func):
         """
@@ -207,6 +213,12 @@ def to_static(
             )
             full_graph = True
 
+        if background_compile and not (full_graph and use_pir_api()):
+            warnings.warn(
+                "background_compile only works with PIR and full_graph=True, "
+                "the program will be built when it is called."
+            )
+
         StaticClass = {
             False: SymbolicStaticFunction,
             True: ASTStaticFunction,
@@ -224,6 +236,7 @@ def to_static(
                 build_strategy=build_strategy,
                 property=property,
                 backend=backend,
+                background_compile=background_compile,
             ),
         )
 
@@ -326,6 +339,10 @@ class _SaveLoadConfig:
         # in the scene of llm-inference, pruning program can cause unexpectable result, an option to skip prune is necessary
         self.skip_prune_program = False
 
+        # used for `paddle.jit.load`, if True, the persistable variables are
+        # memory-mapped from the params file and copied to device on first use
+        self.lazy_load = False
+
     @property
     def output_spec(self):
         return self._output_spec
@@ -432,7 +449,7 @@ def _parse_save_configs(configs):
 
 
 def _parse_load_config(configs):
-    supported_configs = ['model_filename', 'params_filename']
+    supported_configs = ['model_filename', 'params_filename', 'lazy_load']
 
     # input check
     for key in configs:
@@ -446,6 +463,12 @@ def _parse_load_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.model_filename = configs.get('model_filename', None)
     inner_config.params_filename = configs.get('params_filename', None)
+    inner_config.lazy_load = configs.get('lazy_load', False)
+    if not isinstance(inner_config.lazy_load, bool):
+        raise TypeError(
+            "The config `lazy_load` should be bool value, but received input's type is %s."
+            % type(inner_config.lazy_load)
+        )
 
     return inner_config
 
@@ -1266,6 +1289,10 @@ def load(path, **configs):
             (2) params_filename (str): The persistable variables file name of the paddle 1.x
             ``save_inference_model`` save format. No default file name, save variables separately
             by default.
+            (3) lazy_load (bool): Whether to memory-map the persistable variables from the
+            combined params file instead of loading them eagerly. The data is copied to the
+            device when the loaded layer is first run or its ``state_dict`` is fetched, and
+            processes loading the same model share the page cache. Default False.
 
 
     Returns:
@@ -0,0 +1,177 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache of the ASTs transformed by `DygraphToStaticAst`, which is shared
+by processes (e.g. the ranks of DataParallel or the workers of serving) and
+restarts. It is enabled by setting `TO_STATIC_CACHE_DIR`.
+
+Each entry is a JSON file named by the hash of the source code, the qualified
+name of the function, the transformer version and the options selecting the
+transformers (PIR mode and `FLAGS_optim_transformation`). It holds the transformed
+source code and the original information of its AST nodes, which are
+relative to the function so that they can be restored for a function defined
+anywhere.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+
+import paddle
+from paddle.framework import use_pir_api
+from paddle.utils import gast
+from paddle.utils.environments import StringEnvironmentVariable
+
+from .ast_utils import ast_to_source_code
+from .origin_info import Location, OriginInfo, ast_walk
+from .transformers.transform import optim_transformation_enabled
+from .utils import ORIGIN_INFO
+
+ENV_TO_STATIC_CACHE_DIR = StringEnvironmentVariable("TO_STATIC_CACHE_DIR", "")
+
+# NOTE: Increase it when the format of the cache entries is changed.
+AST_CACHE_VERSION = 1
+
+
+def get_ast_cache_key(func, source_code):
+    hasher = hashlib.sha256()
+    for item in [
+        AST_CACHE_VERSION,
+        sys.version_info[:2],
+        paddle.__version__,
+        paddle.version.commit,
+        # NOTE: They decide which transformers are applied.
+        use_pir_api(),
+        optim_transformation_enabled(),
+        getattr(func, "__qualname__", func.__name__),
+        source_code,
+    ]:
+        hasher.update(str(item).encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def get_func_location(func):
+    source_lines, begin_lineno = inspect.getsourcelines(func)
+    begin_line = source_lines[0]
+    col_offset = len(begin_line) - len(begin_line.lstrip())
+    return (
+        inspect.getsourcefile(func),
+        [line.strip("\n") for line in source_lines],
+        begin_lineno - 1,
+        col_offset,
+    )
+
+
+def dump_origin_infos(root, func):
+    """
+    Returns the original information of each node of root relative to func, or
+    None if some of them are not from func.
+    """
+    filepath, _, lineno_offset, col_offset = get_func_location(func)
+    origin_infos = []
+    for node, _ in ast_walk(root, root):
+        origin_info = getattr(node, ORIGIN_INFO, None)
+        if origin_info is None:
+            origin_infos.append(None)
+            continue
+        location = origin_info.location
+        if location.filepath != filepath:
+            return None
+        origin_infos.append(
+            [
+                location.lineno - lineno_offset,
+                location.col_offset - col_offset,
+                origin_info.function_name,
+            ]
+        )
+    return origin_infos
+
+
+def load_origin_infos(root, func, origin_infos):
+    """
+    Attaches the original information returned by `dump_origin_infos` to the
+    nodes of root, returns False if they do not match.
+    """
+    nodes = [node for node, _ in ast_walk(root, root)]
+    if len(nodes) != len(origin_infos):
+        return False
+    filepath, source_lines, lineno_offset, col_offset = get_func_location(func)
+    for node, origin_info in zip(nodes, origin_infos):
+        if origin_info is None:
+            continue
+        lineno, node_col_offset, function_name = origin_info
+        location = Location(
+            filepath, lineno_offset + lineno, col_offset + node_col_offset
+        )
+        setattr(
+            node,
+            ORIGIN_INFO,
+            OriginInfo(location, function_name, source_lines[lineno - 1]),
+        )
+    return True
+
+
+def load_transformed_ast(func, source_code):
+    """
+    Returns the cached transformed AST of func, or None if it is not cached.
+    """
+    cache_dir = ENV_TO_STATIC_CACHE_DIR.get()
+    if not cache_dir:
+        return None
+    path = os.path.join(cache_dir, get_ast_cache_key(func, source_code))
+    try:
+        with open(path + ".json", encoding="utf-8") as f:
+            entry = json.load(f)
+        root = gast.parse(entry["source"])
+        if not load_origin_infos(root, func, entry["origin_infos"]):
+            return None
+    except Exception:
+        return None
+    return root
+
+
+def save_transformed_ast(func, source_code, root):
+    """
+    Stores the transformed AST of func. The entry is written to a temporary file
+    and renamed, so that the concurrent writers never leave a partial entry.
+    The cache is skipped if it is not writable.
+    """
+    cache_dir = ENV_TO_STATIC_CACHE_DIR.get()
+    if not cache_dir:
+        return
+    origin_infos = dump_origin_infos(root, func)
+    if origin_infos is None:
+        return
+    entry = {
+        "source": ast_to_source_code(root),
+        "origin_infos": origin_infos,
+    }
+    path = os.path.join(cache_dir, get_ast_cache_key(func, source_code))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path + ".json")
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
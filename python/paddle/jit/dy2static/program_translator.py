@@ -17,8 +17,10 @@ from __future__ import annotations
 import collections
 import inspect
 import threading
+import time
 import warnings
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import paddle.pir.core as ir_static
@@ -35,8 +37,10 @@ from paddle.nn.layer import layers
 from paddle.pir import Value
 from paddle.pir.core import _convert_into_value, static_op_arg_cast_guard
 from paddle.utils import flatten, gast
+from paddle.utils.environments import IntegerEnvironmentVariable
 
 from . import error, logging_utils
+from .ast_cache import load_transformed_ast, save_transformed_ast
 from .function_spec import (
     FunctionSpec,
     _hash_spec_names,
@@ -77,6 +81,15 @@ __all__ = []
 # Once exceeding the threshold, we will raise warning to users to make sure the conversion is as expected.
 MAX_TRACED_PROGRAM_COUNT = 10
 
+# The default capacity of ProgramCache, the least recently used programs are
+# evicted once exceeding it. 0 means unlimited.
+ENV_TO_STATIC_CACHE_CAPACITY = IntegerEnvironmentVariable(
+    "TO_STATIC_CACHE_CAPACITY", 0
+)
+ENV_TO_STATIC_CACHE_MAX_BYTES = IntegerEnvironmentVariable(
+    "TO_STATIC_CACHE_MAX_BYTES", 0
+)
+
 CONVERSION_OPTIONS = "__jst_not_to_static"
 
 
@@ -144,9 +157,14 @@ class FunctionCache:
         if source_code in self._code_to_ast_caches:
             root = self._code_to_ast_caches[source_code]
         else:
-            root = gast.parse(source_code)
-            root = attach_origin_info(root, func)
-            root = self._dygraph_to_static.get_static_ast(root)
+            # Reuse the transformation of other processes if
+            # `TO_STATIC_CACHE_DIR` is set.
+            root = load_transformed_ast(func, source_code)
+            if root is None:
+                root = gast.parse(source_code)
+                root = attach_origin_info(root, func)
+                root = self._dygraph_to_static.get_static_ast(root)
+                save_transformed_ast(func, source_code, root)
             self._code_to_ast_caches[source_code] = root
 
         # Get static function from AST
@@ -161,6 +179,25 @@ class FunctionCache:
 
 _CACHE_LOCK = threading.Lock()
 _FUNCTION_CACHE = FunctionCache()
+_BACKGROUND_COMPILER = None
+# NOTE: Building a program switches the default programs, which are shared by
+# all threads, so the programs are built one by one in the process. The tracer
+# is thread local, so the dygraph functions still run during building.
+_BUILD_LOCK = threading.RLock()
+
+
+def _get_background_compiler():
+    """
+    Returns the worker thread which builds programs for the functions decorated
+    by `to_static` with `background_compile=True`.
+    """
+    global _BACKGROUND_COMPILER
+    with _CACHE_LOCK:
+        if _BACKGROUND_COMPILER is None:
+            _BACKGROUND_COMPILER = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="to_static_compile"
+            )
+        return _BACKGROUND_COMPILER
 
 
 def convert_to_static(function):
@@ -371,6 +408,7 @@ class StaticFunction:
         self._cuda_graph_capture_mode = ""
         self._cuda_graph_pool_id = 0
         self._property = kwargs.get("property", False)
+        self._background_compile = kwargs.get("background_compile", False)
         self._get_debug_name()
 
     def _get_debug_name(self):
@@ -531,6 +569,9 @@ class StaticFunction:
     def get_concrete_program_with_cache_key(self, cached_key):
         raise NotImplementedError("Not implemented yet.")
 
+    def warmup(self, input_specs):
+        raise NotImplementedError("Not implemented yet.")
+
     def get_traced_count(self):
         raise NotImplementedError("Not implemented yet.")
 
@@ -742,6 +783,9 @@ class SymbolicStaticFunction(StaticFunction):
         "get_concrete_program_with_cache_key"
     )
     get_traced_count = raise_error_template("get_traced_count")
+    # NOTE: SOT builds the programs by the guards of the real inputs, which
+    # can not be made from the input specs without running the function.
+    warmup = raise_error_template("warmup")
 
     @property
     def inputs(self):
@@ -774,12 +818,30 @@ class ASTStaticFunction(StaticFunction):
         super().__init__(function, input_spec, **kwargs)
 
     def _perform_call(self, *args, **kwargs):
+        origin_args, origin_kwargs = args, kwargs
         # 1. trace ops from dygraph layers and cache the generated program.
         args, kwargs = self._function_spec.unified_args_and_kwargs(args, kwargs)
 
+        concrete_programs = None
+        # NOTE: The program is built in the background only with PIR, `to_static`
+        # warns if it does not take effect.
+        if self._background_compile and use_pir_api():
+            concrete_programs = self.get_concrete_program(
+                *args,
+                **kwargs,
+                is_train=self._is_train_mode(),
+                in_background=True,
+            )
+            if concrete_programs is None:
+                return self._call_dygraph_while_building(
+                    *origin_args, **origin_kwargs
+                )
+
         try:
-            _, partial_program_layer = self.get_concrete_program(
-                *args, **kwargs, is_train=self._is_train_mode()
+            _, partial_program_layer = concrete_programs or (
+                self.get_concrete_program(
+                    *args, **kwargs, is_train=self._is_train_mode()
+                )
             )
             # 2. synchronize self.training attribute.
             if isinstance(self._class_instance, layers.Layer):
@@ -811,6 +873,15 @@ class ASTStaticFunction(StaticFunction):
                 )
                 raise e
 
+    def _call_dygraph_while_building(self, *args, **kwargs):
+        """
+        Runs the dygraph function while its program is built in the background.
+        """
+        # NOTE: The building switches the tracer of the background thread only,
+        # and replaces the parameters by static values in the copies of the
+        # parameter dicts, so the dygraph function does not wait for it.
+        return self._call_dygraph_function(*args, **kwargs)
+
     def get_concrete_program(self, *args, **kwargs):
         """
         Returns traced concrete program and inner executable partial layer.
@@ -820,19 +891,48 @@ class ASTStaticFunction(StaticFunction):
             **kwargs(dict) : input kwargs values.
 
         Returns:
-            Traced ConcreteProgram and executable translated Layer.
+            Traced ConcreteProgram and executable translated Layer. If
+            `in_background` is True and the program is not built yet, the
+            building starts in the background and None is returned.
         """
         self._raise_when_property()
 
         with_hook = kwargs.get("with_hook", False)
         is_train = kwargs.get("is_train", True)
         is_prim_infer = kwargs.get("is_prim_infer", False)
+        in_background = kwargs.get("in_background", False)
         if "is_train" in kwargs:
             kwargs.pop("is_train")
         if "with_hook" in kwargs:
             kwargs.pop("with_hook")
         if "is_prim_infer" in kwargs:
             kwargs.pop("is_prim_infer")
+        if "in_background" in kwargs:
+            kwargs.pop("in_background")
+        cache_key = self._get_cache_key(
+            args, kwargs, with_hook=with_hook, is_train=is_train
+        )
+        if is_prim_infer:
+            (
+                concrete_program,
+                partial_program_layer,
+            ) = self._program_cache.get_program_without_cache(cache_key)
+        elif in_background:
+            concrete_programs = self._program_cache.get_or_build_in_background(
+                cache_key
+            )
+            if concrete_programs is None:
+                return None
+            concrete_program, partial_program_layer = concrete_programs
+        else:
+            # 3. check whether hit the cache or build a new program for the input arguments
+            concrete_program, partial_program_layer = self._program_cache[
+                cache_key
+            ]
+        partial_program_layer._debug_name = self._debug_name
+        return concrete_program, partial_program_layer
+
+    def _get_cache_key(self, args, kwargs, with_hook=False, is_train=True):
         # 1. unify args/kwargs and replace Tensor with InputSpec
         if len(args) != len(self._function_spec.args_name):
             args, kwargs = self._function_spec.unified_args_and_kwargs(
@@ -844,7 +944,7 @@ class ASTStaticFunction(StaticFunction):
         ) = self._function_spec.args_to_input_spec(args, kwargs)
 
         # 2. generate cache key
-        cache_key = CacheKey(
+        return CacheKey(
             self._function_spec,
             input_args_with_spec,
             input_kwargs_with_spec,
@@ -853,18 +953,6 @@ class ASTStaticFunction(StaticFunction):
             with_hook=with_hook,
             is_train=is_train,
         )
-        if is_prim_infer:
-            (
-                concrete_program,
-                partial_program_layer,
-            ) = self._program_cache.get_program_without_cache(cache_key)
-        else:
-            # 3. check whether hit the cache or build a new program for the input arguments
-            concrete_program, partial_program_layer = self._program_cache[
-                cache_key
-            ]
-        partial_program_layer._debug_name = self._debug_name
-        return concrete_program, partial_program_layer
 
     def get_concrete_program_with_cache_key(self, cached_key):
         """
@@ -883,6 +971,62 @@ class ASTStaticFunction(StaticFunction):
         ) = self._program_cache.get_program_without_cache(cached_key)
         return concrete_program, partial_program_layer
 
+    def warmup(self, input_specs):
+        """
+        Builds the programs of several input signatures one by one, so that
+        the later calls with them hit the cache. It only works with
+        `full_graph=True`.
+
+        Args:
+            input_specs(list[list[InputSpec]]): The input signatures, each of
+                them is the list of InputSpec of the arguments.
+
+        Returns:
+            A list of dict with the input spec, the compile time in seconds and
+            whether the program has been cached before for each signature.
+
+        Examples:
+            .. code-block:: python
+
+                >>> # doctest: +SKIP('`paddle.jit.to_static` can not run in xdoctest')
+                >>> import paddle
+                >>> from paddle.static import InputSpec
+
+                >>> def foo(x):
+                ...     return x * 2
+                ...
+                >>> static_foo = paddle.jit.to_static(foo)
+                >>> reports = static_foo.warmup(
+                ...     [[InputSpec([4, 8])], [InputSpec([16, 8])]]
+                ... )
+        """
+        self._raise_when_property()
+        is_train = self._is_train_mode()
+
+        def build(input_spec):
+            # NOTE: Hold the build lock so that the program is not built by
+            # the background compiling of `__call__` at the same time.
+            with _BUILD_LOCK:
+                start = time.perf_counter()
+                cache_key = self._get_cache_key(
+                    tuple(input_spec), {}, is_train=is_train
+                )
+                cached = hash(cache_key) in self._program_cache._caches
+                self.get_concrete_program(*input_spec, is_train=is_train)
+                compile_time = time.perf_counter() - start
+            logging_utils.log(
+                2,
+                f"Warmup {self._debug_name} with {input_spec} in "
+                f"{compile_time:.3f}s.",
+            )
+            return {
+                "input_spec": input_spec,
+                "compile_time": compile_time,
+                "cached": cached,
+            }
+
+        return [build(input_spec) for input_spec in input_specs]
+
     def get_traced_count(self):
         """
         Returns the number of traced programs for the decorated function.
@@ -1510,17 +1654,57 @@ class PirAutoRecomputeHooker(PirPartialProgramLayerHook):
         return whole_program, forward_end_idx, src_vars
 
 
+# NOTE: The rough bytes of an operator in a program, including its attributes
+# and the variables it creates.
+_PROGRAM_BYTES_PER_OP = 1024
+# NOTE: Besides the main program, the partial program layer derives the
+# forward and backward programs for training and the program for inference
+# from it, which hold about three times its operators in total.
+_PROGRAM_COPIES_PER_ENTRY = 4
+
+
+def _estimate_program_bytes(concrete_program):
+    """
+    Estimates the memory of a cached program and the programs derived from it
+    by the number of its operators, which is cheap to get. The parameters are
+    shared with dygraph, so they are not counted.
+    """
+    main_program = concrete_program.main_program
+    if isinstance(main_program, ir_static.Program):
+        num_ops = main_program.num_ops()
+    else:
+        desc = main_program.desc
+        num_ops = sum(desc.block(i).op_size() for i in range(desc.num_blocks()))
+    return num_ops * _PROGRAM_BYTES_PER_OP * _PROGRAM_COPIES_PER_ENTRY
+
+
 class ProgramCache:
     """
     Wrapper class for the program functions defined by dygraph function.
+
+    The programs are kept in LRU order. When the number of programs exceeds
+    `capacity` or their estimated bytes exceed `max_bytes`, the least recently
+    used ones are evicted. The defaults are read from the environment variables
+    `TO_STATIC_CACHE_CAPACITY` and `TO_STATIC_CACHE_MAX_BYTES`, 0 means
+    unlimited.
     """
 
     def __init__(self):
         # {hash_id : (concrete_program, partial_layer)}
         self._caches = collections.OrderedDict()
+        # {hash_id : [cache_key, hit_count, estimated_bytes]}
+        self._entry_infos = {}
+        self._capacity = ENV_TO_STATIC_CACHE_CAPACITY.get()
+        self._max_bytes = ENV_TO_STATIC_CACHE_MAX_BYTES.get()
         # trace mostly recent used program
         self._recent_key = None
         self._recent_cache_key = None
+        # {hash_id : future of (concrete_program, partial_layer)}
+        self._pending_builds = {}
+        # increased by `clear`, the programs built before it are dropped
+        self._generation = 0
+        # guards `_pending_builds` against the calls from several threads
+        self._pending_lock = threading.Lock()
 
     def _build_once(self, cache_key):
         # TODO(Aurelius84): Need a gloabl FLAGS to enable/disable to_prim
@@ -1589,8 +1773,13 @@ class ProgramCache:
         item_id = hash(item)
         self._recent_cache_key = item
         self._recent_key = item_id
-        if item_id not in self._caches:
-            self._caches[item_id] = self._build_once(item)
+        if item_id in self._caches:
+            self._caches.move_to_end(item_id)
+            self._entry_infos[item_id][1] += 1
+        else:
+            with _BUILD_LOCK:
+                programs = self._build_once(item)
+            self._add(item_id, item, programs)
             # Note: raise warnings if number of traced program is more than `max_tracing_count`
             current_tracing_count = len(self._caches)
             if current_tracing_count > MAX_TRACED_PROGRAM_COUNT:
@@ -1601,8 +1790,91 @@ class ProgramCache:
 
         return self._caches[item_id]
 
+    def get_or_build_in_background(self, item):
+        """
+        Returns the cached programs of `item` if they have been built,
+        otherwise starts building them in the background and returns None.
+        """
+        item_id = hash(item)
+        with self._pending_lock:
+            if item_id not in self._caches:
+                future = self._pending_builds.get(item_id)
+                if future is None:
+                    compiler = _get_background_compiler()
+                    self._pending_builds[item_id] = compiler.submit(
+                        self._build_in_background, item, self._generation
+                    )
+                    return None
+                if not future.done():
+                    return None
+                del self._pending_builds[item_id]
+                # NOTE: If the background building failed, `__getitem__` builds
+                # the programs again in the current thread to raise the error.
+                if future.exception() is None and future.result() is not None:
+                    self._add(item_id, item, future.result())
+        return self[item]
+
+    def _build_in_background(self, cache_key, generation):
+        with _BUILD_LOCK:
+            # The cache has been cleared since the building was requested.
+            if generation != self._generation:
+                return None
+            return self._build_once(cache_key)
+
+    def _add(self, item_id, cache_key, programs):
+        self._caches[item_id] = programs
+        self._entry_infos[item_id] = [
+            cache_key,
+            0,
+            _estimate_program_bytes(programs[0]),
+        ]
+        self._evict()
+
+    def _exceeds_capacity(self):
+        if self._capacity > 0 and len(self._caches) > self._capacity:
+            return True
+        return self._max_bytes > 0 and self.estimated_bytes() > self._max_bytes
+
+    def _evict(self):
+        # NOTE: The most recently used program is never evicted.
+        while len(self._caches) > 1 and self._exceeds_capacity():
+            item_id, _ = self._caches.popitem(last=False)
+            del self._entry_infos[item_id]
+            logging_utils.log(
+                2, f"Evict the least recently used program of {item_id}."
+            )
+
+    def set_capacity(self, capacity=0, max_bytes=0):
+        """
+        Sets the max number of programs and the max estimated bytes of them,
+        0 means unlimited. The least recently used programs are evicted if
+        exceeding them.
+        """
+        self._capacity = capacity
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def estimated_bytes(self):
+        return sum(info[2] for info in self._entry_infos.values())
+
+    def info(self):
+        """
+        Returns the information of the cached programs from the least recently
+        used to the most, including the cache key, the number of hits and the
+        estimated bytes of each program.
+        """
+        return [
+            {
+                "key": repr(self._entry_infos[item_id][0]),
+                "hits": self._entry_infos[item_id][1],
+                "bytes": self._entry_infos[item_id][2],
+            }
+            for item_id in self._caches
+        ]
+
     def get_program_without_cache(self, cache_key):
-        return self._build_once(cache_key=cache_key)
+        with _BUILD_LOCK:
+            return self._build_once(cache_key=cache_key)
 
     def get_program(self, item):
         if not isinstance(item, CacheKey):
@@ -1632,6 +1904,12 @@ class ProgramCache:
 
     def clear(self):
         self._caches = collections.OrderedDict()
+        self._entry_infos = {}
+        with self._pending_lock:
+            for future in self._pending_builds.values():
+                future.cancel()
+            self._pending_builds = {}
+            self._generation += 1
 
 
 class PrimHooker(PartialProgramLayerHook):
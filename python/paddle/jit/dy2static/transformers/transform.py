@@ -49,18 +49,21 @@ from .typehint_transformer import TypeHintTransformer
 __all__ = []
 
 
-def apply_optimization(transformers):
+def optim_transformation_enabled():
     """
     Judge whether to apply optimized transformation, such as BreakTransformOptimizer.
     And not all optimized transformations are applied by default. It's controlled by
     'export FLAGS_optim_transformation=1'
     """
-    flag = str(os.environ.get('FLAGS_optim_transformation')) in [
+    return str(os.environ.get('FLAGS_optim_transformation')) in [
         '1',
         'True',
         'true',
     ]
-    if flag:
+
+
+def apply_optimization(transformers):
+    if optim_transformation_enabled():
         transformers.insert(3, BreakTransformOptimizer)
 
 
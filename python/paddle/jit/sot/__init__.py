@@ -18,4 +18,5 @@ from .opcode_translator.breakpoint import (  # noqa: F401
     add_breakpoint,
     add_event,
 )
-from .translate import symbolic_translate  # noqa: F401
+from .telemetry import export_stats, reset_stats, stats  # noqa: F401
+from .translate import export, load, symbolic_translate  # noqa: F401
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 from functools import cached_property
 
 import paddle
@@ -24,7 +26,13 @@ from paddle.base.unique_name import (
 from paddle.framework import use_pir_api
 from paddle.utils import flatten, is_sequence
 
-from .utils import Cache, Singleton, map_if_extend, meta_str
+from .utils import (
+    ENV_SOT_DYNAMIC_DIM_THRESHOLD,
+    Cache,
+    Singleton,
+    map_if_extend,
+    meta_str,
+)
 
 
 class MetaInfo:
@@ -40,7 +48,7 @@ class MetaInfo:
         self.stop_gradient = stop_gradient
 
     @staticmethod
-    def from_tensor(tensor):
+    def from_tensor(tensor, dynamic_dims=()):
         if isinstance(tensor, paddle.pir.Value):
             name = "Value@NoName"
         else:  # For Tensor or Variable
@@ -63,9 +71,13 @@ class MetaInfo:
             and current_amp_state["dtype"] == "float16"
         ):
             dtype = paddle.float32
+        shape = [
+            -1 if i in dynamic_dims else dim
+            for i, dim in enumerate(tensor.shape)
+        ]
         # TODO(@xiongkun) remove after pir become default state.
         return MetaInfo(
-            list(tensor.shape),
+            shape,
             dtype,
             tensor.stop_gradient,
             name,
@@ -81,6 +93,9 @@ class MetaInfo:
         """
         return -1 in self.shape
 
+    def dynamic_dims(self):
+        return tuple(i for i, dim in enumerate(self.shape) if dim == -1)
+
     def to_input_spec(self):
         return paddle.static.InputSpec(
             self.shape, dtype=self.dtype, stop_gradient=self.stop_gradient
@@ -103,6 +118,40 @@ class MetaInfo:
         return hash((tuple(self.shape), self.dtype, self.stop_gradient))
 
 
+@Singleton
+class DynamicDimRecorder:
+    """
+    Records the distinct sizes seen in each dim of the input tensors. Once a
+    dim has taken ``SOT_DYNAMIC_DIM_THRESHOLD`` distinct sizes, it is marked
+    as dynamic and traced as -1, so that one translation serves all sizes.
+    """
+
+    def __init__(self):
+        self.seen_sizes: dict[tuple, set[int]] = {}
+
+    def clear(self):
+        self.seen_sizes.clear()
+
+    def enabled(self):
+        return ENV_SOT_DYNAMIC_DIM_THRESHOLD.get() > 0
+
+    def record(self, key, shape) -> tuple[int, ...]:
+        """
+        Records the shape of the input tensor identified by ``key`` and
+        returns the indices of its dims that should be traced as dynamic.
+        """
+        threshold = ENV_SOT_DYNAMIC_DIM_THRESHOLD.get()
+        if threshold <= 0:
+            return ()
+        dynamic_dims = []
+        for i, dim in enumerate(shape):
+            seen = self.seen_sizes.setdefault((key, len(shape), i), set())
+            seen.add(dim)
+            if len(seen) >= threshold:
+                dynamic_dims.append(i)
+        return tuple(dynamic_dims)
+
+
 @Singleton
 class VariableCreator:
     """
@@ -15,12 +15,16 @@
 from __future__ import annotations
 
 import gc
+import time
 import traceback
 import types
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
 
+from ...infer_meta import DynamicDimRecorder
 from ...profiler import EventGuard, event_register
 from ...psdb import NO_FALLBACK_CODES
+from ...telemetry import SotStats
 from ...utils import (
     BreakGraphError,
     FallbackError,
@@ -33,14 +37,133 @@ from ...utils import (
 from ..custom_code import CustomCode
 from .guard import Guard
 from .opcode_executor import OpcodeExecutor, OpcodeExecutorBase
+from .persistent_cache import PersistentCache
 
 GuardedFunction = Tuple[CustomCode, Guard]
-GuardedFunctions = List[GuardedFunction]
 
 dummy_guard: Guard = lambda frame: True
 dummy_guard.expr = "lambda frame: True"
 dummy_guard.lambda_expr = "lambda frame: True"
 
+DISPATCH_VALUE_TYPES = (int, float, bool, str, bytes, type(None))
+
+
+class GuardedFunctions:
+    """
+    The guarded functions of a code object, ordered from the least recently
+    used to the most recently used.
+
+    The guards are dispatched by the value of a key expression, which is an
+    expression compared with a constant in the guards (e.g. the meta of an
+    input tensor). The key is evaluated once per lookup, and only the guards
+    whose constant equals the value are evaluated, so the lookup cost doesn't
+    grow with the number of specializations.
+
+    Attributes:
+        entries (OrderedDict): A dictionary that maps entry ids to guarded functions in LRU order.
+        dispatch_key (str | None): The key expression used to dispatch the guards.
+        buckets (dict): A dictionary that maps the constants of the dispatch key to entry ids.
+        unkeyed (set): The ids of the entries whose guard doesn't check the dispatch key.
+    """
+
+    entries: OrderedDict[int, GuardedFunction]
+    dispatch_key: str | None
+    dispatch_key_fn: Callable[[types.FrameType], Any] | None
+    buckets: dict[Any, set[int]]
+    unkeyed: set[int]
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.next_id = 0
+        self.dispatch_key = None
+        self.dispatch_key_fn = None
+        self.buckets = {}
+        self.unkeyed = set()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries.values())
+
+    def append(self, guarded_fn: GuardedFunction):
+        self.entries[self.next_id] = guarded_fn
+        self.next_id += 1
+        self.rebuild_dispatch_table()
+
+    def evict(self) -> GuardedFunction:
+        """
+        Removes the least recently used guarded function.
+        """
+        _, guarded_fn = self.entries.popitem(last=False)
+        self.rebuild_dispatch_table()
+        return guarded_fn
+
+    def rebuild_dispatch_table(self):
+        """
+        Chooses the key expression which splits the guards into the most
+        buckets, and puts each guard into the bucket of its constant.
+        """
+        key_values: dict[str, set[Any]] = {}
+        for _, guard_fn in self.entries.values():
+            for key, value in getattr(guard_fn, "dispatch_keys", {}).items():
+                try:
+                    key_values.setdefault(key, set()).add(value)
+                except TypeError:
+                    continue
+
+        self.dispatch_key = None
+        self.dispatch_key_fn = None
+        self.buckets = {}
+        self.unkeyed = set(self.entries.keys())
+        if not key_values:
+            return
+        dispatch_key = max(key_values, key=lambda k: len(key_values[k]))
+        if len(key_values[dispatch_key]) <= 1:
+            return
+
+        for entry_id, (_, guard_fn) in self.entries.items():
+            dispatch_keys = getattr(guard_fn, "dispatch_keys", {})
+            if dispatch_key not in dispatch_keys:
+                continue
+            if self.dispatch_key_fn is None:
+                self.dispatch_key_fn = eval(
+                    f"lambda frame: {dispatch_key}", guard_fn.__globals__
+                )
+            self.buckets.setdefault(dispatch_keys[dispatch_key], set()).add(
+                entry_id
+            )
+            self.unkeyed.discard(entry_id)
+        self.dispatch_key = dispatch_key
+
+    def candidates(self, frame: types.FrameType) -> list[int]:
+        """
+        Returns the ids of the entries whose guard may hit the frame, the most
+        recently used first.
+        """
+        if self.dispatch_key_fn is None:
+            return list(reversed(self.entries.keys()))
+        try:
+            with EventGuard("dispatch guard"):
+                value = self.dispatch_key_fn(frame)
+        except Exception as e:
+            log(2, f"[Cache]: Dispatch key error: {e}\n")
+            entry_ids = set()
+        else:
+            # NOTE: The hash of other types may be inconsistent with `==`,
+            # e.g. Tensor, so all guards are checked.
+            if type(value) not in DISPATCH_VALUE_TYPES:
+                return list(reversed(self.entries.keys()))
+            entry_ids = self.buckets.get(value, set())
+        return [
+            entry_id
+            for entry_id in reversed(self.entries.keys())
+            if entry_id in entry_ids or entry_id in self.unkeyed
+        ]
+
+    def hit(self, entry_id: int):
+        self.entries.move_to_end(entry_id)
+
 
 @Singleton
 class OpcodeExecutorCache:
@@ -49,16 +172,24 @@ class OpcodeExecutorCache:
     This cache is used to store previously translated instructions along with their corresponding guard functions.
 
     Attributes:
-        cache (dict): A dictionary that maps code objects to tuples of a cache getter function and a list of guarded functions.
+        cache (dict): A dictionary that maps code objects to their guarded functions.
+        evict_count (dict): A dictionary that maps code objects to the count of evicted guarded functions.
         translate_count (int): The count of how many instructions have been translated. It is used to test whether the cache hits.
     """
 
+    # NOTE: When a code object has more than MAX_CACHE_SIZE translations, the
+    # least recently used one is evicted. If MAX_EVICT_COUNT translations of
+    # a code object have been evicted, the code is too dynamic to benefit from
+    # translation and falls back to dygraph.
     MAX_CACHE_SIZE = 20
+    MAX_EVICT_COUNT = 20
     cache: dict[types.CodeType, GuardedFunctions]
+    evict_count: dict[types.CodeType, int]
     translate_count: int
 
     def __init__(self):
         self.cache = {}
+        self.evict_count = {}
         self.translate_count = 0
 
     def clear(self):
@@ -66,14 +197,19 @@ class OpcodeExecutorCache:
         Clears the cache and resets the translate count.
         """
         self.cache.clear()
+        self.evict_count.clear()
         self.translate_count = 0
+        PersistentCache().clear()
+        DynamicDimRecorder().clear()
 
     def __call__(self, frame: types.FrameType, **kwargs) -> CustomCode:
         code: types.CodeType = frame.f_code
         if code not in self.cache:
             log(2, f"[Cache]: Firstly call {code}\n")
+            SotStats().record_guard(code, 0.0, hit=False)
             new_custom_code, guard_fn = self.translate(frame, **kwargs)
-            self.cache[code] = [(new_custom_code, guard_fn)]
+            self.cache[code] = GuardedFunctions()
+            self.cache[code].append((new_custom_code, guard_fn))
             return new_custom_code
         guarded_fns = self.cache[code]
         return self.lookup(frame, guarded_fns, **kwargs)
@@ -83,21 +219,19 @@ class OpcodeExecutorCache:
         self, frame: types.FrameType, guarded_fns: GuardedFunctions, **kwargs
     ) -> CustomCode:
         """
-        Looks up the cache for a matching code object and returns a custom code object if a matching guard function is found, otherwise None.
+        Looks up the cache for a matching code object and returns a custom code object if a matching guard function is found, otherwise translates the frame.
 
         Args:
             frame (types.FrameType): The frame whose code object needs to be looked up in the cache.
-            guarded_fns (GuardedFunctions): The list of guarded functions associated with the code object.
+            guarded_fns (GuardedFunctions): The guarded functions associated with the code object.
 
         Returns:
-            CustomCode | None: The custom code object if a matching guard function is found, otherwise None.
+            CustomCode: The custom code object of the matching guard function or the new translation.
         """
-
-        if len(guarded_fns) >= self.MAX_CACHE_SIZE:
-            log(2, "[Cache]: Exceed max cache size, skip it\n")
-            return CustomCode(None, False)
-
-        for custom_code, guard_fn in guarded_fns:
+        code: types.CodeType = frame.f_code
+        guard_start = time.perf_counter()
+        for entry_id in guarded_fns.candidates(frame):
+            custom_code, guard_fn = guarded_fns.entries[entry_id]
             try:
                 with EventGuard("try guard"):
                     guard_result = guard_fn(frame)
@@ -106,6 +240,10 @@ class OpcodeExecutorCache:
                         2,
                         f"[Cache]: Cache hit, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
                     )
+                    guarded_fns.hit(entry_id)
+                    SotStats().record_guard(
+                        code, time.perf_counter() - guard_start, hit=True
+                    )
                     return custom_code
                 else:
                     log_do(
@@ -125,7 +263,18 @@ class OpcodeExecutorCache:
                 continue
 
         log(2, "[Cache]: all guards missed\n")
+        SotStats().record_guard(
+            code, time.perf_counter() - guard_start, hit=False
+        )
+        if self.evict_count.get(code, 0) >= self.MAX_EVICT_COUNT:
+            log(2, "[Cache]: Exceed max evict count, skip it\n")
+            SotStats().record_fallback(code, "exceed max evict count")
+            return CustomCode(None, False)
         new_custom_code, guard_fn = self.translate(frame, **kwargs)
+        if len(guarded_fns) >= self.MAX_CACHE_SIZE:
+            log(2, "[Cache]: Exceed max cache size, evict the LRU one\n")
+            guarded_fns.evict()
+            self.evict_count[code] = self.evict_count.get(code, 0) + 1
         guarded_fns.append((new_custom_code, guard_fn))
         return new_custom_code
 
@@ -134,6 +283,7 @@ class OpcodeExecutorCache:
     ) -> tuple[CustomCode, Guard]:
         """
         Translates the given frame's code object and returns the cache getter function and a guarded function for the translated code object.
+        If `SOT_CACHE_DIR` is set, the translation is restored from disk when a cached guard hits, and new translations are stored on disk.
 
         Args:
             frame (types.FrameType): The frame whose code object needs to be translated.
@@ -142,8 +292,17 @@ class OpcodeExecutorCache:
             tuple[CustomCode, Guard]: The cache getter function and a guarded function for the translated code object.
         """
         code: types.CodeType = frame.f_code
+        persistent_cache = PersistentCache()
+        if persistent_cache.enabled():
+            cached = persistent_cache.load(frame, **kwargs)
+            if cached is not None:
+                return cached
         self.translate_count += 1
+        translate_start = time.perf_counter()
         custom_new_code, guard_fn = start_translate(frame, **kwargs)
+        SotStats().record_translate(code, time.perf_counter() - translate_start)
+        if persistent_cache.enabled():
+            persistent_cache.save(frame, custom_new_code, guard_fn)
         return custom_new_code, guard_fn
 
     def analyse_guard_global_object(self, guard_fn):
@@ -208,6 +367,7 @@ def start_translate(frame: types.FrameType, **kwargs) -> GuardedFunction:
         # if disable_eval_frame is True, it means we want fallback to speedup rather than error occurred
         if is_strict_mode() and e.disable_eval_frame is False:
             raise
+        SotStats().record_fallback(frame.f_code, e)
         log(
             2,
             f"Unsupport Frame is {frame.f_code}, error message is: \n"
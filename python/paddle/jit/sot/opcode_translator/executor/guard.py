@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import ast
+import re
 import types
 import weakref
 from typing import TYPE_CHECKING, Any, Callable, TypeVar
@@ -61,6 +63,57 @@ def union_free_vars(*free_vars: dict[str, Any]):
     return {k: v for d in free_vars for k, v in d.items()}
 
 
+def get_dispatch_keys(lambda_expr: str) -> dict[str, Any]:
+    """
+    Find the `<key expr> == <constant>` checks of a guard, the guards of a code
+    object can be dispatched by the value of a key expression shared by them
+    instead of being evaluated one by one.
+
+    Args:
+        lambda_expr: the lambda expression of the guard.
+
+    Returns:
+        A dict which maps the key expressions to the constants.
+    """
+    try:
+        node = ast.parse(lambda_expr, mode="eval").body
+    except SyntaxError:
+        return {}
+    if not isinstance(node, ast.Lambda):
+        return {}
+    node = node.body
+    exprs = (
+        node.values
+        if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And)
+        else [node]
+    )
+    dispatch_keys = {}
+    for expr in exprs:
+        if (
+            isinstance(expr, ast.Compare)
+            and len(expr.ops) == 1
+            and isinstance(expr.ops[0], ast.Eq)
+            and isinstance(expr.comparators[0], ast.Constant)
+        ):
+            key_expr = ast.get_source_segment(lambda_expr, expr.left)
+            dispatch_keys[key_expr] = expr.comparators[0].value
+    return dispatch_keys
+
+
+TMP_NAME_PATTERN = re.compile(r"\b_sot_tmp_\d+\b")
+
+
+def guard_cost(debug_expr: str) -> int:
+    """
+    A rough cost of checking a guard, the cheap ones are checked first.
+    """
+    if "MetaInfo" in debug_expr:
+        return 2
+    if debug_expr.startswith("id(") or "type(" in debug_expr:
+        return 0
+    return 1
+
+
 def make_guard(stringify_guards: list[StringifyExpression]) -> Guard:
     """
     Make a guard from a list of StringifyExpression.
@@ -78,20 +131,42 @@ def make_guard(stringify_guards: list[StringifyExpression]) -> Guard:
             return guard
 
         def analyse_expressions(stringify_exprs, tmp_names):
+            # NOTE: The checks are sorted by their costs, and the values of
+            # the temporary names are only computed before the first check
+            # using them, so that a guard returns as soon as a check fails
+            # without computing the rest.
             func_string = "def built_guard_fn(frame):\n"
             lambda_string = "lambda frame: "
             free_vars = {}
+            tmp_exprs = {v: k for k, v in tmp_names.items()}
+            computed_names = set()
+
+            def compute_tmp_name(name):
+                nonlocal func_string
+                if name in computed_names or name not in tmp_exprs:
+                    return
+                computed_names.add(name)
+                for used_name in TMP_NAME_PATTERN.findall(tmp_exprs[name]):
+                    compute_tmp_name(used_name)
+                func_string += f"    {name} = {tmp_exprs[name]}\n"
+
+            checked_exprs = set()
+            for str_expr in sorted(
+                stringify_exprs, key=lambda e: guard_cost(e.debug_expr)
+            ):
+                free_vars = union_free_vars(free_vars, str_expr.free_vars)
+                if str_expr.expr in checked_exprs:
+                    continue
+                checked_exprs.add(str_expr.expr)
+                for used_name in TMP_NAME_PATTERN.findall(str_expr.expr):
+                    compute_tmp_name(used_name)
+                func_string += f"    if not {str_expr.expr}:\n"
+                func_string += "        return False\n"
 
-            for k, v in tmp_names.items():
-                func_string += f"    {v} = {k}\n"
-
-            func_result = ""
             for str_expr in stringify_exprs:
-                func_result += str_expr.expr + " and "
                 lambda_string += str_expr.debug_expr + " and "
-                free_vars = union_free_vars(free_vars, str_expr.free_vars)
 
-            func_string += f"    return {func_result[:-5]}"
+            func_string += "    return True"
 
             return func_string, free_vars, lambda_string[:-5]
 
@@ -112,6 +187,7 @@ def make_guard(stringify_guards: list[StringifyExpression]) -> Guard:
         log(3, f"[Guard]: {lambda_string}\n")
         guard.lambda_expr = lambda_string
         guard.expr = func_string
+        guard.dispatch_keys = get_dispatch_keys(lambda_string)
         assert callable(guard), "guard must be callable."
 
         return guard
@@ -31,6 +31,7 @@ from paddle.jit.utils import OrderedSet
 
 from ...profiler import EventGuard, event_register
 from ...psdb import NO_BREAKGRAPH_CODES
+from ...telemetry import SotStats
 from ...utils import (
     ENV_MIN_GRAPH_SIZE,
     BreakGraphError,
@@ -268,6 +269,7 @@ def call_break_graph_decorator(push_n: int | Callable[[int | None], int]):
                     )
                 if isinstance(self, OpcodeExecutor):
                     log(3, f"[BreakGraph] call function Break graph: {e}\n")
+                    self.record_break_graph(e)
                     self._break_graph_when_call(origin_stack, instr, push_n)
                     return Stop(state="BreakGraph")
                 else:
@@ -1637,6 +1639,9 @@ class OpcodeExecutor(OpcodeExecutorBase):
         Dispatcher.graph = None
         self.call_stack[:] = []
 
+    def record_break_graph(self, reason):
+        SotStats().record_break_graph(self._code, self._current_line, reason)
+
     @event_register("OpcodeExecutor: _prepare_virtual_env", event_level=2)
     def _prepare_virtual_env(self):
         """
@@ -1710,6 +1715,7 @@ class OpcodeExecutor(OpcodeExecutorBase):
                 self._lasti += 1
         except BreakGraphError as e:
             log(3, f"[BreakGraph] FOR_ITER sim for loop failed for: {e}\n")
+            self.record_break_graph(e)
             if backup_iter_idx:
                 iterator.idx = backup_iter_idx
             self._graph.remove_global_guarded_variable(iterator)
@@ -1730,7 +1736,9 @@ class OpcodeExecutor(OpcodeExecutorBase):
 
     def compile_return(self, ret_val):
         compile_fn = self._graph.get_compiled_fn(ret_val)
-        if compile_fn.graph_size() < ENV_MIN_GRAPH_SIZE.get():
+        graph_size = compile_fn.graph_size()
+        SotStats().record_subgraph(self._code, graph_size)
+        if graph_size < ENV_MIN_GRAPH_SIZE.get():
             self.new_code = None
         else:
             self._graph.start_compile(ret_val)
@@ -1768,8 +1776,10 @@ class OpcodeExecutor(OpcodeExecutorBase):
             store_var_info[_var.id] = name
 
         compile_fn = self._graph.get_compiled_fn(*store_vars)
+        graph_size = compile_fn.graph_size()
+        SotStats().record_subgraph(self._code, graph_size)
 
-        if compile_fn.graph_size() < ENV_MIN_GRAPH_SIZE.get():
+        if graph_size < ENV_MIN_GRAPH_SIZE.get():
             return self._graph._restore_origin_opcode(
                 list(stack), store_var_info, end_idx
             )
@@ -1788,6 +1798,7 @@ class OpcodeExecutor(OpcodeExecutorBase):
             instr: The jump instruction.
 
         """
+        self.record_break_graph("jump on tensor")
         self._graph.add_global_guarded_variable(result)
 
         # 1. analyse info
@@ -0,0 +1,558 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache of SOT translations, it is enabled by setting `SOT_CACHE_DIR`.
+
+Each translation is stored under `<SOT_CACHE_DIR>/<code key>/<entry key>.pkl`.
+The code key is a digest of the original code object, the Python version and
+the Paddle version. The entry is content addressed and holds two pickles:
+
+1. The header, it contains the guard and the objects whose `id` is guarded.
+2. The body, it contains the translated code and the objects the translated
+   code loads from globals (compiled SIRs, resume functions, ...).
+
+The objects that only exist in the running process (e.g. the layers) are
+stored as the expression which traces them from the frame, and are bound to
+the objects of the current frame when the entry is loaded. The guard is
+re-evaluated on the current frame before an entry is used, so a stale entry
+is a cache miss rather than a wrong result.
+"""
+
+from __future__ import annotations
+
+import ast
+import copyreg
+import hashlib
+import importlib
+import io
+import marshal
+import os
+import pickle
+import re
+import sys
+import types
+import weakref
+from typing import TYPE_CHECKING
+
+import paddle
+
+from ...profiler import EventGuard
+from ...utils import ENV_SOT_CACHE_DIR, Singleton, log
+from ..custom_code import CustomCode
+from .guard import get_dispatch_keys
+
+if TYPE_CHECKING:
+    from .guard import Guard
+
+CACHE_FORMAT_VERSION = 1
+GUARD_FN_NAME = "built_guard_fn"
+
+
+def _load_code(code_bytes, consts):
+    return marshal.loads(code_bytes).replace(co_consts=consts)
+
+
+def _reduce_code(code):
+    # NOTE: The consts of translated code may contain objects which can not be
+    # marshaled (e.g. dtype), so they are pickled separately.
+    code_bytes = marshal.dumps(code.replace(co_consts=()))
+    return _load_code, (code_bytes, code.co_consts)
+
+
+def _reduce_module(module):
+    return importlib.import_module, (module.__name__,)
+
+
+def _reduce_weakref(ref):
+    obj = ref()
+    if obj is None:
+        raise pickle.PicklingError("Can not pickle a dead weak reference.")
+    return weakref.ref, (obj,)
+
+
+def _reduce_enum(value):
+    return type(value), (int(value),)
+
+
+def _load_place(place_str):
+    try:
+        return paddle.base.framework._get_paddle_place(place_str)
+    except Exception:
+        return paddle.framework._current_expected_place()
+
+
+def _reduce_place(place):
+    # str(place) is like `Place(gpu:0)`
+    return _load_place, (str(place)[len("Place(") : -1],)
+
+
+def is_global_object(obj) -> bool:
+    """
+    Whether the object can be found by its module and qualified name, i.e.
+    it is pickled as a reference.
+    """
+    if isinstance(obj, types.ModuleType):
+        return True
+    module = sys.modules.get(getattr(obj, "__module__", None) or "")
+    qualname = getattr(obj, "__qualname__", None)
+    if module is None or not isinstance(qualname, str):
+        return False
+    value = module
+    for name in qualname.split("."):
+        value = getattr(value, name, None)
+    return value is obj
+
+
+def is_generated_fn(obj) -> bool:
+    """
+    Whether the object is a function generated by `PyCodeGen.create_function`,
+    e.g. the resume function of a break graph.
+    """
+    return isinstance(
+        obj, types.FunctionType
+    ) and obj.__code__.co_name.startswith("$")
+
+
+def get_code_key(code: types.CodeType) -> str | None:
+    """
+    Get the key of the original code object, None is returned if the code
+    can not be serialized.
+    """
+    try:
+        code_bytes = marshal.dumps(code)
+    except ValueError:
+        try:
+            code_bytes = TranslationPickler.dumps(code)
+        except Exception:
+            return None
+    hasher = hashlib.sha256()
+    hasher.update(str(CACHE_FORMAT_VERSION).encode())
+    hasher.update(sys.version.encode())
+    hasher.update(paddle.__version__.encode())
+    hasher.update(paddle.version.commit.encode())
+    hasher.update(code_bytes)
+    return hasher.hexdigest()
+
+
+def parse_guarded_ids(guard_expr: str) -> dict[int, str]:
+    """
+    Find the `id(<expr>) == <int>` comparisons in the guard, the ids are
+    process specific, so they are remapped when the guard is loaded.
+    """
+    guarded_ids = {}
+    try:
+        tree = ast.parse(guard_expr, mode="eval")
+    except SyntaxError:
+        return guarded_ids
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Compare)
+            and len(node.ops) == 1
+            and isinstance(node.ops[0], ast.Eq)
+            and isinstance(node.left, ast.Call)
+            and isinstance(node.left.func, ast.Name)
+            and node.left.func.id == "id"
+            and len(node.left.args) == 1
+            and isinstance(node.comparators[0], ast.Constant)
+            and type(node.comparators[0].value) is int
+        ):
+            expr = ast.get_source_segment(guard_expr, node.left.args[0])
+            guarded_ids[node.comparators[0].value] = expr
+    return guarded_ids
+
+
+def replace_guarded_ids(guard_expr: str, id_map: dict[int, int]) -> str:
+    # NOTE: Replace all ids in a single pass, otherwise an id replaced by a
+    # former mapping may be replaced again by a latter one (e.g. A -> B and
+    # B -> C).
+    return re.sub(
+        r"== (\d+)\b",
+        lambda m: f"== {id_map.get(int(m[1]), int(m[1]))}",
+        guard_expr,
+    )
+
+
+def trace_from_frame(expr: str, frame: types.FrameType, free_vars: dict):
+    return eval(f"lambda frame: {expr}", dict(free_vars))(frame)
+
+
+def collect_sirs(sir, sirs=None):
+    """
+    Collect the SIR and the SIRs called by it.
+    """
+    from ...symbolic.statement_ir import CallStatement, StatementIRFactory
+
+    sirs = {} if sirs is None else sirs
+    sirs[sir.name] = sir
+    for stmt in sir.statements:
+        if isinstance(stmt, CallStatement) and stmt.sir_name not in sirs:
+            collect_sirs(StatementIRFactory()[stmt.sir_name], sirs)
+    return sirs
+
+
+class RestoredSIRContext:
+    """
+    A minimal `SymbolicTraceContext` which only holds the restored SIRs.
+    """
+
+    def __init__(self, sirs):
+        self.sirs = sirs
+
+    def get_sir(self, name: str):
+        return self.sirs[name]
+
+
+class TranslationPickler(pickle.Pickler):
+    """
+    Pickle the guard and the translated code of a translation.
+
+    The objects bound to the frame are stored as persistent ids, and the
+    objects generated by the translation (compiled SIRs, resume functions)
+    are stored in a form that can be rebuilt in another process.
+    """
+
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[types.CodeType] = _reduce_code
+    dispatch_table[types.ModuleType] = _reduce_module
+    dispatch_table[weakref.ReferenceType] = _reduce_weakref
+    dispatch_table[paddle.base.core.VarDesc.VarType] = _reduce_enum
+    dispatch_table[paddle.base.core.DataType] = _reduce_enum
+    dispatch_table[paddle.base.core.Place] = _reduce_place
+
+    def __init__(self, file, frame_objects=None):
+        super().__init__(file, protocol=4)
+        self.frame_objects = frame_objects or {}
+
+    @classmethod
+    def dumps(cls, obj, frame_objects=None) -> bytes:
+        buffer = io.BytesIO()
+        cls(buffer, frame_objects).dump(obj)
+        return buffer.getvalue()
+
+    def persistent_id(self, obj):
+        from ...symbolic.compile_cache import FallbackWrapper
+        from .variables.basic import NullVariable
+
+        if self.frame_objects.get(id(obj)) is obj:
+            return ("frame_object", id(obj))
+        if isinstance(obj, FallbackWrapper):
+            return ("compiled_fn", obj.SIR.name, collect_sirs(obj.SIR))
+        if isinstance(obj, NullVariable):
+            return ("null_variable",)
+        if is_generated_fn(obj):
+            return ("generated_fn", obj.__code__, obj.__name__)
+        if isinstance(obj, (paddle.Tensor, paddle.nn.Layer)):
+            raise pickle.PicklingError(
+                f"{type(obj).__name__} is not traced from the frame."
+            )
+        return None
+
+
+class TranslationUnpickler(pickle.Unpickler):
+    def __init__(self, file, frame, frame_objects, kwargs):
+        super().__init__(file)
+        self.frame = frame
+        self.frame_objects = frame_objects
+        self.kwargs = kwargs
+
+    @classmethod
+    def loads(cls, data, frame=None, frame_objects=None, kwargs=None):
+        return cls(io.BytesIO(data), frame, frame_objects, kwargs).load()
+
+    def persistent_load(self, pid):
+        from ...symbolic.compile_cache import CompileSIRCache
+        from .variables.basic import NullVariable
+
+        kind = pid[0]
+        if kind == "frame_object":
+            return self.frame_objects[pid[1]]
+        if kind == "compiled_fn":
+            _, sir_name, sirs = pid
+            return CompileSIRCache()(
+                RestoredSIRContext(sirs), sir_name, **self.kwargs
+            )
+        if kind == "null_variable":
+            return NullVariable()
+        if kind == "generated_fn":
+            _, code, name = pid
+            return types.FunctionType(code, self.frame.f_globals, name)
+        raise pickle.UnpicklingError(f"Unknown persistent id: {kind}")
+
+
+class CacheEntry:
+    """
+    A translation loaded from disk, the body is only unpickled on guard hit.
+    """
+
+    def __init__(self, key: str, header: dict, body: bytes):
+        self.key = key
+        self.header = header
+        self.body = body
+
+    def restore_guard(self, frame: types.FrameType):
+        """
+        Rebuild the guard with the ids of the objects in the current frame.
+
+        Returns:
+            tuple[Guard, dict[int, object]]: The guard and the current objects
+            indexed by the ids they have in the cached guard.
+        """
+        free_vars = self.header["free_vars"]
+        id_map = {}
+        frame_objects = {}
+        for old_id, (kind, value) in self.header["guarded_ids"].items():
+            if kind == "frame_object":
+                obj = trace_from_frame(value, frame, free_vars)
+            else:
+                obj = value
+            id_map[old_id] = id(obj)
+            frame_objects[old_id] = obj
+        return (
+            build_guard(
+                replace_guarded_ids(self.header["guard_expr"], id_map),
+                replace_guarded_ids(self.header["guard_lambda_expr"], id_map),
+                free_vars,
+            ),
+            frame_objects,
+        )
+
+    def restore(self, frame: types.FrameType, **kwargs):
+        """
+        Restore the translation if its guard hits the current frame.
+        """
+        guard_fn, frame_objects = self.restore_guard(frame)
+        if not guard_fn(frame):
+            return None
+        code, disable_eval_frame, global_objects = TranslationUnpickler.loads(
+            self.body, frame, frame_objects, kwargs
+        )
+        if code is not None:
+            # NOTE: The names of generated objects are process specific, we
+            # rename them to avoid conflicts with the objects generated by
+            # the translations in the current process.
+            names = list(code.co_names)
+            for name, obj in global_objects.items():
+                if not is_global_object(obj):
+                    new_name = f"{name}__cached_{self.key[:12]}"
+                    names[names.index(name)] = new_name
+                    name = new_name
+                if name not in frame.f_globals:
+                    frame.f_globals[name] = obj
+            code = code.replace(co_names=tuple(names))
+        return CustomCode(code, disable_eval_frame), guard_fn
+
+
+def build_guard(guard_expr: str, guard_lambda_expr: str, free_vars: dict):
+    if guard_expr.startswith("lambda"):
+        guard = eval(guard_expr)
+    else:
+        free_vars = dict(free_vars)
+        exec(guard_expr, free_vars)
+        guard = free_vars[GUARD_FN_NAME]
+    guard.expr = guard_expr
+    guard.lambda_expr = guard_lambda_expr
+    guard.dispatch_keys = get_dispatch_keys(guard_lambda_expr)
+    return guard
+
+
+@Singleton
+class PersistentCache:
+    """
+    A singleton class that stores the translations of `OpcodeExecutorCache`
+    on disk, so the translations can be reused after the process restarts.
+
+    Attributes:
+        entries (dict): A dictionary that maps code keys to the cached entries
+            which have not been restored yet.
+        hit_count (int): The count of translations restored from disk.
+        skipped (dict): A dictionary that maps code objects to the reasons why
+            their translations were not saved.
+    """
+
+    entries: dict[str, list[CacheEntry]]
+    hit_count: int
+    skipped: dict[types.CodeType, str]
+
+    def __init__(self):
+        self.entries = {}
+        self.hit_count = 0
+        self.skipped = {}
+
+    def clear(self):
+        """
+        Clears the loaded entries, the entries on disk are kept.
+        """
+        self.entries.clear()
+        self.hit_count = 0
+        self.skipped.clear()
+
+    @staticmethod
+    def enabled() -> bool:
+        return ENV_SOT_CACHE_DIR.get() != ""
+
+    def get_entries(self, code_key: str) -> list[CacheEntry]:
+        if code_key in self.entries:
+            return self.entries[code_key]
+        entries = []
+        code_dir = os.path.join(ENV_SOT_CACHE_DIR.get(), code_key)
+        if os.path.isdir(code_dir):
+            for file_name in sorted(os.listdir(code_dir)):
+                if not file_name.endswith(".pkl"):
+                    continue
+                try:
+                    with open(os.path.join(code_dir, file_name), "rb") as f:
+                        header = pickle.load(f)
+                        body = f.read()
+                except Exception as e:
+                    log(2, f"[PersistentCache]: skip {file_name}: {e}\n")
+                    continue
+                if header.get("version") != CACHE_FORMAT_VERSION:
+                    continue
+                entries.append(CacheEntry(file_name[:-4], header, body))
+        self.entries[code_key] = entries
+        return entries
+
+    def load(
+        self, frame: types.FrameType, **kwargs
+    ) -> tuple[CustomCode, Guard] | None:
+        """
+        Looks up the disk cache for a translation whose guard hits the frame.
+
+        Args:
+            frame (types.FrameType): The frame to be translated.
+
+        Returns:
+            tuple[CustomCode, Guard] | None: The restored translation, or None
+            if no cached guard hits.
+        """
+        code_key = get_code_key(frame.f_code)
+        if code_key is None:
+            return None
+        with EventGuard("PersistentCache: load"):
+            entries = self.get_entries(code_key)
+            for entry in list(entries):
+                try:
+                    result = entry.restore(frame, **kwargs)
+                except Exception as e:
+                    log(2, f"[PersistentCache]: drop {entry.key}: {e}\n")
+                    entries.remove(entry)
+                    continue
+                if result is not None:
+                    log(2, f"[PersistentCache]: hit {frame.f_code}\n")
+                    entries.remove(entry)
+                    self.hit_count += 1
+                    return result
+        return None
+
+    def save(
+        self,
+        frame: types.FrameType,
+        custom_code: CustomCode,
+        guard_fn: Guard,
+    ):
+        """
+        Stores the translation of the frame on disk, the translations which
+        can not be serialized are skipped.
+        """
+        code_key = get_code_key(frame.f_code)
+        if code_key is None:
+            self.skipped[frame.f_code] = "the code can not be hashed"
+            return
+        with EventGuard("PersistentCache: save"):
+            try:
+                data = self.serialize(frame, custom_code, guard_fn)
+            except Exception as e:
+                log(2, f"[PersistentCache]: skip {frame.f_code}: {e}\n")
+                self.skipped[frame.f_code] = str(e)
+                return
+            entry_key = hashlib.sha256(data).hexdigest()
+            code_dir = os.path.join(ENV_SOT_CACHE_DIR.get(), code_key)
+            path = os.path.join(code_dir, f"{entry_key}.pkl")
+            if os.path.exists(path):
+                return
+            os.makedirs(code_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            log(2, f"[PersistentCache]: save {frame.f_code} to {path}\n")
+
+    def serialize(
+        self,
+        frame: types.FrameType,
+        custom_code: CustomCode,
+        guard_fn: Guard,
+    ) -> bytes:
+        guard_expr = guard_fn.expr
+        guard_lambda_expr = getattr(guard_fn, "lambda_expr", guard_expr)
+        free_vars = {}
+        if not guard_expr.startswith("lambda"):
+            free_vars = {
+                k: v
+                for k, v in guard_fn.__globals__.items()
+                if k not in ("__builtins__", GUARD_FN_NAME)
+            }
+
+        guarded_ids = {}
+        frame_objects = {}
+        for old_id, expr in parse_guarded_ids(guard_lambda_expr).items():
+            obj = trace_from_frame(expr, frame, free_vars)
+            if id(obj) != old_id:
+                raise pickle.PicklingError(f"Can not trace {expr} from frame.")
+            if is_global_object(obj):
+                guarded_ids[old_id] = ("global_object", obj)
+            else:
+                guarded_ids[old_id] = ("frame_object", expr)
+                frame_objects[old_id] = obj
+
+        code = custom_code.code
+        global_objects = {}
+        if code is not None:
+            from ...symbolic.compile_cache import FallbackWrapper
+            from .variables.basic import NullVariable
+
+            # NOTE: The names which are not used by the original code are
+            # loaded by `PyCodeGen.gen_load_object`, the others are globals
+            # of the user and are not stored.
+            origin_names = set(frame.f_code.co_names)
+            for name in code.co_names:
+                if name in origin_names or name not in frame.f_globals:
+                    continue
+                obj = frame.f_globals[name]
+                if isinstance(
+                    obj, (FallbackWrapper, NullVariable)
+                ) or is_generated_fn(obj):
+                    global_objects[name] = obj
+                elif name.startswith("__compiled_fn_"):
+                    raise pickle.PicklingError(
+                        f"Can not pickle compiled function {name}."
+                    )
+                elif is_global_object(obj):
+                    global_objects[name] = obj
+
+        header = TranslationPickler.dumps(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "guard_expr": guard_expr,
+                "guard_lambda_expr": guard_lambda_expr,
+                "free_vars": free_vars,
+                "guarded_ids": guarded_ids,
+            }
+        )
+        body = TranslationPickler.dumps(
+            (code, custom_code.disable_eval_frame, global_objects),
+            frame_objects,
+        )
+        return header + body
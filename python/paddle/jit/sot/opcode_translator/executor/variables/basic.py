@@ -24,7 +24,7 @@ import numpy as np
 import paddle
 from paddle.framework import core
 
-from ....infer_meta import MetaInfo
+from ....infer_meta import DynamicDimRecorder, MetaInfo
 from ....symbolic.statement_ir import Symbol
 from ....utils import (
     BreakGraphError,
@@ -33,6 +33,7 @@ from ....utils import (
     NameGenerator,
     paddle_tensor_methods,
     printable,
+    tmp_name_guard,
 )
 from ....utils.exceptions import HasNoAttributeError, InnerError
 from ..dispatch_functions import tensor_numel
@@ -316,7 +317,9 @@ class TensorVariable(VariableBase):
         super().__init__(graph, tracker)
         if isinstance(tensor, paddle.Tensor):
             self.value = None
-            self.meta = MetaInfo.from_tensor(tensor)
+            self.meta = MetaInfo.from_tensor(
+                tensor, dynamic_dims=self.record_dynamic_dims(tensor)
+            )
         elif isinstance(tensor, MetaInfo):
             self.value = None
             self.meta = tensor
@@ -328,6 +331,22 @@ class TensorVariable(VariableBase):
         self.var_name = TensorVariable.var_name_generator.next()
         self.graph.side_effects.record_mutable_variable(self)
 
+    def record_dynamic_dims(self, tensor: paddle.Tensor) -> tuple[int, ...]:
+        """
+        Record the shape of an input tensor, the dims whose size keeps
+        changing between calls are traced as dynamic (-1) to avoid
+        retranslating the frame for each new size.
+        """
+        recorder = DynamicDimRecorder()
+        if not recorder.enabled() or not self.tracker.is_traceable():
+            return ()
+        with tmp_name_guard():
+            frame_value_tracer = self.tracker.trace_value_from_frame()
+        code = self.graph.pycode_gen._origin_code
+        return recorder.record(
+            (code, frame_value_tracer.debug_expr), tensor.shape
+        )
+
     def __len__(self):
         if self.meta.shape[0] == -1:
             raise BreakGraphError(
@@ -373,10 +392,13 @@ class TensorVariable(VariableBase):
     @check_guard
     def make_stringify_guard(self) -> list[StringifyExpression]:
         frame_value_tracer = self.tracker.trace_value_from_frame()
+        # Only the rank, dtype and static dims are checked for dynamic dims
+        dynamic_dims = self.origin_meta.dynamic_dims()
+        meta_args = f", dynamic_dims={dynamic_dims}" if dynamic_dims else ""
 
         return [
             StringifyExpression(
-                f"MetaInfo.from_tensor({{}}).guard_str() == '{self.origin_meta.guard_str()}'",
+                f"MetaInfo.from_tensor({{}}{meta_args}).guard_str() == '{self.origin_meta.guard_str()}'",
                 [frame_value_tracer],
                 union_free_vars(
                     {"MetaInfo": MetaInfo},
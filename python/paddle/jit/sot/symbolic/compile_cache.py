@@ -90,11 +90,15 @@ class FallbackWrapper:
             false_fn=lambda x: x,
         )
 
+    def input_metas(self):
+        return [self.SIR.symbol_meta_map[symbol] for symbol in self.SIR.inputs]
+
+    def has_dynamic_input(self):
+        return any(meta.is_dynamic_shape() for meta in self.input_metas())
+
     def graph_size(self):
         if self.partial_program is None:
-            input_spec = convert_meta_to_input_spec(
-                [self.SIR.symbol_meta_map[symbol] for symbol in self.SIR.inputs]
-            )
+            input_spec = convert_meta_to_input_spec(self.input_metas())
             (
                 self.concrete_program,
                 self.partial_program,
@@ -126,6 +130,10 @@ class FallbackWrapper:
                     ].train_program
                 ),
             )
+            if self.partial_program is None and self.has_dynamic_input():
+                # Build the program from the symbolic metas, so that it
+                # serves all sizes of the dynamic dims.
+                self.graph_size()
             if self.partial_program is None:
                 with EventGuard("FallbackWrapper: get_concrete_program"):
                     (
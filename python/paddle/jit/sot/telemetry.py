@@ -0,0 +1,156 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Runtime statistics of SOT, collected per code object:
+# >>> sot.stats()  # a dict which can be dumped to JSON
+# >>> sot.export_stats(path)
+# >>> sot.reset_stats()
+
+from __future__ import annotations
+
+import json
+import types
+from collections import Counter
+from dataclasses import dataclass, field
+
+from .utils import Singleton
+
+# The reasons are truncated to keep the statistics small
+MAX_REASON_LENGTH = 200
+
+
+def format_reason(reason: object) -> str:
+    lines = str(reason).strip().splitlines()
+    return lines[0][:MAX_REASON_LENGTH] if lines else ""
+
+
+@dataclass
+class CodeStats:
+    code_name: str
+    filename: str
+    firstlineno: int
+    translate_count: int = 0
+    translate_time: float = 0.0
+    guard_time: float = 0.0
+    hit_count: int = 0
+    miss_count: int = 0
+    fallback_reasons: Counter = field(default_factory=Counter)
+    break_graphs: Counter = field(default_factory=Counter)
+    subgraph_sizes: list[int] = field(default_factory=list)
+
+    @property
+    def location(self) -> str:
+        return f"{self.code_name} ({self.filename}:{self.firstlineno})"
+
+    def to_dict(self) -> dict:
+        return {
+            "code_name": self.code_name,
+            "filename": self.filename,
+            "firstlineno": self.firstlineno,
+            "translate_count": self.translate_count,
+            "translate_time": self.translate_time,
+            "guard_time": self.guard_time,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "fallback_reasons": dict(self.fallback_reasons),
+            "break_graphs": dict(self.break_graphs),
+            "subgraph_sizes": list(self.subgraph_sizes),
+        }
+
+
+@Singleton
+class SotStats:
+    """
+    Collects the translation, guard and compilation statistics of SOT, so that
+    recompilations can be detected and attributed to their code objects.
+    """
+
+    code_stats: dict[types.CodeType, CodeStats]
+
+    def __init__(self):
+        self.code_stats = {}
+
+    def reset(self):
+        self.code_stats.clear()
+
+    def get(self, code: types.CodeType) -> CodeStats:
+        if code not in self.code_stats:
+            self.code_stats[code] = CodeStats(
+                code.co_name, code.co_filename, code.co_firstlineno
+            )
+        return self.code_stats[code]
+
+    def record_translate(self, code: types.CodeType, cost: float):
+        code_stats = self.get(code)
+        code_stats.translate_count += 1
+        code_stats.translate_time += cost
+
+    def record_guard(self, code: types.CodeType, cost: float, hit: bool):
+        code_stats = self.get(code)
+        code_stats.guard_time += cost
+        if hit:
+            code_stats.hit_count += 1
+        else:
+            code_stats.miss_count += 1
+
+    def record_fallback(self, code: types.CodeType, reason: object):
+        self.get(code).fallback_reasons[format_reason(reason)] += 1
+
+    def record_break_graph(
+        self, code: types.CodeType, lineno: int, reason: object
+    ):
+        location = f"{code.co_filename}:{lineno}: {format_reason(reason)}"
+        self.get(code).break_graphs[location] += 1
+
+    def record_subgraph(self, code: types.CodeType, size: int):
+        self.get(code).subgraph_sizes.append(size)
+
+    def to_dict(self) -> dict[str, dict]:
+        return {
+            code_stats.location: code_stats.to_dict()
+            for code_stats in self.code_stats.values()
+        }
+
+
+def stats() -> dict[str, dict]:
+    """
+    Returns the SOT statistics of each code object, keyed by
+    ``"<name> (<filename>:<firstlineno>)"``. For each code object, it reports:
+
+    - translate_count / translate_time: number and total seconds of translations.
+    - guard_time: total seconds spent in checking guards.
+    - hit_count / miss_count: number of guard hits and misses of the cache.
+    - fallback_reasons: count of each reason to fallback to dygraph.
+    - break_graphs: count of each break graph, keyed by location and reason.
+    - subgraph_sizes: op numbers of the compiled subgraphs.
+    """
+    return SotStats().to_dict()
+
+
+def reset_stats():
+    """
+    Clears all collected SOT statistics.
+    """
+    SotStats().reset()
+
+
+def export_stats(path: str):
+    """
+    Dumps the SOT statistics returned by :func:`stats` to a JSON file.
+
+    Args:
+        path (str): The path of the JSON file.
+    """
+    with open(path, "w") as f:
+        json.dump(stats(), f, indent=2)
@@ -14,12 +14,22 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, TypeVar
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Sequence, TypeVar
 
 import paddle
 
 from .opcode_translator import eval_frame_callback
-from .utils import GraphLogger, StepInfoManager, StepState, log_do
+from .opcode_translator.executor.executor_cache import OpcodeExecutorCache
+from .opcode_translator.executor.persistent_cache import PersistentCache
+from .utils import (
+    ExportError,
+    GraphLogger,
+    StepInfoManager,
+    StepState,
+    log_do,
+    sot_cache_dir_guard,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec
@@ -125,3 +135,61 @@ def symbolic_translate(fn: Callable[P, R], **kwargs) -> Callable[P, R]:
                 )
 
     return impl
+
+
+def export(
+    fn: Callable[..., Any], example_inputs: Sequence[Any], path: str, **kwargs
+) -> Any:
+    """
+    Translates the function with the example inputs and saves the translated
+    code, the guards and the compiled subgraphs of every frame to a directory,
+    which can be loaded by :func:`load` without running the opcode translator.
+
+    NOTE: The translations in memory are cleared, so that every frame called
+    by the function is translated and saved.
+
+    Args:
+        fn: The function to export.
+        example_inputs: The positional arguments to call the function with.
+        path: The directory to save the translations to.
+        kwargs: Other arguments passed to :func:`symbolic_translate`.
+
+    Returns:
+        The outputs of the function called with the example inputs.
+    """
+    OpcodeExecutorCache().clear()
+    with sot_cache_dir_guard(path):
+        outs = symbolic_translate(fn, **kwargs)(*example_inputs)
+    skipped = PersistentCache().skipped
+    if skipped:
+        reasons = "\n".join(
+            f"  {code}: {reason}" for code, reason in skipped.items()
+        )
+        raise ExportError(
+            f"Failed to export the translations of some frames:\n{reasons}"
+        )
+    return outs
+
+
+def load(fn: Callable[P, R], path: str, **kwargs) -> Callable[P, R]:
+    """
+    Returns the function running with the translations exported by
+    :func:`export`. The inputs matching the exported guards restore the
+    translations from the directory, other inputs are translated as usual.
+
+    Args:
+        fn: The function exported.
+        path: The directory the translations are exported to.
+        kwargs: Other arguments passed to :func:`symbolic_translate`.
+
+    Returns:
+        Callable, The wrapped function.
+    """
+    translated_fn = symbolic_translate(fn, **kwargs)
+
+    @functools.wraps(fn)
+    def impl(*args: P.args, **kwargs: P.kwargs) -> R:
+        with sot_cache_dir_guard(path):
+            return translated_fn(*args, **kwargs)
+
+    return impl
@@ -18,12 +18,16 @@ from .envs import (  # noqa: F401
     ENV_COST_MODEL,
     ENV_MIN_GRAPH_SIZE,
     ENV_SHOW_TRACKERS,
+    ENV_SOT_CACHE_DIR,
+    ENV_SOT_DYNAMIC_DIM_THRESHOLD,
     ENV_SOT_EXPORT,
     ENV_SOT_LOG_LEVEL,
     ENV_SOT_WITH_CONTROL_FLOW,
     ENV_STRICT_MODE,
     cost_model_guard,
+    dynamic_dim_threshold_guard,
     min_graph_size_guard,
+    sot_cache_dir_guard,
     strict_mode_guard,
     with_control_flow_guard,
     with_export_guard,
@@ -33,6 +33,10 @@ ENV_SOT_WITH_CONTROL_FLOW = BooleanEnvironmentVariable(
     "SOT_WITH_CONTROL_FLOW", True
 )
 ENV_SOT_EXPORT = StringEnvironmentVariable("SOT_EXPORT", "")
+ENV_SOT_CACHE_DIR = StringEnvironmentVariable("SOT_CACHE_DIR", "")
+ENV_SOT_DYNAMIC_DIM_THRESHOLD = IntegerEnvironmentVariable(
+    "SOT_DYNAMIC_DIM_THRESHOLD", 0
+)
 
 
 @contextmanager
@@ -63,3 +67,15 @@ def with_control_flow_guard(value: bool):
 def with_export_guard(value: str):
     with EnvironmentVariableGuard(ENV_SOT_EXPORT, value):
         yield
+
+
+@contextmanager
+def sot_cache_dir_guard(value: str):
+    with EnvironmentVariableGuard(ENV_SOT_CACHE_DIR, value):
+        yield
+
+
+@contextmanager
+def dynamic_dim_threshold_guard(value: int):
+    with EnvironmentVariableGuard(ENV_SOT_DYNAMIC_DIM_THRESHOLD, value):
+        yield
@@ -14,15 +14,17 @@
 
 import os
 import pickle
+import struct
 
 import numpy as np
 
 import paddle
 from paddle import _legacy_C_ops
 from paddle.base import backward, core, framework, unique_name
-from paddle.base.data_feeder import check_type
+from paddle.base.data_feeder import _PADDLE_DTYPE_2_NUMPY_DTYPE, check_type
 from paddle.base.dygraph.base import switch_to_static_graph
 from paddle.base.framework import OpProtoHolder
+from paddle.base.proto import framework_pb2
 from paddle.framework import in_dynamic_mode
 from paddle.jit.dy2static.partial_program import (
     LazyInitialized,
@@ -720,8 +722,70 @@ def _load_persistable_vars_by_program(
     return load_var_dict
 
 
+def _map_combined_params(var_file_path, num_vars):
+    """
+    Memory-map the tensors of a file written by `save_combine`.
+
+    The file is parsed in python following `SerializeToStream`, and each
+    tensor is returned as a read-only numpy view of the mapping, in file
+    order. The views share the page cache between processes, the data is
+    only read when the tensor is copied to the device. None is returned if
+    the file holds something that can only be loaded by `load_combine`,
+    e.g. LoD information or BF16 data.
+    """
+    uint32 = struct.Struct('<I')
+    uint64 = struct.Struct('<Q')
+    int32 = struct.Struct('<i')
+
+    file_size = os.path.getsize(var_file_path)
+    if file_size == 0:
+        return None
+    mapped = np.memmap(var_file_path, dtype=np.uint8, mode='r')
+
+    arrays = []
+    offset = 0
+    try:
+        for _ in range(num_vars):
+            # 1. DenseTensor version and LoD information
+            offset += uint32.size
+            (lod_level,) = uint64.unpack_from(mapped, offset)
+            offset += uint64.size
+            if lod_level != 0:
+                return None
+            # 2. Tensor version and TensorDesc
+            offset += uint32.size
+            (desc_size,) = int32.unpack_from(mapped, offset)
+            offset += int32.size
+            desc = framework_pb2.VarType.TensorDesc.FromString(
+                bytes(mapped[offset : offset + desc_size])
+            )
+            offset += desc_size
+            # 3. Tensor data
+            if (
+                desc.data_type == core.VarDesc.VarType.BF16
+                or desc.data_type not in _PADDLE_DTYPE_2_NUMPY_DTYPE
+            ):
+                return None
+            dtype = np.dtype(_PADDLE_DTYPE_2_NUMPY_DTYPE[desc.data_type])
+            shape = tuple(desc.dims)
+            nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            if offset + nbytes > file_size:
+                return None
+            arrays.append(
+                np.ndarray(shape, dtype=dtype, buffer=mapped, offset=offset)
+            )
+            offset += nbytes
+    except (struct.error, ValueError, TypeError):
+        return None
+
+    # NOTE: same as `load_combine`, partial data is not allowed
+    if offset != file_size:
+        return None
+    return arrays
+
+
 def _load_persistable_vars(
-    model_path, var_info_path, program_holder, params_filename
+    model_path, var_info_path, program_holder, params_filename, lazy_vars=None
 ):
     # 1. load extra var info
     with open(var_info_path, 'rb') as f:
@@ -769,12 +833,21 @@ def _load_persistable_vars(
         if len(extra_var_info) != 0:
             raise ValueError("The model to be loaded is incomplete.")
     else:
-        framework._dygraph_tracer().trace_op(
-            type='load_combine',
-            inputs={},
-            outputs={'Out': load_var_list},
-            attrs={'file_path': var_file_path},
-        )
+        arrays = None
+        if lazy_vars is not None:
+            arrays = _map_combined_params(var_file_path, len(load_var_list))
+        if arrays is not None:
+            # the data is copied into the vars on first use,
+            # see `TranslatedLayer._materialize_persistable_vars`
+            for var, array in zip(load_var_list, arrays):
+                lazy_vars[var.name] = (var, array)
+        else:
+            framework._dygraph_tracer().trace_op(
+                type='load_combine',
+                inputs={},
+                outputs={'Out': load_var_list},
+                attrs={'file_path': var_file_path},
+            )
 
     return load_var_dict
 
@@ -836,7 +909,11 @@ def _construct_program_holders(model_path, model_filename=None):
 
 
 def _construct_params_and_buffers(
-    model_path, programs, params_filename=None, append_suffix=True
+    model_path,
+    programs,
+    params_filename=None,
+    append_suffix=True,
+    lazy_vars=None,
 ):
     var_info_filename = str(params_filename) + ".info"
     var_info_path = os.path.join(model_path, var_info_filename)
@@ -844,7 +921,11 @@ def _construct_params_and_buffers(
 
     if os.path.exists(var_info_path):
         var_dict = _load_persistable_vars(
-            model_path, var_info_path, programs['forward'], params_filename
+            model_path,
+            var_info_path,
+            programs['forward'],
+            params_filename,
+            lazy_vars,
         )
         model_name = params_filename[: -len(INFER_PARAMS_SUFFIX)]
         # Load every file that meets the requirements in the directory model_path.
@@ -864,7 +945,11 @@ def _construct_params_and_buffers(
             var_info_path = os.path.join(model_path, var_info_filename)
             var_dict.update(
                 _load_persistable_vars(
-                    model_path, var_info_path, programs[func_name], file_name
+                    model_path,
+                    var_info_path,
+                    programs[func_name],
+                    file_name,
+                    lazy_vars,
                 )
             )
     elif params_filename is not None and not os.path.exists(params_path):
@@ -1419,6 +1504,8 @@ class TranslatedLayer(layers.Layer):
 
         self._is_test = True
         self._input_args_names = None
+        # persistable vars whose data is still memory-mapped, see `lazy_load`
+        self._lazy_persistable_vars = {}
 
     @staticmethod
     @framework.dygraph_only
@@ -1429,20 +1516,25 @@ class TranslatedLayer(layers.Layer):
             raise ValueError("There is no directory named '%s'" % model_path)
         model_filename = None
         params_filename = None
+        lazy_vars = None
         if configs is not None:
             model_filename = configs.model_filename
             params_filename = configs.params_filename
+            if configs.lazy_load:
+                lazy_vars = {}
 
         # 1. load program desc & construct _ProgramHolder
         programs = _construct_program_holders(model_path, model_filename)
 
         # 2. load layer parameters & buffers
         persistable_vars = _construct_params_and_buffers(
-            model_path, programs, params_filename
+            model_path, programs, params_filename, lazy_vars=lazy_vars
         )
 
         # 3. construct TranslatedLayer object
         translated_layer = TranslatedLayer(programs, persistable_vars)
+        if lazy_vars:
+            translated_layer._lazy_persistable_vars = lazy_vars
 
         # 4. create TranslatedLayer's execution method
         for method_name, program_holder in programs.items():
@@ -1467,6 +1559,7 @@ class TranslatedLayer(layers.Layer):
     def _execution_method_creator(method_name, program_holder):
         def __i_m_p_l__(self, *input):
             program_holder = self._program_holder_dict[__i_m_p_l__.__name__]
+            self._materialize_persistable_vars()
             # When using jit.save, it runs in static graph mode.
             # Run in dynamic graph mode when the model is inferring.
             if in_dynamic_mode():
@@ -1484,6 +1577,35 @@ class TranslatedLayer(layers.Layer):
         __i_m_p_l__.__name__ = method_name
         return __i_m_p_l__
 
+    def _materialize_persistable_vars(self):
+        # NOTE: copy the memory-mapped data of the persistable vars to the
+        # expected place, this only happens once, when the layer is first used
+        # or its parameters and buffers are first accessed
+        if not self._lazy_persistable_vars:
+            return
+        place = framework._current_expected_place()
+        for var, array in self._lazy_persistable_vars.values():
+            var.value().get_tensor().set(array, place)
+        self._lazy_persistable_vars = {}
+
+    # NOTE: `state_dict`, `to_static_state_dict` and `set_state_dict` all
+    # walk `_state_dict_impl`, which should not expose uninitialized vars
+    def _state_dict_impl(self, *args, **kwargs):
+        self._materialize_persistable_vars()
+        return super()._state_dict_impl(*args, **kwargs)
+
+    def named_parameters(self, prefix='', include_sublayers=True):
+        self._materialize_persistable_vars()
+        return super().named_parameters(
+            prefix=prefix, include_sublayers=include_sublayers
+        )
+
+    def named_buffers(self, prefix='', include_sublayers=True):
+        self._materialize_persistable_vars()
+        return super().named_buffers(
+            prefix=prefix, include_sublayers=include_sublayers
+        )
+
     def train(self):
         self._is_test = False
         self.training = True
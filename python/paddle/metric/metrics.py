@@ -31,6 +31,10 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _is_tensor_(var):
+    return isinstance(var, (paddle.Tensor, paddle.base.core.eager.Tensor))
+
+
 class Metric(metaclass=abc.ABCMeta):
     r"""
     Base class for metric, encapsulates metric logic and APIs
@@ -112,6 +116,11 @@ class Metric(metaclass=abc.ABCMeta):
             ...     return accs
     """
 
+    # Whether `update` accepts the metric states as Tensors and accumulates
+    # them on the device, then `paddle.Model` passes the outputs of `compute`
+    # to `update` without fetching them as numpy arrays.
+    _support_tensor_update = False
+
     def __init__(self):
         pass
 
@@ -236,6 +245,8 @@ class Accuracy(Metric):
 
     """
 
+    _support_tensor_update = True
+
     def __init__(self, topk=(1,), name=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.topk = topk
@@ -280,19 +291,28 @@ class Accuracy(Metric):
         calculate cumulative accuracy of all instances. This function also
         returns the accuracy of current step.
 
+        If `correct` is a Tensor, the states are accumulated on its device,
+        and the returned accuracy is a Tensor, so that there is no
+        synchronization until `accumulate` is called.
+
         Args:
             correct: Correct mask, a tensor with shape [batch_size, d0, ..., topk].
 
         Return:
             Tensor: the accuracy of current step.
         """
-        if isinstance(correct, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            correct = np.array(correct)
-        num_samples = np.prod(np.array(correct.shape[:-1]))
+        on_device = isinstance(
+            correct, (paddle.Tensor, paddle.base.core.eager.Tensor)
+        )
+        num_samples = int(np.prod(correct.shape[:-1]))
         accs = []
         for i, k in enumerate(self.topk):
-            num_corrects = correct[..., :k].sum()
-            accs.append(float(num_corrects) / num_samples)
+            if on_device:
+                num_corrects = correct[..., :k].astype('float64').sum()
+                accs.append(num_corrects / num_samples)
+            else:
+                num_corrects = correct[..., :k].sum()
+                accs.append(float(num_corrects) / num_samples)
             self.total[i] += num_corrects
             self.count[i] += num_samples
         accs = accs[0] if len(self.topk) == 1 else accs
@@ -395,6 +415,8 @@ class Precision(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
+    _support_tensor_update = True
+
     def __init__(self, name='precision', *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
@@ -412,7 +434,17 @@ class Precision(Metric):
             labels (numpy.ndarray): The ground truth (labels),
                 the shape should keep the same as preds.
                 The data type is 'int32' or 'int64'.
+
+        If both `preds` and `labels` are Tensors, the states are accumulated
+        on their device without synchronization until `accumulate` is called.
         """
+        if _is_tensor_(preds) and _is_tensor_(labels):
+            pred_pos = paddle.floor(preds.astype('float64') + 0.5) == 1
+            is_pos = labels.reshape(preds.shape) == 1
+            self.tp += (pred_pos & is_pos).astype('int64').sum()
+            self.fp += (pred_pos & ~is_pos).astype('int64').sum()
+            return
+
         if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
             preds = np.array(preds)
         elif not _is_numpy_(preds):
@@ -449,8 +481,9 @@ class Precision(Metric):
         Returns:
             A scaler float: results of the calculated precision.
         """
-        ap = self.tp + self.fp
-        return float(self.tp) / ap if ap != 0 else 0.0
+        tp, fp = float(self.tp), float(self.fp)
+        ap = tp + fp
+        return tp / ap if ap != 0 else 0.0
 
     def name(self):
         """
@@ -527,6 +560,8 @@ class Recall(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
+    _support_tensor_update = True
+
     def __init__(self, name='recall', *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
@@ -544,7 +579,18 @@ class Recall(Metric):
             labels(numpy.array): ground truth (labels) of current mini-batch,
                 the shape should keep the same as preds.
                 Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
+
+        If both `preds` and `labels` are Tensors, the states are accumulated
+        on their device without synchronization until `accumulate` is called.
         """
+        if _is_tensor_(preds) and _is_tensor_(labels):
+            # The same as `np.rint(preds) == 1`
+            pred_pos = (preds > 0.5) & (preds < 1.5)
+            is_pos = labels.reshape(preds.shape) == 1
+            self.tp += (pred_pos & is_pos).astype('int64').sum()
+            self.fn += (~pred_pos & is_pos).astype('int64').sum()
+            return
+
         if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
             preds = np.array(preds)
         elif not _is_numpy_(preds):
@@ -574,8 +620,9 @@ class Recall(Metric):
         Returns:
             A scaler float: results of the calculated Recall.
         """
-        recall = self.tp + self.fn
-        return float(self.tp) / recall if recall != 0 else 0.0
+        tp, fn = float(self.tp), float(self.fn)
+        recall = tp + fn
+        return tp / recall if recall != 0 else 0.0
 
     def reset(self):
         """
@@ -595,26 +642,24 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
 
-    The `auc` function creates four local variables, `true_positives`,
-    `true_negatives`, `false_positives` and `false_negatives` that are used to
-    compute the AUC. To discretize the AUC curve, a linearly spaced set of
-    thresholds is used to compute pairs of recall and precision values. The area
-    under the ROC-curve is therefore computed using the height of the recall
-    values by the false positive rate, while the area under the PR-curve is the
-    computed using the height of the precision values by the recall.
+    The predictions are counted in the histograms of the positive and negative
+    samples over a linearly spaced set of thresholds, which are used to compute
+    the pairs of recall and precision values. The area under the ROC-curve is
+    therefore computed using the height of the recall values by the false
+    positive rate, while the area under the PR-curve is computed using the
+    height of the precision values by the recall.
 
     Args:
         curve (str): Specifies the mode of the curve to be computed,
             'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         num_thresholds (int): The number of thresholds to use when
             discretizing the roc curve. Default is 4095.
-            'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
-
-    "NOTE: only implement the ROC curve type via Python now."
+        exact (bool, optional): Whether to keep all the predictions and
+            compute the exact area by sorting them instead of the histograms,
+            which is suitable for small evaluation sets. Default is False.
 
     Examples:
         .. code-block:: python
@@ -672,17 +717,27 @@ class Auc(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
+    _support_tensor_update = True
+
     def __init__(
-        self, curve='ROC', num_thresholds=4095, name='auc', *args, **kwargs
+        self,
+        curve='ROC',
+        num_thresholds=4095,
+        name='auc',
+        exact=False,
+        *args,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        if curve not in ('ROC', 'PR'):
+            raise ValueError(
+                f"The 'curve' must be 'ROC' or 'PR', but received {curve}."
+            )
         self._curve = curve
         self._num_thresholds = num_thresholds
-
-        _num_pred_buckets = num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
+        self._exact = exact
         self._name = name
+        self.reset()
 
     def update(self, preds, labels):
         """
@@ -695,7 +750,21 @@ class Auc(Metric):
             labels (numpy.array): an numpy array in the shape of
                 (batch_size, 1), labels[i] is either o or 1,
                 representing the label of the instance i.
+
+        If both `preds` and `labels` are Tensors, the histograms are
+        accumulated on their device without synchronization until
+        `accumulate` is called.
         """
+        if _is_tensor_(preds) and _is_tensor_(labels):
+            scores = preds.detach()[:, -1].astype('float64')
+            is_pos = labels.reshape([-1]) != 0
+            if self._exact:
+                self._scores.append(scores)
+                self._labels.append(is_pos)
+            else:
+                self._update_on_device(scores, is_pos)
+            return
+
         if isinstance(labels, (paddle.Tensor, paddle.base.core.eager.Tensor)):
             labels = np.array(labels)
         elif not _is_numpy_(labels):
@@ -706,19 +775,126 @@ class Auc(Metric):
         elif not _is_numpy_(preds):
             raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        # The last column is the probability of the positive class.
+        scores = preds[:, -1]
+        is_pos = labels.reshape(-1) != 0
+        if self._exact:
+            self._scores.append(scores.astype('float64'))
+            self._labels.append(is_pos)
+            return
+
+        bin_idx = (scores * self._num_thresholds).astype('int64')
+        if bin_idx.size > 0 and (
+            bin_idx.min() < 0 or bin_idx.max() > self._num_thresholds
+        ):
+            raise ValueError("The 'preds' must be in the range of [0, 1].")
+        num_buckets = self._num_thresholds + 1
+        self._stat_pos += np.bincount(bin_idx[is_pos], minlength=num_buckets)
+        self._stat_neg += np.bincount(bin_idx[~is_pos], minlength=num_buckets)
+
+    def _update_on_device(self, scores, is_pos):
+        # NOTE: The predictions out of [0, 1] are clipped instead of checked,
+        # which needs a synchronization.
+        bin_idx = paddle.clip(
+            (scores * self._num_thresholds).astype('int64'),
+            0,
+            self._num_thresholds,
+        )
+        pos = is_pos.astype('float64')
+        zeros = paddle.zeros([self._num_thresholds + 1], dtype='float64')
+        stat_pos = paddle.scatter(zeros, bin_idx, pos, overwrite=False)
+        stat_neg = paddle.scatter(zeros, bin_idx, 1 - pos, overwrite=False)
+        if self._device_stats is not None:
+            stat_pos += self._device_stats[0]
+            stat_neg += self._device_stats[1]
+        self._device_stats = (stat_pos, stat_neg)
+
+    def _fetch_device_stats(self):
+        if self._device_stats is not None:
+            stat_pos, stat_neg = self._device_stats
+            self._stat_pos = self._stat_pos + stat_pos.numpy()
+            self._stat_neg = self._stat_neg + stat_neg.numpy()
+            self._device_stats = None
+
+    def merge(self, other):
+        """
+        Merges the states of another Auc metric, e.g. the one updated by
+        another data loader worker.
+
+        Args:
+            other (Auc): The metric to be merged, it should have the same
+                `num_thresholds` and `exact` as this metric.
+        """
+        if (
+            other._exact != self._exact
+            or other._num_thresholds != self._num_thresholds
+        ):
+            raise ValueError(
+                "Only the Auc metrics with the same `num_thresholds` and "
+                "`exact` can be merged."
+            )
+        if self._exact:
+            self._scores.extend(other._scores)
+            self._labels.extend(other._labels)
+        else:
+            self._fetch_device_stats()
+            other._fetch_device_stats()
+            self._stat_pos += other._stat_pos
+            self._stat_neg += other._stat_neg
+
+    def all_reduce(self, group=None):
+        """
+        Merges the states of the metrics of all ranks in the group, so that
+        `accumulate` returns the global auc on every rank. It does nothing if
+        the distributed environment is not initialized.
+
+        Args:
+            group (Group, optional): The communication group. Default is None,
+                which means the global group.
+        """
+        if (
+            not paddle.distributed.is_initialized()
+            or paddle.distributed.get_world_size(group) <= 1
+        ):
+            return
+        if self._exact:
+            local_states = (
+                np.concatenate([*self._scores, np.zeros([0])]),
+                np.concatenate([*self._labels, np.zeros([0], dtype=bool)]),
+            )
+            all_states = []
+            paddle.distributed.all_gather_object(
+                all_states, local_states, group=group
+            )
+            self._scores = [scores for scores, _ in all_states]
+            self._labels = [labels for _, labels in all_states]
+            return
+        self._fetch_device_stats()
+        stats = paddle.to_tensor(np.stack([self._stat_pos, self._stat_neg]))
+        paddle.distributed.all_reduce(stats, group=group)
+        self._stat_pos, self._stat_neg = stats.numpy()
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
         return abs(x1 - x2) * (y1 + y2) / 2.0
 
+    def _histograms(self):
+        if not self._exact:
+            self._fetch_device_stats()
+            return self._stat_pos, self._stat_neg
+        if not self._scores:
+            return np.zeros([0]), np.zeros([0])
+        # Every distinct score is a threshold in the exact mode.
+        _, bin_idx = np.unique(
+            np.concatenate(self._scores), return_inverse=True
+        )
+        is_pos = np.concatenate(self._labels)
+        num_buckets = bin_idx.max() + 1
+        return (
+            np.bincount(bin_idx[is_pos], minlength=num_buckets),
+            np.bincount(bin_idx[~is_pos], minlength=num_buckets),
+        )
+
     def accumulate(self):
         """
         Return the area (a float score) under auc curve
@@ -726,24 +902,26 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
-            )
-            idx -= 1
-
-        return (
-            auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
+        stat_pos, stat_neg = self._histograms()
+        # The numbers of predictions above each threshold, from the highest
+        # threshold to the lowest one.
+        tot_pos = np.concatenate([[0.0], np.cumsum(stat_pos[::-1])])
+        tot_neg = np.concatenate([[0.0], np.cumsum(stat_neg[::-1])])
+        if tot_pos[-1] <= 0.0 or tot_neg[-1] <= 0.0:
+            return 0.0
+
+        if self._curve == 'ROC':
+            auc = np.sum(np.diff(tot_neg) * (tot_pos[1:] + tot_pos[:-1]) / 2.0)
+            return float(auc / tot_pos[-1] / tot_neg[-1])
+
+        # The precision is 1 when no prediction is above the threshold.
+        tot = tot_pos + tot_neg
+        precision = np.divide(
+            tot_pos, tot, out=np.ones_like(tot_pos), where=tot > 0
         )
+        recall = tot_pos / tot_pos[-1]
+        auc = np.sum(np.diff(recall) * (precision[1:] + precision[:-1]) / 2.0)
+        return float(auc)
 
     def reset(self):
         """
@@ -752,6 +930,9 @@ class Auc(Metric):
         _num_pred_buckets = self._num_thresholds + 1
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
+        self._device_stats = None
+        self._scores = []
+        self._labels = []
 
     def name(self):
         """
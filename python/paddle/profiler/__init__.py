@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .compact_trace import merge_traces
 from .profiler import (
     Profiler,
     ProfilerState,
@@ -19,10 +20,12 @@ from .profiler import (
     SummaryView,
     TracerEventType,  # noqa: F401
     export_chrome_tracing,
+    export_compact_tracing,
     export_protobuf,
     make_scheduler,
 )
 from .profiler_statistic import SortedKeys
+from .step_timer import StepTimer, step_timer
 from .utils import RecordEvent, load_profiler_result
 
 __all__ = [
@@ -31,9 +34,13 @@ __all__ = [
     'make_scheduler',
     'export_chrome_tracing',
     'export_protobuf',
+    'export_compact_tracing',
+    'merge_traces',
     'Profiler',
     'RecordEvent',
     'load_profiler_result',
     'SortedKeys',
     'SummaryView',
+    'StepTimer',
+    'step_timer',
 ]
@@ -0,0 +1,429 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import glob
+import json
+import os
+import socket
+import time
+from warnings import warn
+
+import numpy as np
+
+from paddle.base.core import TracerEventType
+
+_COMPACT_TRACE_VERSION = 1
+_COMPACT_TRACE_SUFFIX = '.paddle_trace.npz'
+
+# The columns of a compact trace, one row for each event.
+_COLUMN_DTYPES = {
+    'name': 'int32',  # index of the name in `names`
+    'type': 'int16',  # value of TracerEventType
+    'start_ns': 'int64',
+    'end_ns': 'int64',
+    'pid': 'int64',
+    'tid': 'int64',  # -1 for the device events
+    'device': 'int32',  # -1 for the host events
+    'stream': 'int64',  # -1 for the host events
+}
+
+_CommunicationKernelNames = ['nccl', 'xccl']
+
+_CLOCK_SYNC_ROUNDS = 5
+
+
+def _flatten_node_trees(node_trees):
+    r"""
+    Flatten the host, runtime and device nodes of the profiler result into
+    columns, where the names are stored once in a dictionary.
+    """
+    name_ids = {}
+    rows = {column: [] for column in _COLUMN_DTYPES}
+
+    def append(node, pid, tid, device, stream):
+        rows['name'].append(name_ids.setdefault(node.name, len(name_ids)))
+        rows['type'].append(node.type.value)
+        rows['start_ns'].append(node.start_ns)
+        rows['end_ns'].append(node.end_ns)
+        rows['pid'].append(pid)
+        rows['tid'].append(tid)
+        rows['device'].append(device)
+        rows['stream'].append(stream)
+
+    for thread_id, root_node in node_trees.items():
+        stack = list(root_node.children_node)  # skip root node
+        while stack:
+            host_node = stack.pop()
+            append(host_node, host_node.process_id, host_node.thread_id, -1, -1)
+            stack.extend(host_node.children_node)
+            for runtime_node in host_node.runtime_node:
+                append(
+                    runtime_node,
+                    runtime_node.process_id,
+                    runtime_node.thread_id,
+                    -1,
+                    -1,
+                )
+                for device_node in runtime_node.device_node:
+                    append(
+                        device_node,
+                        runtime_node.process_id,
+                        -1,
+                        device_node.device_id,
+                        device_node.stream_id,
+                    )
+
+    names = np.array(list(name_ids), dtype=str)
+    columns = {
+        column: np.array(values, dtype=_COLUMN_DTYPES[column])
+        for column, values in rows.items()
+    }
+    return names, columns
+
+
+def _save_compact_trace(profiler_result, path, rank=None, clock_offset_ns=0):
+    r"""
+    Save the profiler result to the compact trace file, which stores the events
+    in compressed columns, and is usually 10x+ smaller than the chrome tracing
+    file.
+
+    Args:
+        profiler_result(ProfilerResult): The profiler result to save.
+        path(str): The path of the file, which should end with `.npz`.
+        rank(int, optional): The rank of the trace, default is read from the
+            environment variable `PADDLE_TRAINER_ID`.
+        clock_offset_ns(int, optional): The offset of the local clock to the
+            clock of rank 0 in nanoseconds. Default: 0.
+    """
+    if rank is None:
+        rank = int(os.getenv('PADDLE_TRAINER_ID', '0'))
+    names, columns = _flatten_node_trees(profiler_result.get_data())
+    meta = {
+        'version': _COMPACT_TRACE_VERSION,
+        'rank': rank,
+        'hostname': socket.gethostname(),
+        'pid': os.getpid(),
+        'clock_offset_ns': int(clock_offset_ns),
+    }
+    np.savez_compressed(
+        path, names=names, meta=np.array(json.dumps(meta)), **columns
+    )
+
+
+def _load_compact_trace(path):
+    with np.load(path) as data:
+        meta = json.loads(str(data['meta']))
+        if meta['version'] > _COMPACT_TRACE_VERSION:
+            raise RuntimeError(
+                f"The version {meta['version']} of the compact trace '{path}' is not supported."
+            )
+        names = data['names']
+        columns = {column: data[column] for column in _COLUMN_DTYPES}
+    return meta, names, columns
+
+
+def _measure_clock_offset(group=None):
+    r"""
+    Measure the offset of the local clock to the clock of rank 0 in the group,
+    by gathering the time right after a barrier for several rounds. It must be
+    called by all ranks in the group, and returns 0 if the distributed
+    environment is not initialized.
+    """
+    import paddle.distributed as dist
+
+    if not dist.is_initialized() or dist.get_world_size(group) <= 1:
+        return 0
+    offsets = []
+    for _ in range(_CLOCK_SYNC_ROUNDS):
+        dist.barrier(group)
+        local_time = time.time_ns()
+        times = []
+        dist.all_gather_object(times, local_time, group=group)
+        offsets.append(local_time - times[0])
+    return int(np.median(offsets))
+
+
+def _communication_offsets(names, columns):
+    r"""
+    Estimate the clock offsets of the ranks to the lowest rank, by matching the
+    communication events with the same name in order. A collective operation
+    finishes at nearly the same time on all ranks, so the offset is the median
+    difference of the end time of the matched events.
+    """
+    is_communication = np.array(
+        [
+            any(kernel in name.lower() for kernel in _CommunicationKernelNames)
+            for name in names.tolist()
+        ],
+        dtype=bool,
+    )
+    types = columns['type']
+    mask = (types == TracerEventType.Communication.value) | (
+        (types == TracerEventType.Kernel.value)
+        & is_communication[columns['name']]
+    )
+
+    ranks = np.unique(columns['rank']).tolist()
+    end_times = {}
+    for rank in ranks:
+        rank_mask = mask & (columns['rank'] == rank)
+        name_ids = columns['name'][rank_mask]
+        ends = columns['end_ns'][rank_mask]
+        end_times[rank] = {
+            name_id: np.sort(ends[name_ids == name_id])
+            for name_id in np.unique(name_ids).tolist()
+        }
+
+    reference = end_times[ranks[0]]
+    offsets = {}
+    for rank in ranks:
+        diffs = []
+        for name_id, ends in end_times[rank].items():
+            if name_id not in reference:
+                continue
+            count = min(len(ends), len(reference[name_id]))
+            diffs.append(ends[:count] - reference[name_id][:count])
+        if diffs:
+            offsets[rank] = int(np.median(np.concatenate(diffs)))
+        else:
+            warn(
+                f"No communication event of rank {rank} matches rank {ranks[0]}, its clock will not be aligned."
+            )
+            offsets[rank] = 0
+    return offsets
+
+
+class MergedTrace:
+    r"""
+    The events of the traces of several ranks merged into a single timeline,
+    which are stored in columns sorted by the start time. It is returned by
+    :ref:`merge_traces <api_paddle_profiler_merge_traces>` .
+
+    Attributes:
+        names(numpy.ndarray): The names of the events, indexed by the `name`
+            column.
+        columns(dict): The columns of the events, including 'rank', 'name',
+            'type', 'start_ns', 'end_ns', 'pid', 'tid', 'device' and 'stream'.
+        clock_offsets(dict): The clock offset of each rank in nanoseconds,
+            which has been subtracted from the timestamps.
+        workers(dict): The `hostname:pid` of each rank.
+    """
+
+    def __init__(self, names, columns, clock_offsets, workers):
+        self.names = names
+        self.columns = columns
+        self.clock_offsets = clock_offsets
+        self.workers = workers
+
+    def __len__(self):
+        return len(self.columns['start_ns'])
+
+    @property
+    def ranks(self):
+        return sorted(self.clock_offsets)
+
+    def time_range(self):
+        r"""
+        Return the (start_ns, end_ns) of all the events.
+        """
+        if len(self) == 0:
+            return 0, 0
+        return (
+            int(self.columns['start_ns'].min()),
+            int(self.columns['end_ns'].max()),
+        )
+
+    def select(self, start_ns=None, end_ns=None, ranks=None):
+        r"""
+        Return the events which overlap the time window [start_ns, end_ns] and
+        belong to the ranks.
+
+        Args:
+            start_ns(int, optional): The start of the time window, default is
+                the start of the trace.
+            end_ns(int, optional): The end of the time window, default is the
+                end of the trace.
+            ranks(list, optional): The ranks to select, default is all ranks.
+
+        Returns:
+            MergedTrace: The selected events.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if start_ns is not None:
+            mask &= self.columns['end_ns'] >= start_ns
+        if end_ns is not None:
+            mask &= self.columns['start_ns'] <= end_ns
+        if ranks is not None:
+            mask &= np.isin(self.columns['rank'], list(ranks))
+        columns = {
+            column: values[mask] for column, values in self.columns.items()
+        }
+        return MergedTrace(
+            self.names,
+            columns,
+            {
+                rank: offset
+                for rank, offset in self.clock_offsets.items()
+                if ranks is None or rank in ranks
+            },
+            self.workers,
+        )
+
+    def export_chrome_tracing(
+        self, path, start_ns=None, end_ns=None, ranks=None
+    ):
+        r"""
+        Export the events in the time window to the chrome tracing file, where
+        each rank is a process lane, and each host thread or device stream is
+        a thread lane in it.
+
+        Args:
+            path(str): The path of the chrome tracing file.
+            start_ns(int, optional): The start of the time window, default is
+                the start of the trace.
+            end_ns(int, optional): The end of the time window, default is the
+                end of the trace.
+            ranks(list, optional): The ranks to export, default is all ranks.
+        """
+        trace = self.select(start_ns, end_ns, ranks)
+        base_ns = trace.time_range()[0] if start_ns is None else start_ns
+        type_names = {}
+        columns = {
+            column: values.tolist() for column, values in trace.columns.items()
+        }
+        with open(path, 'w') as f:
+            f.write('{"displayTimeUnit": "ns", "traceEvents": [\n')
+            for rank in trace.ranks:
+                worker = self.workers.get(rank, '')
+                for event in [
+                    {
+                        'name': 'process_name',
+                        'ph': 'M',
+                        'pid': rank,
+                        'args': {'name': f'Rank {rank} ({worker})'},
+                    },
+                    {
+                        'name': 'process_sort_index',
+                        'ph': 'M',
+                        'pid': rank,
+                        'args': {'sort_index': rank},
+                    },
+                ]:
+                    f.write(json.dumps(event) + ',\n')
+            for i in range(len(trace)):
+                event_type = columns['type'][i]
+                if event_type not in type_names:
+                    type_names[event_type] = TracerEventType(event_type).name
+                device = columns['device'][i]
+                if device >= 0:
+                    tid = f"GPU:{device} stream {columns['stream'][i]}"
+                else:
+                    tid = f"{columns['tid'][i]}(C++)"
+                start = columns['start_ns'][i]
+                end = columns['end_ns'][i]
+                event = {
+                    'name': str(trace.names[columns['name'][i]]),
+                    'cat': type_names[event_type],
+                    'ph': 'X',
+                    'pid': columns['rank'][i],
+                    'tid': tid,
+                    'ts': (start - base_ns) / 1000,
+                    'dur': (end - start) / 1000,
+                }
+                f.write(json.dumps(event) + ',\n')
+            f.write('{}]}\n')
+
+
+def merge_traces(dir_name, align='clock'):
+    r"""
+    Merge the compact trace files of all ranks in the directory into a single
+    timeline with aligned clocks. The files are usually exported by
+    :ref:`export_compact_tracing <api_paddle_profiler_export_compact_tracing>` ,
+    and the chrome tracing file of a time window can be exported by
+    ``MergedTrace.export_chrome_tracing`` on demand.
+
+    Args:
+        dir_name(str): The directory of the compact trace files
+            (`*.paddle_trace.npz`).
+        align(str|None, optional): How to align the clocks of the ranks.
+            'clock' subtracts the clock offsets measured when exporting with
+            `sync_clock=True`, 'communication' estimates the offsets by
+            matching the communication events of the ranks, and None keeps
+            the timestamps unchanged. Default: 'clock'.
+
+    Returns:
+        MergedTrace: The merged events of all ranks.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('It needs the traces of several ranks')
+            >>> import paddle.profiler as profiler
+            >>> trace = profiler.merge_traces('./log', align='communication')
+            >>> start_ns, end_ns = trace.time_range()
+            >>> trace.export_chrome_tracing(
+            ...     './merged.json', start_ns, start_ns + 100 * 1000 * 1000
+            ... )
+    """
+    if align not in ('clock', 'communication', None):
+        raise ValueError(
+            f"The align should be 'clock', 'communication' or None, but received {align}."
+        )
+    paths = sorted(
+        glob.glob(os.path.join(dir_name, '*' + _COMPACT_TRACE_SUFFIX))
+    )
+    if not paths:
+        raise ValueError(
+            f"No compact trace file (*{_COMPACT_TRACE_SUFFIX}) is found in '{dir_name}'."
+        )
+
+    merged_name_ids = {}
+    all_columns = []
+    clock_offsets = {}
+    workers = {}
+    for path in paths:
+        meta, names, columns = _load_compact_trace(path)
+        rank = meta['rank']
+        clock_offsets.setdefault(rank, meta['clock_offset_ns'])
+        workers.setdefault(rank, f"{meta['hostname']}:{meta['pid']}")
+        name_ids = np.array(
+            [
+                merged_name_ids.setdefault(name, len(merged_name_ids))
+                for name in names.tolist()
+            ],
+            dtype='int32',
+        )
+        columns['name'] = name_ids[columns['name']]
+        columns['rank'] = np.full(len(columns['start_ns']), rank, dtype='int32')
+        all_columns.append(columns)
+
+    names = np.array(list(merged_name_ids), dtype=str)
+    columns = {
+        column: np.concatenate([c[column] for c in all_columns])
+        for column in all_columns[0]
+    }
+
+    if align == 'communication':
+        clock_offsets = _communication_offsets(names, columns)
+    elif align is None:
+        clock_offsets = {rank: 0 for rank in clock_offsets}
+    for rank, offset in clock_offsets.items():
+        if offset != 0:
+            rank_mask = columns['rank'] == rank
+            columns['start_ns'][rank_mask] -= offset
+            columns['end_ns'][rank_mask] -= offset
+
+    order = np.argsort(columns['start_ns'], kind='stable')
+    columns = {column: values[order] for column, values in columns.items()}
+    return MergedTrace(names, columns, clock_offsets, workers)
@@ -33,6 +33,7 @@ from paddle.base.core import (
 )
 from paddle.profiler import utils
 
+from .compact_trace import _measure_clock_offset, _save_compact_trace
 from .profiler_statistic import (
     SortedKeys,
     StatisticData,
@@ -319,6 +320,70 @@ def export_protobuf(
     return handle_fn
 
 
+def export_compact_tracing(
+    dir_name: str, worker_name: Optional[str] = None, sync_clock: bool = False
+) -> Callable:
+    r"""
+    Return a callable, used for outputing tracing data to compact trace file, which stores the events in compressed columns, and is much smaller and faster to write than
+    the chrome tracing file. The files of all ranks can be merged by :ref:`merge_traces <api_paddle_profiler_merge_traces>` , which exports the chrome tracing file of a time window on demand.
+    The output file will be saved in directory ``dir_name``, and file name will be set as ``worker_name``.
+    if ``worker_name`` is not set, the default name is `[hostname]_[pid]`.
+
+    Args:
+        dir_name(str): Directory to save profiling data.
+        worker_name(str, optional): Prefix of the file name saved, default is `[hostname]_[pid]`.
+        sync_clock(bool, optional): If it is True, the offset of the local clock to the clock of rank 0 is measured by collective communication when saving, which is used
+            by ``merge_traces`` to align the clocks of ranks. In this case, all ranks must save the traces at the same step. Default: False.
+
+    Returns:
+        A callable, which takes a Profiler object as parameter and saves its data to compact trace file.
+
+    Examples:
+        The return value can be used as parameter ``on_trace_ready`` in :ref:`Profiler <api_paddle_profiler_Profiler>` .
+
+        .. code-block:: python
+
+            >>> # doctest: +REQUIRES(env:GPU)
+            >>> import paddle.profiler as profiler
+            >>> import paddle
+            >>> paddle.device.set_device('gpu')
+            >>> with profiler.Profiler(
+            ...     targets=[profiler.ProfilerTarget.CPU, profiler.ProfilerTarget.GPU],
+            ...     scheduler = (3, 10),
+            ...     on_trace_ready = profiler.export_compact_tracing('./log')
+            ... ) as p:
+            ...     for iter in range(10):
+            ...         # train()
+            ...         p.step()
+            >>> trace = profiler.merge_traces('./log')
+            >>> trace.export_chrome_tracing('./merged.json')
+    """
+    if not os.path.exists(dir_name):
+        try:
+            os.makedirs(dir_name, exist_ok=True)
+        except Exception:
+            raise RuntimeError(
+                f"Can not create directory '{dir_name}' for saving profiling results."
+            )
+
+    def handle_fn(prof):
+        nonlocal worker_name
+        if not worker_name:
+            worker_name = f"host_{socket.gethostname()}pid_{str(os.getpid())}"
+        now = datetime.datetime.now()
+        filename = '{}_time_{}.paddle_trace.npz'.format(
+            worker_name, now.strftime('%Y_%m_%d_%H_%M_%S_%f')
+        )
+        clock_offset_ns = _measure_clock_offset() if sync_clock else 0
+        _save_compact_trace(
+            prof.profiler_result,
+            os.path.join(dir_name, filename),
+            clock_offset_ns=clock_offset_ns,
+        )
+
+    return handle_fn
+
+
 def _get_supported_targets() -> Iterable[ProfilerTarget]:
     r"""
     Get the current supported profiler target in the system.
@@ -360,6 +425,9 @@ class Profiler:
         profile_memory (bool, optional): If it is True, collect tensor memory allocation and release information. Default: False.
         custom_device_types (list, optional): If targets contain profiler.ProfilerTarget.CUSTOM_DEVICE, custom_device_types select the custom device type for profiling. The default value represents all custom devices will be selected.
         with_flops (bool, optional): If it is True, the flops of the op will be calculated. Default: False.
+        incremental_summary (bool, optional): If it is True, the profiling data of every recorded step is analysed and merged into the summary when the step finishes, and then
+            dropped, so that the memory and the time of ``summary`` are bounded for a long profiling range. In this case, the profiler result used by ``export`` and ``on_trace_ready``
+            only contains the last recorded step. Default: False.
 
     Examples:
         1. profiling range [2, 5).
@@ -485,6 +553,7 @@ class Profiler:
         emit_nvtx: Optional[bool] = False,
         custom_device_types: Optional[list] = [],
         with_flops: Optional[bool] = False,
+        incremental_summary: Optional[bool] = False,
     ):
         supported_targets = _get_supported_targets()
         if targets:
@@ -547,6 +616,11 @@ class Profiler:
         self.profile_memory = profile_memory
         self.with_flops = with_flops
         self.emit_nvtx = emit_nvtx
+        self.incremental_summary = incremental_summary
+        # The merged statistic data of the steps recorded in the current (or
+        # the last finished) profiling range when incremental_summary is True.
+        self._statistic_data = None
+        self._record_finished = True
 
     def __enter__(self):
         self.start()
@@ -649,7 +723,7 @@ class Profiler:
             self.current_state == ProfilerState.RECORD
             or self.current_state == ProfilerState.RECORD_AND_RETURN
         ):
-            self.profiler_result = self.profiler.stop()
+            self._stop_and_collect()
             if self.on_trace_ready:
                 self.on_trace_ready(self)
         utils._is_profiler_used = False
@@ -691,6 +765,17 @@ class Profiler:
         self.previous_state = self.current_state
         self.step_num += 1
         self.current_state = self.scheduler(self.step_num)
+        if (
+            self.incremental_summary
+            and self.previous_state == ProfilerState.RECORD
+            and self.current_state
+            in (ProfilerState.RECORD, ProfilerState.RECORD_AND_RETURN)
+        ):
+            # Merge the finished step into the summary, and restart profiling
+            # for the next step in the same profiling range.
+            self._stop_and_collect(finished=False)
+            self.profiler.prepare()
+            self.profiler.start()
         self._trigger_action()
         self.record_event = RecordEvent(
             name=f"ProfileStep#{self.step_num}",
@@ -795,34 +880,48 @@ class Profiler:
             if (
                 self.current_state == ProfilerState.CLOSED
             ):  # RECORD_AND_RETURN -> CLOSED
-                self.profiler_result = self.profiler.stop()
+                self._stop_and_collect()
             if (
                 self.current_state == ProfilerState.READY
             ):  # RECORD_AND_RETURN -> READY
-                self.profiler_result = self.profiler.stop()
+                self._stop_and_collect()
                 self.profiler.prepare()
             if (
                 self.current_state == ProfilerState.RECORD
             ):  # RECORD_AND_RETURN -> RECORD
-                self.profiler_result = self.profiler.stop()
+                self._stop_and_collect()
                 self.profiler.prepare()
                 self.profiler.start()
             if (
                 self.current_state == ProfilerState.RECORD_AND_RETURN
             ):  # RECORD_AND_RETURN -> RECORD_AND_RETURN
-                self.profiler_result = self.profiler.stop()
+                self._stop_and_collect()
                 self.profiler.prepare()
                 self.profiler.start()
             if self.on_trace_ready:
                 self.on_trace_ready(self)
 
+    def _stop_and_collect(self, finished=True):
+        self.profiler_result = self.profiler.stop()
+        if not self.incremental_summary:
+            return
+        if self._statistic_data is None or self._record_finished:
+            self._statistic_data = StatisticData({}, {})
+        self._statistic_data.merge(
+            StatisticData(
+                self.profiler_result.get_data(),
+                self.profiler_result.get_extra_info(),
+            )
+        )
+        self._record_finished = finished
+
     def export(self, path="", format="json"):
         r"""
         Exports the tracing data to file.
 
         Args:
             path(str): file path of the output.
-            format(str, optional): output format, can be chosen from ['json', 'pb'], 'json' for chrome tracing and 'pb' for protobuf, default value is 'json'.
+            format(str, optional): output format, can be chosen from ['json', 'pb', 'npz'], 'json' for chrome tracing, 'pb' for protobuf and 'npz' for compact trace, default value is 'json'.
 
 
         Examples:
@@ -844,7 +943,10 @@ class Profiler:
                 >>> prof.export(path="./profiler_data.json", format="json")
         """
         if self.profiler_result:
-            self.profiler_result.save(path, format)
+            if format == "npz":
+                _save_compact_trace(self.profiler_result, path)
+            else:
+                self.profiler_result.save(path, format)
 
     def summary(
         self,
@@ -885,11 +987,15 @@ class Profiler:
         if isinstance(views, SummaryView):
             views = [views]
 
-        if self.profiler_result:
+        statistic_data = None
+        if self.incremental_summary:
+            statistic_data = self._statistic_data
+        elif self.profiler_result:
             statistic_data = StatisticData(
                 self.profiler_result.get_data(),
                 self.profiler_result.get_extra_info(),
             )
+        if statistic_data is not None:
             print(
                 _build_table(
                     statistic_data,
@@ -333,6 +333,33 @@ def wrap_tree(nodetrees):
     return node_statistic_tree, newresults
 
 
+def _merge_sorted_ranges(ranges, ranges_sum, other_ranges, other_sum):
+    '''
+    Merge the sorted and self merged time ranges, and return the merged ranges
+    with their sum. The ranges recorded in the later steps are appended
+    directly, so that merging step by step costs linear time.
+    '''
+    if not other_ranges:
+        return ranges, ranges_sum
+    if not ranges or other_ranges[0][0] > ranges[-1][1]:
+        ranges.extend(other_ranges)
+        return ranges, ranges_sum + other_sum
+    ranges = merge_ranges(ranges, other_ranges, is_sorted=True)
+    return ranges, sum_ranges(ranges)
+
+
+def _merge_items(items, other_items):
+    '''
+    Merge the summary items by name, the items of other_items may be moved into
+    items, so other_items should not be used after merging.
+    '''
+    for name, other_item in other_items.items():
+        if name in items:
+            items[name].merge(other_item)
+        else:
+            items[name] = other_item
+
+
 class TimeRangeSummary:
     r"""
     Analyse time ranges for each TracerEventType, and summarize the time.
@@ -402,6 +429,35 @@ class TimeRangeSummary:
                     time_ranges
                 )
 
+    def merge(self, other):
+        r"""
+        Merge the time ranges of another summary, which is usually parsed from
+        the profiling data of the later steps.
+        """
+        for event_type, time_ranges in other.CPUTimeRange.items():
+            (
+                self.CPUTimeRange[event_type],
+                self.CPUTimeRangeSum[event_type],
+            ) = _merge_sorted_ranges(
+                self.CPUTimeRange[event_type],
+                self.CPUTimeRangeSum[event_type],
+                time_ranges,
+                other.CPUTimeRangeSum[event_type],
+            )
+        for device_id, device_time_ranges in other.GPUTimeRange.items():
+            for event_type, time_ranges in device_time_ranges.items():
+                (
+                    self.GPUTimeRange[device_id][event_type],
+                    self.GPUTimeRangeSum[device_id][event_type],
+                ) = _merge_sorted_ranges(
+                    self.GPUTimeRange[device_id][event_type],
+                    self.GPUTimeRangeSum[device_id][event_type],
+                    time_ranges,
+                    other.GPUTimeRangeSum[device_id][event_type],
+                )
+        for event_type, call_times in other.call_times.items():
+            self.call_times[event_type] += call_times
+
     def get_gpu_devices(self):
         return self.GPUTimeRange.keys()
 
@@ -498,6 +554,26 @@ class DistributedSummary:
             self.communication_range, self.computation_range, is_sorted=True
         )
 
+    def merge(self, other):
+        '''
+        Merge the time ranges of another summary, which is usually parsed from
+        the profiling data of the later steps. The overlap is merged from the
+        overlaps of both summaries, since the steps do not overlap in time.
+        '''
+        self.cpu_calls += other.cpu_calls
+        self.gpu_calls += other.gpu_calls
+        for name in (
+            'cpu_communication_range',
+            'gpu_communication_range',
+            'communication_range',
+            'computation_range',
+            'overlap_range',
+        ):
+            ranges, _ = _merge_sorted_ranges(
+                getattr(self, name), 0, getattr(other, name), 0
+            )
+            setattr(self, name, ranges)
+
 
 class EventSummary:
     r"""
@@ -567,6 +643,25 @@ class EventSummary:
         def add_item(self, node):
             raise NotImplementedError
 
+        def merge(self, other):
+            self.call += other.call
+            self.cpu_time += other.cpu_time
+            self.gpu_time += other.gpu_time
+            self.general_gpu_time += other.general_gpu_time
+            self.max_cpu_time = max(self.max_cpu_time, other.max_cpu_time)
+            self.min_cpu_time = min(self.min_cpu_time, other.min_cpu_time)
+            self.max_gpu_time = max(self.max_gpu_time, other.max_gpu_time)
+            self.min_gpu_time = min(self.min_gpu_time, other.min_gpu_time)
+            self.max_general_gpu_time = max(
+                self.max_general_gpu_time, other.max_general_gpu_time
+            )
+            self.min_general_gpu_time = min(
+                self.min_general_gpu_time, other.min_general_gpu_time
+            )
+            self._flops += other._flops
+            _merge_items(self.devices, other.devices)
+            _merge_items(self.operator_inners, other.operator_inners)
+
     class DeviceItem(ItemBase):
         def add_item(self, node):
             self.call += 1
@@ -682,6 +777,25 @@ class EventSummary:
                             self.add_model_perspective_item(child)
                         deque.append(child)
 
+    def merge(self, other):
+        r"""
+        Merge the items of another summary, which should not be used after
+        merging.
+        """
+        _merge_items(self.items, other.items)
+        for thread_id, items in other.thread_items.items():
+            _merge_items(self.thread_items[thread_id], items)
+        _merge_items(self.userdefined_items, other.userdefined_items)
+        for thread_id, items in other.userdefined_thread_items.items():
+            _merge_items(self.userdefined_thread_items[thread_id], items)
+        _merge_items(
+            self.model_perspective_items, other.model_perspective_items
+        )
+        _merge_items(
+            self.memory_manipulation_items, other.memory_manipulation_items
+        )
+        _merge_items(self.kernel_items, other.kernel_items)
+
     def add_forward_item(self, operator_node):
         pass
 
@@ -791,6 +905,13 @@ class MemorySummary:
                 print("No corresponding type.")
             self.increase_size = self.allocation_size - self.free_size
 
+        def merge(self, other):
+            self.allocation_count += other.allocation_count
+            self.free_count += other.free_count
+            self.allocation_size += other.allocation_size
+            self.free_size += other.free_size
+            self.increase_size = self.allocation_size - self.free_size
+
     def __init__(self):
         self.allocated_items = collections.defaultdict(
             dict
@@ -851,6 +972,24 @@ class MemorySummary:
                         self._analyse_node_memory(host_node.name, child)
                 self._analyse_node_memory(host_node.name, host_node)
 
+    def merge(self, other):
+        r"""
+        Merge the memory items of another summary, which should not be used
+        after merging.
+        """
+        for place, items in other.allocated_items.items():
+            _merge_items(self.allocated_items[place], items)
+        for place, items in other.reserved_items.items():
+            _merge_items(self.reserved_items[place], items)
+        for place, value in other.peak_allocation_values.items():
+            self.peak_allocation_values[place] = max(
+                self.peak_allocation_values[place], value
+            )
+        for place, value in other.peak_reserved_values.items():
+            self.peak_reserved_values[place] = max(
+                self.peak_reserved_values[place], value
+            )
+
 
 class StatisticData:
     r"""
@@ -869,6 +1008,21 @@ class StatisticData:
         self.distributed_summary.parse(node_trees)
         self.memory_summary.parse(node_trees)
 
+    def merge(self, other):
+        r"""
+        Merge the analysed results of the profiling data recorded later, e.g.
+        the next steps, so that the summary of a long profiling can be built
+        step by step without holding all the node trees. The node trees of
+        the merged results are dropped, and the extra info is replaced by the
+        latest one. Note that other should not be used after merging.
+        """
+        self.node_trees = {}
+        self.extra_info = other.extra_info
+        self.time_range_summary.merge(other.time_range_summary)
+        self.event_summary.merge(other.event_summary)
+        self.distributed_summary.merge(other.distributed_summary)
+        self.memory_summary.merge(other.memory_summary)
+
 
 def _build_table(
     statistic_data,
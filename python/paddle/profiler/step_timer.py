@@ -0,0 +1,331 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .timer import Hook, benchmark
+
+# The number of sub-buckets in each power of 2 is 2 ** _SUB_BUCKET_BITS, so
+# the relative error of the recorded values is less than 1 / 128.
+_SUB_BUCKET_BITS = 7
+
+PERCENTILES = (50, 90, 99)
+
+
+def _bucket_index(value):
+    """
+    Returns the index of the log-linear bucket of the non-negative integer
+    value. The values less than 2 ** (_SUB_BUCKET_BITS + 1) have their own
+    buckets, and each power of 2 above is split into 2 ** _SUB_BUCKET_BITS
+    buckets with the same width.
+    """
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return value
+    return (shift << _SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_value(index):
+    """
+    Returns the middle value of the bucket, which is the inverse of
+    `_bucket_index`.
+    """
+    shift = (index >> _SUB_BUCKET_BITS) - 1
+    if shift <= 0:
+        return index
+    mantissa = index - (shift << _SUB_BUCKET_BITS)
+    return (mantissa << shift) + (1 << (shift - 1))
+
+
+class LogHistogram:
+    """
+    A histogram of durations with log-linear buckets like HdrHistogram, whose
+    percentiles have a relative error less than 1% with a constant cost of
+    recording. The durations are recorded in nanoseconds.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, nanoseconds):
+        index = _bucket_index(nanoseconds)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += nanoseconds
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentiles(self, percentiles):
+        """
+        Returns the values in nanoseconds of the ascending percentiles.
+        """
+        results = []
+        if self.count == 0:
+            return [0] * len(percentiles)
+        targets = iter(percentiles)
+        target = next(targets)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while seen >= target / 100.0 * self.count:
+                results.append(min(_bucket_value(index), self.max))
+                target = next(targets, None)
+                if target is None:
+                    return results
+        results.extend([self.max] * (len(percentiles) - len(results)))
+        return results
+
+
+class StepTimer:
+    """
+    An always-on step timer which keeps the rolling percentiles of the cost of
+    each phase of the training steps, such as `reader`, `forward`, `backward`,
+    `optimizer`, `communication` and the whole `batch`.
+
+    The cost of the reader is recorded by the DataLoader, and the cost of the
+    batch is recorded by `step` (also called in `Profiler.step()`), while the
+    other phases are recorded by `phase`. The percentiles are computed over the
+    latest `window` to 2 * `window` records of each phase.
+
+    NOTE: The costs are measured on the host, the asynchronous device kernels
+    are counted in the phase which waits for them.
+
+    Args:
+        window (int, optional): The number of records of each phase which the
+            percentiles are computed over. Default: 1000.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> import paddle.profiler as profiler
+
+            >>> timer = profiler.step_timer()
+            >>> timer.enable()
+            >>> linear = paddle.nn.Linear(10, 10)
+            >>> for i in range(20):
+            ...     with timer.phase('forward'):
+            ...         out = linear(paddle.rand([4, 10]))
+            ...     with timer.phase('backward'):
+            ...         out.mean().backward()
+            ...     timer.step()
+            >>> summary = timer.summary()
+            >>> timer.disable()
+    """
+
+    def __init__(self, window=1000):
+        self.window = window
+        self.enabled = False
+        self._lock = threading.Lock()
+        # {phase: [previous histogram, current histogram]}
+        self._histograms = {}
+        self._last_step = None
+        self._reader_start = None
+
+    def enable(self):
+        self.enabled = True
+        self._last_step = time.perf_counter_ns()
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+        self._last_step = time.perf_counter_ns()
+
+    def record(self, phase, seconds):
+        """
+        Records the cost in seconds of the phase.
+        """
+        if self.enabled:
+            self._record(phase, int(seconds * 1e9))
+
+    def _record(self, phase, nanoseconds):
+        with self._lock:
+            histograms = self._histograms.get(phase)
+            if histograms is None:
+                histograms = [LogHistogram(), LogHistogram()]
+                self._histograms[phase] = histograms
+            elif histograms[1].count >= self.window:
+                histograms[0] = histograms[1]
+                histograms[1] = LogHistogram()
+            histograms[1].record(nanoseconds)
+
+    @contextmanager
+    def phase(self, phase):
+        """
+        Records the cost of the code in the context as the phase.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._record(phase, time.perf_counter_ns() - start)
+
+    def step(self):
+        """
+        Records the cost of the batch since the last step.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        if self._last_step is not None:
+            self._record('batch', now - self._last_step)
+        self._last_step = now
+
+    def summary(self):
+        """
+        Returns the statistic of each phase, including the number of records
+        in the window, the average, p50, p90, p99 and the max cost in seconds.
+        """
+        with self._lock:
+            histograms = {}
+            for phase, (previous, current) in self._histograms.items():
+                histogram = LogHistogram()
+                histogram.merge(previous)
+                histogram.merge(current)
+                histograms[phase] = histogram
+
+        summary = {}
+        for phase, histogram in histograms.items():
+            if histogram.count == 0:
+                continue
+            stats = {
+                'count': histogram.count,
+                'avg': histogram.total / histogram.count / 1e9,
+            }
+            for percentile, value in zip(
+                PERCENTILES, histogram.percentiles(PERCENTILES)
+            ):
+                stats[f'p{percentile}'] = value / 1e9
+            stats['max'] = histogram.max / 1e9
+            summary[phase] = stats
+        return summary
+
+    def to_prometheus(self):
+        """
+        Returns the summary in the Prometheus text exposition format, where
+        the sum and count are also computed over the window.
+        """
+        lines = [
+            '# HELP paddle_step_phase_seconds The cost of the phases of steps.',
+            '# TYPE paddle_step_phase_seconds summary',
+        ]
+        for phase, stats in sorted(self.summary().items()):
+            for percentile in PERCENTILES:
+                lines.append(
+                    f'paddle_step_phase_seconds{{phase="{phase}",'
+                    f'quantile="{percentile / 100}"}} '
+                    f'{stats[f"p{percentile}"]:.9f}'
+                )
+            lines.append(
+                f'paddle_step_phase_seconds_sum{{phase="{phase}"}} '
+                f'{stats["avg"] * stats["count"]:.9f}'
+            )
+            lines.append(
+                f'paddle_step_phase_seconds_count{{phase="{phase}"}} '
+                f'{stats["count"]}'
+            )
+        return '\n'.join(lines) + '\n'
+
+    def start_http_server(self, port, addr=''):
+        """
+        Serves the summary in the Prometheus text format at `/metrics` in a
+        daemon thread.
+
+        Args:
+            port (int): The port to listen on, 0 means an arbitrary free port.
+            addr (str, optional): The address to listen on. Default: ''.
+
+        Returns:
+            ThreadingHTTPServer: The server, whose `server_address` is the
+            address listened on, and `shutdown()` stops it.
+        """
+        step_timer = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = step_timer.to_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header(
+                    'Content-Type', 'text/plain; version=0.0.4; charset=utf-8'
+                )
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((addr, port), MetricsHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(
+            target=server.serve_forever, name='step_timer_http', daemon=True
+        )
+        thread.start()
+        return server
+
+
+class StepTimerHook(Hook):
+    """
+    A hook recording the cost of the DataLoader and the steps of `Profiler`
+    into the global `StepTimer`.
+    """
+
+    def before_reader(self, benchmark):
+        if _step_timer_.enabled:
+            _step_timer_._reader_start = time.perf_counter_ns()
+
+    def after_reader(self, benchmark):
+        start = _step_timer_._reader_start
+        if _step_timer_.enabled and start is not None:
+            _step_timer_._record('reader', time.perf_counter_ns() - start)
+            _step_timer_._reader_start = None
+
+    def after_step(self, benchmark):
+        _step_timer_.step()
+
+
+_step_timer_ = StepTimer()
+benchmark().hooks['step_timer_hook'] = StepTimerHook()
+
+
+def step_timer():
+    """
+    Returns the global `StepTimer`, which is disabled by default.
+    """
+    return _step_timer_
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import shutil
 import tempfile
 import unittest
 
@@ -157,6 +159,155 @@ class TestDistCheckpointUtils(test_base.CommunicationTestDistBase):
 
         ckpt_dir_tmp.cleanup()
 
+    def test_read_plan(self):
+        ckpt_dir_tmp = tempfile.TemporaryDirectory()
+        ckpt_dir = ckpt_dir_tmp.name
+        w1 = paddle.arange(96, dtype='float32').reshape([4, 8, 3])
+        w2 = paddle.arange(10, dtype='int64')
+        dist.save_state_dict({"w1": w1, "w2": w2}, ckpt_dir)
+
+        load_state_dict = dist.checkpoint.load_state_dict
+        index = load_state_dict.LocalTensorIndex
+        read_items = [
+            load_state_dict.ReadItem(
+                index("w1", (0, 0, 0)), 0, (0, 0, 0), (1, 2, 0), (2, 4, 3)
+            ),
+            load_state_dict.ReadItem(
+                index("w1", (0, 0, 0)), 1, (0, 0, 0), (0, 0, 1), (4, 8, 1)
+            ),
+            load_state_dict.ReadItem(index("w2", (0,)), 0, (0,), (5,), (5,)),
+        ]
+        read_plan = load_state_dict.get_read_plan(
+            ckpt_dir, {"0_0.distcp": read_items}
+        )
+        # the slices are close enough to be merged into one read
+        self.assertEqual(len(read_plan), 1)
+        storage_chunks = load_state_dict.read_storage_chunks(
+            ckpt_dir, read_plan
+        )
+        expected = [
+            w1.numpy()[1:3, 2:6, :],
+            w1.numpy()[:, :, 1:2],
+            w2.numpy()[5:],
+        ]
+        for item, value in zip(read_items, expected):
+            key = load_state_dict.get_storage_chunk_key(item)
+            np.testing.assert_equal(storage_chunks[key], value)
+
+        merge_read_gap = load_state_dict.MERGE_READ_GAP
+        load_state_dict.MERGE_READ_GAP = 0
+        read_plan = load_state_dict.get_read_plan(
+            ckpt_dir, {"0_0.distcp": read_items}
+        )
+        load_state_dict.MERGE_READ_GAP = merge_read_gap
+        self.assertEqual(len(read_plan), 2)
+
+        state_dict = {
+            "w1": paddle.zeros([4, 8, 3], dtype='float32'),
+            "w2": paddle.zeros([10], dtype='int64'),
+        }
+        dist.load_state_dict(state_dict, ckpt_dir)
+        np.testing.assert_equal(state_dict["w1"].numpy(), w1.numpy())
+        np.testing.assert_equal(state_dict["w2"].numpy(), w2.numpy())
+        ckpt_dir_tmp.cleanup()
+
+    def test_incremental_save(self):
+        save_module = dist.checkpoint.save_state_dict
+        chunk_size = save_module.INCREMENTAL_CHUNK_SIZE
+        # 4 rows of float32 embedding with dim 16 in each chunk
+        save_module.INCREMENTAL_CHUNK_SIZE = 4 * 16 * 4
+        tmp_dir = tempfile.TemporaryDirectory()
+        ckpt_dirs = [os.path.join(tmp_dir.name, f"ckpt_{i}") for i in range(3)]
+
+        emb = paddle.randn([32, 16])
+        bias = paddle.randn([16])
+        dist.save_state_dict(
+            {"emb": emb, "bias": bias}, ckpt_dirs[0], incremental=True
+        )
+        full_size = os.path.getsize(os.path.join(ckpt_dirs[0], "0_0.distcp"))
+        for i in range(1, 3):
+            emb[i * 4 + 1] = float(i)
+            dist.save_state_dict(
+                {"emb": emb, "bias": bias},
+                ckpt_dirs[i],
+                incremental=True,
+                base_path=ckpt_dirs[i - 1],
+            )
+            metadata = paddle.load(os.path.join(ckpt_dirs[i], "0.metadata"))
+            written = [
+                index
+                for index, file_name in metadata.storage_metadata.items()
+                if file_name == "0_0.distcp"
+            ]
+            self.assertEqual(
+                written,
+                [dist.checkpoint.metadata.LocalTensorIndex("emb", (i * 4, 0))],
+            )
+            # references are resolved to the checkpoint storing the data
+            self.assertEqual(
+                metadata.storage_metadata[
+                    dist.checkpoint.metadata.LocalTensorIndex("bias", (0,))
+                ],
+                os.path.join("..", "ckpt_0", "0_0.distcp"),
+            )
+            self.assertLess(
+                os.path.getsize(os.path.join(ckpt_dirs[i], "0_0.distcp")),
+                full_size,
+            )
+        save_module.INCREMENTAL_CHUNK_SIZE = chunk_size
+
+        def check_load(path):
+            state_dict = {
+                "emb": paddle.zeros([32, 16]),
+                "bias": paddle.zeros([16]),
+            }
+            dist.load_state_dict(state_dict, path)
+            np.testing.assert_equal(state_dict["emb"].numpy(), emb.numpy())
+            np.testing.assert_equal(state_dict["bias"].numpy(), bias.numpy())
+
+        check_load(ckpt_dirs[2])
+
+        compact_dir = os.path.join(tmp_dir.name, "ckpt_compact")
+        dist.compact_state_dict(ckpt_dirs[2], compact_dir)
+        for ckpt_dir in ckpt_dirs:
+            shutil.rmtree(ckpt_dir)
+        check_load(compact_dir)
+        tmp_dir.cleanup()
+
+    def test_incremental_base_saved_twice(self):
+        save_module = dist.checkpoint.save_state_dict
+        tmp_dir = tempfile.TemporaryDirectory()
+        base_dir = os.path.join(tmp_dir.name, "base")
+        emb = paddle.randn([8, 16])
+        dist.save_state_dict({"emb": emb}, base_dir, incremental=True)
+        emb[0] = 1.0
+        dist.save_state_dict({"emb": emb}, base_dir, incremental=True)
+
+        # the later metadata takes precedence
+        storage_metadata, chunk_hashes = save_module.load_base_metadata(
+            base_dir, tmp_dir.name
+        )
+        index = dist.checkpoint.metadata.LocalTensorIndex("emb", (0, 0))
+        self.assertEqual(
+            storage_metadata[index], os.path.join("base", "0_1.distcp")
+        )
+        self.assertEqual(
+            chunk_hashes[index], save_module.compute_chunk_hash(emb.numpy())
+        )
+
+        # the files of both metadata are kept
+        compact_dir = os.path.join(tmp_dir.name, "compact")
+        dist.compact_state_dict(base_dir, compact_dir)
+        self.assertEqual(
+            sorted(
+                file
+                for file in os.listdir(compact_dir)
+                if file.endswith(".distcp")
+            ),
+            ["0_0.distcp", "0_1.distcp"],
+        )
+        tmp_dir.cleanup()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from dygraph_to_static_utils import Dy2StTestBase
+
+import paddle
+from paddle.jit.dy2static.ast_cache import ENV_TO_STATIC_CACHE_DIR
+from paddle.jit.dy2static.origin_info import global_origin_info_map
+from paddle.jit.dy2static.program_translator import FunctionCache
+from paddle.pir_utils import IrGuard, OldIrGuard
+from paddle.utils.environments import EnvironmentVariableGuard
+
+
+def dyfunc_with_if(x):
+    y = x + 1
+    if paddle.mean(y) > 0:
+        y = y * 2
+    return y
+
+
+class TestASTCache(Dy2StTestBase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_reuse_transformed_ast(self):
+        x = paddle.to_tensor(np.ones([2, 3]).astype('float32'))
+        with EnvironmentVariableGuard(
+            ENV_TO_STATIC_CACHE_DIR, self.temp_dir.name
+        ):
+            static_func = FunctionCache().convert_with_cache(dyfunc_with_if)
+            self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+
+            # A new process restores the transformed AST from disk
+            function_cache = FunctionCache()
+            with mock.patch.object(
+                function_cache._dygraph_to_static,
+                "get_static_ast",
+                side_effect=AssertionError("The AST should be cached"),
+            ):
+                cached_func = function_cache.convert_with_cache(dyfunc_with_if)
+
+        np.testing.assert_allclose(
+            static_func(x).numpy(), cached_func(x).numpy()
+        )
+        # The original information is restored for error messages
+        dygraph_file = dyfunc_with_if.__code__.co_filename
+        self.assertTrue(
+            any(
+                origin_info.location.filepath == dygraph_file
+                for origin_info in global_origin_info_map.values()
+            )
+        )
+
+    def test_not_reuse_across_ir(self):
+        with EnvironmentVariableGuard(
+            ENV_TO_STATIC_CACHE_DIR, self.temp_dir.name
+        ):
+            with OldIrGuard():
+                FunctionCache().convert_with_cache(dyfunc_with_if)
+            # The transformers applied in PIR mode are different
+            with IrGuard():
+                function_cache = FunctionCache()
+                with mock.patch.object(
+                    function_cache._dygraph_to_static,
+                    "get_static_ast",
+                    wraps=function_cache._dygraph_to_static.get_static_ast,
+                ) as get_static_ast:
+                    function_cache.convert_with_cache(dyfunc_with_if)
+                get_static_ast.assert_called_once()
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 2)
+
+    def test_disabled(self):
+        with EnvironmentVariableGuard(ENV_TO_STATIC_CACHE_DIR, ""):
+            FunctionCache().convert_with_cache(dyfunc_with_if)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import unittest
 from collections import Counter
 
@@ -21,11 +22,13 @@ from dygraph_to_static_utils import (
     enable_to_static_guard,
     test_ast_only,
     test_legacy_and_pt_and_pir,
+    test_pir_only,
 )
 from test_fetch_feed import Linear, Pool2D
 
 import paddle
-from paddle.jit.dy2static import convert_to_static
+from paddle.jit.dy2static import convert_to_static, program_translator
+from paddle.static import InputSpec
 
 
 class TestCacheProgram(Dy2StTestBase):
@@ -179,5 +182,171 @@ class TestToOutputWithCache(Dy2StTestBase):
         self.assertEqual(ret.numpy(), 5050)
 
 
+class TestBackgroundCompile(Dy2StTestBase):
+    @test_pir_only
+    @test_ast_only
+    def test_background_compile(self):
+        static_func = paddle.jit.to_static(simple_func, background_compile=True)
+        x = paddle.to_tensor(np.random.random((2, 3)).astype('float32'))
+        expected = simple_func(x).numpy()
+
+        # The first call runs in dygraph while building the program
+        np.testing.assert_allclose(static_func(x).numpy(), expected)
+        program_cache = static_func._program_cache
+        self.assertEqual(len(program_cache), 0)
+        for future in list(program_cache._pending_builds.values()):
+            future.result()
+
+        # The later calls run the built program
+        np.testing.assert_allclose(static_func(x).numpy(), expected)
+        self.assertEqual(len(program_cache), 1)
+        self.assertEqual(len(program_cache._pending_builds), 0)
+
+    @test_pir_only
+    @test_ast_only
+    def test_clear_while_building(self):
+        static_func = paddle.jit.to_static(simple_func, background_compile=True)
+        x = paddle.to_tensor(np.random.random((2, 3)).astype('float32'))
+        expected = simple_func(x).numpy()
+
+        np.testing.assert_allclose(static_func(x).numpy(), expected)
+        program_cache = static_func._program_cache
+        futures = list(program_cache._pending_builds.values())
+        program_cache.clear()
+        for future in futures:
+            self.assertTrue(future.cancelled() or future.result() is None)
+
+        # The dropped building is not added into the cleared cache
+        np.testing.assert_allclose(static_func(x).numpy(), expected)
+        self.assertEqual(len(program_cache), 0)
+        self.assertEqual(len(program_cache._pending_builds), 1)
+
+    @test_pir_only
+    @test_ast_only
+    def test_call_while_building(self):
+        static_func = paddle.jit.to_static(simple_func, background_compile=True)
+        x = paddle.to_tensor(np.random.random((2, 3)).astype('float32'))
+        expected = simple_func(x).numpy()
+
+        # Block the building by holding the build lock in another thread
+        lock_held, release = threading.Event(), threading.Event()
+
+        def hold_build_lock():
+            with program_translator._BUILD_LOCK:
+                lock_held.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_build_lock)
+        holder.start()
+        lock_held.wait()
+        try:
+            results = []
+            callers = [
+                threading.Thread(
+                    target=lambda: results.append(static_func(x).numpy())
+                )
+                for _ in range(4)
+            ]
+            for caller in callers:
+                caller.start()
+            for caller in callers:
+                caller.join()
+            # The calls run in dygraph without waiting for the building
+            self.assertEqual(len(results), 4)
+            for result in results:
+                np.testing.assert_allclose(result, expected)
+            program_cache = static_func._program_cache
+            self.assertEqual(len(program_cache), 0)
+            self.assertEqual(len(program_cache._pending_builds), 1)
+        finally:
+            release.set()
+            holder.join()
+
+    @test_ast_only
+    def test_warn_not_effective(self):
+        with self.assertWarns(UserWarning):
+            paddle.jit.to_static(
+                simple_func, full_graph=False, background_compile=True
+            )
+
+
+class TestProgramCacheCapacity(Dy2StTestBase):
+    @test_legacy_and_pt_and_pir
+    @test_ast_only
+    def test_evict_least_recently_used(self):
+        static_func = paddle.jit.to_static(simple_func)
+        program_cache = static_func._program_cache
+        program_cache.set_capacity(2)
+        x1 = paddle.ones([2, 3])
+        x2 = paddle.ones([4, 3])
+        x3 = paddle.ones([8, 3])
+
+        static_func(x1)
+        static_func(x2)
+        static_func(x1)
+        self.assertEqual(len(program_cache), 2)
+        hits = [info["hits"] for info in program_cache.info()]
+        self.assertEqual(hits, [0, 1])
+
+        # The program of x2 is the least recently used one
+        static_func(x3)
+        self.assertEqual(len(program_cache), 2)
+        hits = [info["hits"] for info in program_cache.info()]
+        self.assertEqual(hits, [1, 0])
+        sizes = [info["bytes"] for info in program_cache.info()]
+        self.assertTrue(all(size > 0 for size in sizes))
+        self.assertEqual(program_cache.estimated_bytes(), sum(sizes))
+
+        program_cache.set_capacity(max_bytes=1)
+        self.assertEqual(len(program_cache), 1)
+
+
+class TestWarmup(Dy2StTestBase):
+    @test_legacy_and_pt_and_pir
+    @test_ast_only
+    def test_warmup(self):
+        static_func = paddle.jit.to_static(simple_func)
+        input_specs = [
+            [InputSpec([2, 3], 'float32')],
+            [InputSpec([4, 3], 'float32')],
+            [InputSpec([8, 3], 'float32')],
+        ]
+        reports = static_func.warmup(input_specs)
+        self.assertEqual(len(static_func._program_cache), 3)
+        self.assertEqual(
+            [report["input_spec"] for report in reports], input_specs
+        )
+        self.assertTrue(all(not report["cached"] for report in reports))
+        self.assertTrue(all(report["compile_time"] > 0 for report in reports))
+
+        x = paddle.to_tensor(np.random.random((4, 3)).astype('float32'))
+        np.testing.assert_allclose(
+            static_func(x).numpy(), simple_func(x).numpy(), rtol=1e-05
+        )
+        # The warmed up signatures hit the cache
+        reports = static_func.warmup(input_specs[:1])
+        self.assertTrue(reports[0]["cached"])
+
+    @test_legacy_and_pt_and_pir
+    @test_ast_only
+    def test_warmup_full_cache(self):
+        static_func = paddle.jit.to_static(simple_func)
+        static_func._program_cache.set_capacity(1)
+        input_specs = [
+            [InputSpec([2, 3], 'float32')],
+            [InputSpec([4, 3], 'float32')],
+        ]
+        static_func.warmup(input_specs)
+        # The program of the first signature has been evicted
+        reports = static_func.warmup(input_specs[:1])
+        self.assertEqual(len(static_func._program_cache), 1)
+        self.assertFalse(reports[0]["cached"])
+
+    def test_sot_not_supported(self):
+        static_func = paddle.jit.to_static(simple_func, full_graph=False)
+        with self.assertRaises(RuntimeError):
+            static_func.warmup([[InputSpec([2, 3])]])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Microbenchmark of the update throughput of paddle.metric.Auc, run it by:
+# >>> python benchmark_auc.py
+# It compares the histogram update with the per-sample Python loop used by the
+# previous implementation, and reports the cost of the exact mode.
+
+import timeit
+
+import numpy as np
+
+import paddle
+
+BATCH_SIZE = 65536
+ITERS = 20
+
+
+def loop_update(stat_pos, stat_neg, num_thresholds, preds, labels):
+    for i, lbl in enumerate(labels):
+        bin_idx = int(preds[i, 1] * num_thresholds)
+        if lbl:
+            stat_pos[bin_idx] += 1.0
+        else:
+            stat_neg[bin_idx] += 1.0
+
+
+def throughput(fn, iters):
+    cost = timeit.timeit(fn, number=iters)
+    return BATCH_SIZE * iters / cost / 1e6
+
+
+def main():
+    scores = np.random.random(BATCH_SIZE)
+    preds = np.stack([1 - scores, scores], axis=1)
+    labels = np.random.randint(2, size=[BATCH_SIZE, 1])
+
+    metric = paddle.metric.Auc()
+    exact_metric = paddle.metric.Auc(exact=True)
+    stat_pos = np.zeros(metric._num_thresholds + 1)
+    stat_neg = np.zeros(metric._num_thresholds + 1)
+
+    print(f"batch size: {BATCH_SIZE}, iters: {ITERS}")
+    results = [
+        (
+            "python loop",
+            throughput(
+                lambda: loop_update(
+                    stat_pos, stat_neg, metric._num_thresholds, preds, labels
+                ),
+                1,
+            ),
+        ),
+        ("histogram", throughput(lambda: metric.update(preds, labels), ITERS)),
+        (
+            "exact",
+            throughput(lambda: exact_metric.update(preds, labels), ITERS),
+        ),
+    ]
+    for name, samples_per_second in results:
+        print(f"[{name}] update: {samples_per_second:.2f} M samples/s")
+
+    cost = timeit.timeit(exact_metric.accumulate, number=1)
+    print(
+        f"[exact] accumulate {ITERS * BATCH_SIZE} samples: {cost * 1e3:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Microbenchmark of the buffered collate function of DataLoader, run it by:
+# >>> python benchmark_dataloader_collate_buffer.py
+# It compares the collate into reused buffers with np.stack.
+
+import timeit
+
+import numpy as np
+
+from paddle.io.dataloader.collate import _BufferedCollateFn, default_collate_fn
+
+BATCH_SIZE = 32
+ITERS = 20
+
+
+def main():
+    batch = [np.random.random([3, 224, 224]).astype('float32')] * BATCH_SIZE
+    collate_fn = _BufferedCollateFn()
+    for name, fn in [
+        ('np.stack', default_collate_fn),
+        ('buffered', collate_fn),
+    ]:
+        cost = timeit.timeit(lambda: fn(batch), number=ITERS)
+        print(f"{name}: {cost / ITERS * 1000:.3f} ms/batch")
+    print(f"buffered collate stats: {collate_fn.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of the throughput of the multi-process DataLoader, run it by:
+# >>> python benchmark_dataloader_shm_ring.py
+# It compares the shared memory ring transport (FLAGS_use_shm_ring=1) with
+# the queue transport, for 1 and 4 workers.
+
+import os
+import time
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+
+IMAGE_SHAPE = [3, 64, 64]
+SAMPLE_NUM = 256
+BATCH_SIZE = 16
+
+
+class DictDataset(Dataset):
+    def __getitem__(self, idx):
+        image = np.full(IMAGE_SHAPE, idx, dtype='float32')
+        return {'image': image, 'label': np.array([idx], dtype='int64')}
+
+    def __len__(self):
+        return SAMPLE_NUM
+
+
+def batches_per_second(num_workers, use_shm_ring):
+    os.environ['FLAGS_use_shm_ring'] = '1' if use_shm_ring else '0'
+    loader = DataLoader(
+        DictDataset(), batch_size=BATCH_SIZE, num_workers=num_workers
+    )
+    start = time.time()
+    batch_num = 0
+    for data in loader:
+        data['image'].numpy()
+        batch_num += 1
+    return batch_num / (time.time() - start)
+
+
+def main():
+    paddle.disable_static()
+    for num_workers in [1, 4]:
+        queue = batches_per_second(num_workers, use_shm_ring=False)
+        ring = batches_per_second(num_workers, use_shm_ring=True)
+        print(
+            f"num_workers: {num_workers}, queue: {queue:.2f} batch/s, "
+            f"shm ring: {ring:.2f} batch/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of the batch latency of the multi-process DataLoader, run it by:
+# >>> python benchmark_multiprocess_dataloader_unordered.py
+# It compares in_order=True with in_order=False on a dataset with a few
+# slow samples.
+
+import time
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+
+SAMPLE_NUM = 64
+BATCH_SIZE = 2
+SLOW_SAMPLE_INTERVAL = 16
+
+
+class HeterogeneousDataset(Dataset):
+    def __init__(self, sample_num, slow_time=0.2, fast_time=0.005):
+        self.sample_num = sample_num
+        self.slow_time = slow_time
+        self.fast_time = fast_time
+
+    def __getitem__(self, idx):
+        if idx % SLOW_SAMPLE_INTERVAL == 0:
+            time.sleep(self.slow_time)
+        else:
+            time.sleep(self.fast_time)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+def batch_latencies(in_order, num_workers=4):
+    loader = DataLoader(
+        HeterogeneousDataset(SAMPLE_NUM),
+        batch_size=BATCH_SIZE,
+        num_workers=num_workers,
+        in_order=in_order,
+    )
+    latencies = []
+    start = time.time()
+    for data in loader:
+        latencies.append(time.time() - start)
+        start = time.time()
+    return latencies
+
+
+def main():
+    paddle.disable_static()
+    for in_order in [True, False]:
+        latencies = batch_latencies(in_order)
+        print(
+            f"in_order={in_order}: "
+            f"p50 {np.percentile(latencies, 50) * 1000:.2f} ms, "
+            f"p99 {np.percentile(latencies, 99) * 1000:.2f} ms, "
+            f"total {np.sum(latencies):.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of the time to the first parameter of paddle.load, run it by:
+# >>> python benchmark_paddle_save_load_archive.py
+# It compares the pickle format with the archive format, whose tensors are
+# read lazily on first access.
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import paddle
+
+NUM_WEIGHTS = 32
+WEIGHT_SHAPE = [512, 512]
+
+
+def main():
+    paddle.disable_static()
+    state_dict = {
+        f'weight_{i}': paddle.randn(WEIGHT_SHAPE) for i in range(NUM_WEIGHTS)
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'model.pdparams')
+        for use_archive_format in [False, True]:
+            paddle.save(state_dict, path, use_archive_format=use_archive_format)
+            start = time.time()
+            loaded = paddle.load(path, return_numpy=True)
+            first = loaded['weight_0']
+            first_cost = time.time() - start
+            np.testing.assert_array_equal(first, state_dict['weight_0'].numpy())
+            print(
+                f"use_archive_format={use_archive_format}: "
+                f"time to first parameter {first_cost * 1000:.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
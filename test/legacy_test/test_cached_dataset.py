@@ -0,0 +1,171 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from PIL import Image
+
+import paddle
+from paddle.io import CachedDataset, DataLoader, Dataset
+from paddle.io.dataloader.dataset import _sample_nbytes
+
+IMAGE_SIZE = 32
+
+
+class CountingDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+        self.load_count = 0
+
+    def __getitem__(self, idx):
+        self.load_count += 1
+        image = np.full([IMAGE_SIZE], idx, dtype='float32')
+        return {'image': image, 'label': idx, 'name': f'sample_{idx}'}
+
+    def __len__(self):
+        return self.sample_num
+
+
+class PILDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        image = Image.new('RGB', (IMAGE_SIZE, IMAGE_SIZE), (idx, idx, idx))
+        encoded = bytes(IMAGE_SIZE * IMAGE_SIZE)
+        return image, encoded, idx
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestCachedDatasetMemory(unittest.TestCase):
+    def test_hit(self):
+        dataset = CountingDataset(10)
+        cached = CachedDataset(dataset)
+        for _ in range(3):
+            for i in range(len(cached)):
+                sample = cached[i]
+                self.assertEqual(sample['label'], i)
+                self.assertEqual(sample['name'], f'sample_{i}')
+                np.testing.assert_array_equal(
+                    sample['image'], np.full([IMAGE_SIZE], i, 'float32')
+                )
+        self.assertEqual(dataset.load_count, 10)
+        stats = cached.stats()
+        self.assertEqual(stats['misses'], 10)
+        self.assertEqual(stats['memory_hits'], 20)
+        self.assertAlmostEqual(stats['hit_rate'], 20 / 30)
+        self.assertEqual(
+            stats['memory_bytes'],
+            sum(_sample_nbytes(dataset[i]) for i in range(10)),
+        )
+
+        cached.reset_stats()
+        self.assertEqual(cached.stats()['hits'], 0)
+
+    def test_lru_eviction(self):
+        dataset = CountingDataset(10)
+        sample_nbytes = _sample_nbytes(CountingDataset(1)[0])
+        cached = CachedDataset(dataset, memory_cache_size=4 * sample_nbytes)
+        for i in range(10):
+            cached[i]
+        self.assertEqual(cached.stats()['evictions'], 6)
+        self.assertLessEqual(cached.stats()['memory_bytes'], 4 * sample_nbytes)
+        # most recent samples are kept
+        cached[9]
+        self.assertEqual(cached.stats()['memory_hits'], 1)
+        cached[0]
+        self.assertEqual(dataset.load_count, 11)
+
+    def test_pil_eviction(self):
+        # PIL images and encoded bytes are counted into the memory tier
+        sample_nbytes = _sample_nbytes(PILDataset(1)[0])
+        self.assertGreater(sample_nbytes, IMAGE_SIZE * IMAGE_SIZE * (3 + 1))
+        cached = CachedDataset(
+            PILDataset(10), memory_cache_size=4 * sample_nbytes
+        )
+        for i in range(10):
+            image, _, label = cached[i]
+            self.assertEqual(label, i)
+            self.assertEqual(image.getpixel((0, 0)), (i, i, i))
+        self.assertEqual(cached.stats()['evictions'], 6)
+        self.assertLessEqual(cached.stats()['memory_bytes'], 4 * sample_nbytes)
+
+    def test_transform(self):
+        dataset = CountingDataset(4)
+        cached = CachedDataset(dataset, transform=lambda s: s['image'] + 1)
+        for _ in range(2):
+            for i in range(len(cached)):
+                np.testing.assert_array_equal(
+                    cached[i], np.full([IMAGE_SIZE], i + 1, 'float32')
+                )
+        self.assertEqual(dataset.load_count, 4)
+
+
+class TestCachedDatasetDisk(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, 'cache')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_disk_tier(self):
+        dataset = CountingDataset(8)
+        cached = CachedDataset(
+            dataset, memory_cache_size=0, cache_dir=self.cache_dir
+        )
+        for i in range(len(cached)):
+            cached[i]
+        self.assertGreater(cached.stats()['disk_bytes_written'], 0)
+
+        # a new wrapper shares the cache directory
+        dataset = CountingDataset(8)
+        cached = CachedDataset(
+            dataset, memory_cache_size=0, cache_dir=self.cache_dir
+        )
+        for i in range(len(cached)):
+            sample = cached[i]
+            self.assertEqual(sample['label'], i)
+            np.testing.assert_array_equal(
+                sample['image'], np.full([IMAGE_SIZE], i, 'float32')
+            )
+            # copy-on-write mapping, cache file is not modified
+            sample['image'][:] = -1
+        self.assertEqual(dataset.load_count, 0)
+        stats = cached.stats()
+        self.assertEqual(stats['disk_hits'], 8)
+        self.assertEqual(stats['disk_bytes_read'], 8 * IMAGE_SIZE * 4)
+        np.testing.assert_array_equal(
+            cached[3]['image'], np.full([IMAGE_SIZE], 3, 'float32')
+        )
+
+    def test_dataloader_workers(self):
+        paddle.disable_static()
+        cached = CachedDataset(CountingDataset(16), cache_dir=self.cache_dir)
+        loader = DataLoader(cached, batch_size=4, num_workers=2)
+        for _ in range(2):
+            labels = []
+            for data in loader:
+                labels.extend(data['label'].numpy().flatten().tolist())
+            self.assertEqual(labels, list(range(16)))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.collate import _BufferedCollateFn, default_collate_fn
+
+BATCH_SIZE = 8
+
+
+def make_batch(start, batch_size=BATCH_SIZE):
+    return [
+        {
+            'image': np.full([3, 8, 8], i, dtype='float32'),
+            'meta': [np.array([i], dtype='int64'), i, f'name_{i}'],
+        }
+        for i in range(start, start + batch_size)
+    ]
+
+
+def assert_batch_equal(test, out, expected):
+    np.testing.assert_array_equal(out['image'], expected['image'])
+    np.testing.assert_array_equal(out['meta'][0], expected['meta'][0])
+    np.testing.assert_array_equal(out['meta'][1], expected['meta'][1])
+    test.assertEqual(out['meta'][2], expected['meta'][2])
+
+
+class TestBufferedCollateFn(unittest.TestCase):
+    def test_nested_structure(self):
+        collate_fn = _BufferedCollateFn()
+        for start in [0, 8, 16]:
+            batch = make_batch(start)
+            assert_batch_equal(
+                self, collate_fn(batch), default_collate_fn(batch)
+            )
+
+    def test_reuse_buffer(self):
+        collate_fn = _BufferedCollateFn(reuse_buffer=True)
+        out1 = collate_fn(make_batch(0))
+        out2 = collate_fn(make_batch(8))
+        self.assertIs(out1['image'], out2['image'])
+        stats = collate_fn.stats()
+        self.assertEqual(stats['batches'], 2)
+        # 'image' and 'meta'[0] fields
+        self.assertEqual(stats['allocations'], 2)
+        self.assertEqual(stats['reuses'], 2)
+        self.assertEqual(stats['copies'], 4 * BATCH_SIZE)
+
+        # new signature for last incomplete batch
+        collate_fn(make_batch(16, 3))
+        self.assertEqual(collate_fn.stats()['allocations'], 4)
+
+        collate_fn.reset_stats()
+        self.assertEqual(collate_fn.stats()['batches'], 0)
+
+    def test_no_reuse_buffer(self):
+        collate_fn = _BufferedCollateFn(reuse_buffer=False)
+        out1 = collate_fn(make_batch(0))
+        out2 = collate_fn(make_batch(8))
+        self.assertIsNot(out1['image'], out2['image'])
+        self.assertEqual(collate_fn.stats()['reuses'], 0)
+        self.assertEqual(collate_fn.stats()['allocations'], 4)
+
+    def test_mismatch_shape(self):
+        collate_fn = _BufferedCollateFn()
+        batch = [np.zeros([2]), np.zeros([3])]
+        self.assertRaises(ValueError, collate_fn, batch)
+
+
+class SimpleDataset(Dataset):
+    def __getitem__(self, idx):
+        return make_batch(idx, 1)[0]
+
+    def __len__(self):
+        return 32
+
+
+class TestDataLoaderCollateBuffer(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        os.environ['FLAGS_reuse_collate_buffer'] = '1'
+
+    def tearDown(self):
+        os.environ.pop('FLAGS_reuse_collate_buffer')
+
+    def run_loader(self, num_workers):
+        loader = DataLoader(
+            SimpleDataset(), batch_size=BATCH_SIZE, num_workers=num_workers
+        )
+        loader_iter = iter(loader)
+        for i, data in enumerate(loader_iter):
+            labels = data['meta'][0].numpy().flatten()
+            np.testing.assert_array_equal(
+                labels, np.arange(i * BATCH_SIZE, (i + 1) * BATCH_SIZE)
+            )
+            np.testing.assert_array_equal(
+                data['image'].numpy()[:, 0, 0, 0], labels.astype('float32')
+            )
+        return loader, loader_iter
+
+    def check_collate_stats(self, stats):
+        batch_num = len(SimpleDataset()) // BATCH_SIZE
+        self.assertEqual(stats['batches'], batch_num)
+        # 'image' and 'meta'[0] fields of each sample
+        self.assertEqual(stats['copies'], 2 * len(SimpleDataset()))
+        self.assertEqual(stats['allocations'] + stats['reuses'], 2 * batch_num)
+        image_bytes = 3 * 8 * 8 * 4
+        label_bytes = 8
+        self.assertEqual(
+            stats['bytes_copied'],
+            len(SimpleDataset()) * (image_bytes + label_bytes),
+        )
+
+    def test_single_process(self):
+        loader, loader_iter = self.run_loader(0)
+        self.check_collate_stats(loader.collate_stats())
+        self.assertEqual(loader.collate_stats()['allocations'], 2)
+
+    def test_multi_process(self):
+        loader, loader_iter = self.run_loader(2)
+        # counters of the workers are summed up
+        self.check_collate_stats(loader.collate_stats())
+        self.assertEqual(loader_iter.collate_stats(), loader.collate_stats())
+
+    def test_collate_stats_disabled(self):
+        os.environ['FLAGS_reuse_collate_buffer'] = '0'
+        loader = DataLoader(SimpleDataset(), batch_size=BATCH_SIZE)
+        self.assertIsNone(loader.collate_stats())
+        loader_iter = iter(loader)
+        next(loader_iter)
+        self.assertIsNone(loader.collate_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
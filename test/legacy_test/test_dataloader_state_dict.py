@@ -0,0 +1,271 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import (
+    BatchSampler,
+    DataLoader,
+    Dataset,
+    DistributedBatchSampler,
+    IterableDataset,
+    RandomSampler,
+    Sampler,
+    SubsetRandomSampler,
+    WeightedRandomSampler,
+    get_worker_info,
+)
+
+SAMPLE_NUM = 100
+BATCH_SIZE = 8
+
+
+class IndexDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+        self.read_indices = []
+
+    def __getitem__(self, idx):
+        self.read_indices.append(idx)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class SplitIterableDataset(IterableDataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __iter__(self):
+        worker_info = get_worker_info()
+        if worker_info is None:
+            start, end = 0, self.sample_num
+        else:
+            per_worker = int(
+                math.ceil(self.sample_num / float(worker_info.num_workers))
+            )
+            start = worker_info.id * per_worker
+            end = min(start + per_worker, self.sample_num)
+        for i in range(start, end):
+            yield np.array([i]).astype('int64')
+
+
+class ChunkBatchSampler(Sampler):
+    def __init__(self, sample_num, batch_size):
+        self.sample_num = sample_num
+        self.batch_size = batch_size
+
+    def __iter__(self):
+        for start in range(0, self.sample_num, self.batch_size):
+            yield list(
+                range(start, min(start + self.batch_size, self.sample_num))
+            )
+
+    def __len__(self):
+        return int(math.ceil(self.sample_num / float(self.batch_size)))
+
+
+class ReversedBatchSampler(BatchSampler):
+    def __iter__(self):
+        batches = list(super().__iter__())
+        yield from reversed(batches)
+
+
+def batch_to_list(data):
+    return data.numpy().flatten().tolist()
+
+
+class TestBatchSamplerStateDict(unittest.TestCase):
+    def test_random_sampler(self):
+        bs = BatchSampler(
+            sampler=RandomSampler(range(SAMPLE_NUM)), batch_size=BATCH_SIZE
+        )
+        list(bs)
+        bs_iter = iter(bs)
+        for _ in range(3):
+            next(bs_iter)
+        state = bs.state_dict()
+        self.assertEqual(state['num_consumed_batches'], 3)
+        expected = list(bs_iter)
+
+        bs = BatchSampler(
+            sampler=RandomSampler(range(SAMPLE_NUM)), batch_size=BATCH_SIZE
+        )
+        bs.load_state_dict(state)
+        self.assertEqual(list(bs), expected)
+
+    def test_distributed_batch_sampler(self):
+        bs = DistributedBatchSampler(
+            range(SAMPLE_NUM),
+            batch_size=BATCH_SIZE,
+            num_replicas=2,
+            rank=0,
+            shuffle=True,
+        )
+        list(bs)
+        bs_iter = iter(bs)
+        next(bs_iter)
+        next(bs_iter)
+        state = bs.state_dict()
+        self.assertEqual(state, {'epoch': 1, 'num_consumed_batches': 2})
+        expected = list(bs_iter)
+
+        bs = DistributedBatchSampler(
+            range(SAMPLE_NUM),
+            batch_size=BATCH_SIZE,
+            num_replicas=2,
+            rank=0,
+            shuffle=True,
+        )
+        bs.load_state_dict(state)
+        self.assertEqual(list(bs), expected)
+        self.assertEqual(bs.epoch, 2)
+
+    def test_random_sampler_keep_global_rng(self):
+        sampler = RandomSampler(range(SAMPLE_NUM))
+        list(sampler)
+        state = sampler.state_dict()
+
+        np.random.seed(2024)
+        expected = np.random.random_sample(4)
+        np.random.seed(2024)
+        sampler.load_state_dict(state)
+        list(sampler)
+        np.testing.assert_array_equal(np.random.random_sample(4), expected)
+
+    def test_stateless_random_samplers(self):
+        samplers = [
+            WeightedRandomSampler([0.1, 0.3, 0.6], num_samples=3),
+            SubsetRandomSampler([1, 3, 5]),
+        ]
+        for sampler in samplers:
+            with self.assertWarns(UserWarning):
+                sampler.load_state_dict(sampler.state_dict())
+
+
+class TestDataLoaderStateDict(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def run_resume(self, num_workers, shuffle, num_consumed):
+        dataset = IndexDataset(SAMPLE_NUM)
+        loader = DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            shuffle=shuffle,
+            num_workers=num_workers,
+        )
+        loader_iter = iter(loader)
+        for _ in range(num_consumed):
+            next(loader_iter)
+        state = loader.state_dict()
+        self.assertEqual(state['num_consumed_batches'], num_consumed)
+        expected = [batch_to_list(d) for d in loader_iter]
+
+        dataset = IndexDataset(SAMPLE_NUM)
+        loader = DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            shuffle=shuffle,
+            num_workers=num_workers,
+        )
+        loader.load_state_dict(state)
+        results = [batch_to_list(d) for d in loader]
+        self.assertEqual(results, expected)
+        if num_workers == 0:
+            # consumed samples are never read again
+            self.assertEqual(
+                sorted(dataset.read_indices), sorted(sum(expected, []))
+            )
+
+        # the following epoch starts from the beginning
+        self.assertEqual(len(list(loader)), len(loader))
+
+    def test_single_process(self):
+        self.run_resume(0, False, 3)
+        self.run_resume(0, True, 5)
+
+    def test_multi_process(self):
+        self.run_resume(2, False, 3)
+        self.run_resume(2, True, 5)
+
+    def run_resume_batch_sampler(self, batch_sampler):
+        loader = DataLoader(
+            IndexDataset(SAMPLE_NUM), batch_sampler=batch_sampler
+        )
+        loader_iter = iter(loader)
+        for _ in range(3):
+            next(loader_iter)
+        state = loader.state_dict()
+        expected = [batch_to_list(d) for d in loader_iter]
+
+        loader = DataLoader(
+            IndexDataset(SAMPLE_NUM), batch_sampler=batch_sampler
+        )
+        loader.load_state_dict(state)
+        self.assertEqual([batch_to_list(d) for d in loader], expected)
+
+    def test_custom_batch_sampler(self):
+        # consumed batches are skipped by the DataLoader if the batch
+        # sampler can not skip them by itself
+        self.run_resume_batch_sampler(ChunkBatchSampler(SAMPLE_NUM, BATCH_SIZE))
+        self.run_resume_batch_sampler(
+            ReversedBatchSampler(
+                IndexDataset(SAMPLE_NUM), batch_size=BATCH_SIZE
+            )
+        )
+
+    def test_resume_twice(self):
+        loader = DataLoader(IndexDataset(SAMPLE_NUM), batch_size=BATCH_SIZE)
+        loader_iter = iter(loader)
+        for _ in range(2):
+            next(loader_iter)
+        loader.load_state_dict(loader.state_dict())
+        loader_iter = iter(loader)
+        next(loader_iter)
+        self.assertEqual(loader.state_dict()['num_consumed_batches'], 3)
+
+    def test_iterable_dataset(self):
+        for num_workers in [0, 2]:
+            loader = DataLoader(
+                SplitIterableDataset(SAMPLE_NUM),
+                batch_size=BATCH_SIZE,
+                num_workers=num_workers,
+            )
+            loader_iter = iter(loader)
+            consumed = []
+            for _ in range(4):
+                consumed.extend(batch_to_list(next(loader_iter)))
+            state = loader.state_dict()
+            self.assertEqual(
+                len(state['worker_consumed_batches']), max(num_workers, 1)
+            )
+
+            loader = DataLoader(
+                SplitIterableDataset(SAMPLE_NUM),
+                batch_size=BATCH_SIZE,
+                num_workers=num_workers,
+            )
+            loader.load_state_dict(state)
+            rest = sum([batch_to_list(d) for d in loader], [])
+            self.assertEqual(sorted(consumed + rest), list(range(SAMPLE_NUM)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1819,5 +1819,89 @@ class TestNotJitForward(unittest.TestCase):
         shutil.rmtree(save_dir)
 
 
+class TestJitLoadLazy(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        paddle.disable_static()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_lazy_load(self):
+        layer = LinearNetWithInputSpec(784, 1)
+        path = os.path.join(self.temp_dir.name, "lazy_load/model")
+        paddle.jit.save(layer, path)
+
+        x = paddle.randn([2, 784], 'float32')
+        eager_layer = paddle.jit.load(path)
+        lazy_layer = paddle.jit.load(path, lazy_load=True)
+        self.assertEqual(
+            len(lazy_layer._lazy_persistable_vars),
+            len(eager_layer.state_dict()),
+        )
+
+        np.testing.assert_array_equal(
+            eager_layer(x).numpy(), lazy_layer(x).numpy()
+        )
+        self.assertEqual(len(lazy_layer._lazy_persistable_vars), 0)
+
+        eager_state_dict = eager_layer.state_dict()
+        lazy_state_dict = lazy_layer.state_dict()
+        for name, value in eager_state_dict.items():
+            np.testing.assert_array_equal(
+                value.numpy(), lazy_state_dict[name].numpy()
+            )
+
+    def test_lazy_load_state_dict(self):
+        layer = LinearNetWithInputSpec(784, 1)
+        path = os.path.join(self.temp_dir.name, "lazy_load_state_dict/model")
+        paddle.jit.save(layer, path)
+
+        eager_layer = paddle.jit.load(path)
+        lazy_layer = paddle.jit.load(path, lazy_load=True)
+        lazy_state_dict = lazy_layer.state_dict()
+        self.assertEqual(len(lazy_layer._lazy_persistable_vars), 0)
+        for name, value in eager_layer.state_dict().items():
+            self.assertEqual(value.shape, lazy_state_dict[name].shape)
+            np.testing.assert_array_equal(
+                value.numpy(), lazy_state_dict[name].numpy()
+            )
+
+    def test_lazy_load_set_state_dict(self):
+        layer = LinearNetWithInputSpec(784, 1)
+        path = os.path.join(self.temp_dir.name, "lazy_load_set_state/model")
+        paddle.jit.save(layer, path)
+
+        eager_layer = paddle.jit.load(path)
+        lazy_layer = paddle.jit.load(path, lazy_load=True)
+        for param in lazy_layer.parameters():
+            self.assertTrue(param._is_initialized())
+
+        lazy_layer = paddle.jit.load(path, lazy_load=True)
+        state_dict = {
+            name: paddle.full_like(value, 0.5)
+            for name, value in eager_layer.state_dict().items()
+        }
+        eager_layer.set_state_dict(state_dict)
+        missing_keys, unexpected_keys = lazy_layer.set_state_dict(state_dict)
+        self.assertEqual(missing_keys, [])
+        self.assertEqual(unexpected_keys, [])
+
+        # the data in the file does not overwrite the loaded state_dict
+        x = paddle.randn([2, 784], 'float32')
+        np.testing.assert_array_equal(
+            eager_layer(x).numpy(), lazy_layer(x).numpy()
+        )
+        for name, value in lazy_layer.state_dict().items():
+            np.testing.assert_array_equal(
+                value.numpy(), state_dict[name].numpy()
+            )
+
+    def test_lazy_load_error(self):
+        path = os.path.join(self.temp_dir.name, "lazy_load_error/model")
+        with self.assertRaises(TypeError):
+            paddle.jit.load(path, lazy_load=1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -179,6 +179,31 @@ class TestAccuracyDynamic(unittest.TestCase):
                 assert np.sum(acc.total) == 0
                 assert np.sum(acc.count) == 0
 
+    def test_update_with_tensor(self):
+        with base.dygraph.guard(base.CPUPlace()):
+            acc = paddle.metric.Accuracy(topk=self.topk, name=self.name)
+            preds, labels = [], []
+            for _ in range(5):
+                label, pred = self.random_pred_label()
+                preds.append(pred)
+                labels.append(label)
+                state = to_list(
+                    acc.compute(paddle.to_tensor(pred), paddle.to_tensor(label))
+                )
+                # The states are accumulated as Tensors
+                step_acc = acc.update(*state)
+                for a in to_list(step_acc):
+                    self.assertIsInstance(a, paddle.Tensor)
+            res_m = acc.accumulate()
+            res_f = accuracy(
+                np.concatenate(preds), np.concatenate(labels), self.topk
+            )
+            np.testing.assert_allclose(
+                np.array(res_m, dtype='float64'),
+                np.array(res_f, dtype='float64'),
+                rtol=1e-3,
+            )
+
 
 class TestAccuracyDynamicMultiTopk(TestAccuracyDynamic):
     def setUp(self):
@@ -354,6 +379,74 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_exact(self):
+        x = np.array([[0.5, 0.5], [0.5, 0.5], [0.2, 0.8], [0.7, 0.3]])
+        y = np.array([[1], [0], [1], [0]])
+        m = paddle.metric.Auc(exact=True)
+        m.update(x, y)
+        # The tied scores are counted as half correct
+        self.assertAlmostEqual(m.accumulate(), 0.875)
+
+    def test_auc_pr(self):
+        x = np.array([[0.1, 0.9], [0.2, 0.8], [0.4, 0.6], [0.7, 0.3]])
+        y = np.array([[1], [0], [1], [0]])
+        m = paddle.metric.Auc(curve='PR', exact=True)
+        m.update(x, y)
+        # (recall, precision): (0, 1), (0.5, 1), (0.5, 0.5), (1, 2 / 3)
+        self.assertAlmostEqual(m.accumulate(), 0.5 + 0.5 * (0.5 + 2 / 3) / 2)
+
+    def test_auc_histogram_close_to_exact(self):
+        np.random.seed(2024)
+        scores = np.random.random(1000)
+        x = np.stack([1 - scores, scores], axis=1)
+        y = (np.random.random([1000, 1]) < scores[:, None]).astype('int64')
+        for curve in ['ROC', 'PR']:
+            m = paddle.metric.Auc(curve=curve)
+            exact_m = paddle.metric.Auc(curve=curve, exact=True)
+            m.update(x, y)
+            exact_m.update(x, y)
+            self.assertAlmostEqual(
+                m.accumulate(), exact_m.accumulate(), places=3
+            )
+
+    def test_auc_tensor_on_device(self):
+        np.random.seed(2024)
+        x = np.random.random([64, 2])
+        y = np.random.randint(2, size=[64, 1])
+        for curve in ['ROC', 'PR']:
+            m = paddle.metric.Auc(curve=curve)
+            device_m = paddle.metric.Auc(curve=curve)
+            for i in range(0, 64, 16):
+                m.update(x[i : i + 16], y[i : i + 16])
+                device_m.update(
+                    paddle.to_tensor(x[i : i + 16]),
+                    paddle.to_tensor(y[i : i + 16]),
+                )
+            self.assertAlmostEqual(m.accumulate(), device_m.accumulate())
+
+    def test_auc_merge(self):
+        np.random.seed(2024)
+        x = np.random.random([16, 2])
+        y = np.random.randint(2, size=[16, 1])
+        m = paddle.metric.Auc()
+        m.update(x, y)
+        m1 = paddle.metric.Auc()
+        m1.update(x[:8], y[:8])
+        m2 = paddle.metric.Auc()
+        m2.update(x[8:], y[8:])
+        m1.merge(m2)
+        self.assertAlmostEqual(m1.accumulate(), m.accumulate())
+
+        with self.assertRaises(ValueError):
+            m1.merge(paddle.metric.Auc(exact=True))
+
+    def test_auc_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            paddle.metric.Auc(curve='DET')
+        m = paddle.metric.Auc()
+        with self.assertRaises(ValueError):
+            m.update(np.array([[0.5, 1.5]]), np.array([[1]]))
+
 
 if __name__ == '__main__':
     unittest.main()
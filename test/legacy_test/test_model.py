@@ -953,6 +953,36 @@ class TestModelFunction(unittest.TestCase):
             np.testing.assert_almost_equal(losses[0], losses[1], decimal=4)
             np.testing.assert_almost_equal(losses[0], losses[2], decimal=4)
 
+    def test_metrics_sync_interval(self):
+        paddle.disable_static()
+        np.random.seed(2024)
+        data = np.random.random(size=(40, 20)).astype(np.float32)
+        label = np.random.randint(0, 10, size=(40, 1)).astype(np.int64)
+        dataset = paddle.io.TensorDataset(
+            [paddle.to_tensor(data), paddle.to_tensor(label)]
+        )
+        net = MyModel()
+        inputs = [InputSpec([None, 20], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+
+        results = []
+        for sync_interval in [1, 3]:
+            model = Model(net, inputs, labels)
+            model.prepare(
+                loss=CrossEntropyLoss(),
+                metrics=Accuracy(topk=(1, 2)),
+                metrics_sync_interval=sync_interval,
+            )
+            results.append(model.evaluate(dataset, batch_size=4, verbose=0))
+        self.assertEqual(results[0].keys(), results[1].keys())
+        for key in results[0]:
+            np.testing.assert_allclose(
+                results[0][key], results[1][key], rtol=1e-6
+            )
+
+        with self.assertRaises(ValueError):
+            Model(net, inputs, labels).prepare(metrics_sync_interval=0)
+
 
 class TestModelWithLRScheduler(unittest.TestCase):
     def test_fit_by_step(self):
@@ -0,0 +1,97 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+
+IMAGE_SHAPE = [3, 64, 64]
+SAMPLE_NUM = 256
+BATCH_SIZE = 16
+
+
+class DictDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        image = np.full(IMAGE_SHAPE, idx, dtype='float32')
+        return {'image': image, 'label': np.array([idx], dtype='int64')}
+
+    def __len__(self):
+        return self.sample_num
+
+
+def run_loader(num_workers, use_shm_ring, slot_size=None):
+    env = {'FLAGS_use_shm_ring': '1' if use_shm_ring else '0'}
+    if slot_size is not None:
+        env['FLAGS_shm_ring_slot_size'] = str(slot_size)
+    old_env = {k: os.environ.get(k) for k in env}
+    os.environ.update(env)
+    try:
+        loader = DataLoader(
+            DictDataset(SAMPLE_NUM),
+            batch_size=BATCH_SIZE,
+            num_workers=num_workers,
+            drop_last=False,
+        )
+        results = []
+        for data in loader:
+            results.append(
+                (data['image'].numpy(), data['label'].numpy().flatten())
+            )
+        return results
+    finally:
+        for k, v in old_env.items():
+            if v is None:
+                os.environ.pop(k)
+            else:
+                os.environ[k] = v
+
+
+@unittest.skipIf(
+    sys.platform in ['darwin', 'win32'],
+    "multi-process DataLoader is only supported on Linux",
+)
+class TestShmRingDataLoader(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def check_results(self, results):
+        self.assertEqual(len(results), SAMPLE_NUM // BATCH_SIZE)
+        for i, (image, label) in enumerate(results):
+            expected = np.arange(i * BATCH_SIZE, (i + 1) * BATCH_SIZE)
+            np.testing.assert_array_equal(label, expected)
+            self.assertEqual(list(image.shape), [BATCH_SIZE] + IMAGE_SHAPE)
+            np.testing.assert_array_equal(
+                image[:, 0, 0, 0], expected.astype('float32')
+            )
+
+    def test_shm_ring(self):
+        results = run_loader(num_workers=2, use_shm_ring=True)
+        self.check_results(results)
+
+    def test_fallback_to_queue(self):
+        # slot too small for a batch, batches fall back to queue path
+        results = run_loader(num_workers=2, use_shm_ring=True, slot_size=64)
+        self.check_results(results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import sys
+import time
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset, IterableDataset
+
+SAMPLE_NUM = 64
+BATCH_SIZE = 2
+SLOW_SAMPLE_INTERVAL = 16
+
+
+class HeterogeneousDataset(Dataset):
+    def __init__(self, sample_num, slow_time=0.2, fast_time=0.005):
+        self.sample_num = sample_num
+        self.slow_time = slow_time
+        self.fast_time = fast_time
+
+    def __getitem__(self, idx):
+        if idx % SLOW_SAMPLE_INTERVAL == 0:
+            time.sleep(self.slow_time)
+        else:
+            time.sleep(self.fast_time)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class BlockingDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+        self.event = multiprocessing.Event()
+
+    def __getitem__(self, idx):
+        # the first sample is blocked until the later batches are received
+        if idx == 0:
+            self.event.wait(30)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class SimpleIterableDataset(IterableDataset):
+    def __iter__(self):
+        for i in range(SAMPLE_NUM):
+            yield np.array([i]).astype('int64')
+
+
+def run_loader(in_order, num_workers=4, persistent_workers=False, epochs=1):
+    loader = DataLoader(
+        HeterogeneousDataset(SAMPLE_NUM),
+        batch_size=BATCH_SIZE,
+        num_workers=num_workers,
+        in_order=in_order,
+        persistent_workers=persistent_workers,
+    )
+    all_indices = []
+    for _ in range(epochs):
+        indices = []
+        for data in loader:
+            indices.append(data.numpy().flatten().tolist())
+        all_indices.append(indices)
+    return all_indices
+
+
+@unittest.skipIf(
+    sys.platform in ['darwin', 'win32'],
+    "multi-process DataLoader is only supported on Linux",
+)
+class TestUnorderedDataLoader(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def check_indices(self, indices):
+        expected = [
+            list(range(i, i + BATCH_SIZE))
+            for i in range(0, SAMPLE_NUM, BATCH_SIZE)
+        ]
+        self.assertEqual(sorted(indices), expected)
+
+    def test_in_order(self):
+        (indices,) = run_loader(in_order=True)
+        self.assertEqual(
+            indices,
+            [
+                list(range(i, i + BATCH_SIZE))
+                for i in range(0, SAMPLE_NUM, BATCH_SIZE)
+            ],
+        )
+
+    def test_out_of_order(self):
+        (indices,) = run_loader(in_order=False)
+        self.check_indices(indices)
+
+    def test_reorder_window(self):
+        num_workers = 2
+        (indices,) = run_loader(in_order=False, num_workers=num_workers)
+        # prefetch_factor * num_workers
+        window = 2 * num_workers
+        for pos, batch in enumerate(indices):
+            self.assertLess(batch[0] // BATCH_SIZE, pos + window)
+
+    def test_persistent_workers(self):
+        all_indices = run_loader(
+            in_order=False, persistent_workers=True, epochs=2
+        )
+        for indices in all_indices:
+            self.check_indices(indices)
+
+    def test_iterable_dataset(self):
+        with self.assertWarns(UserWarning):
+            loader = DataLoader(
+                SimpleIterableDataset(),
+                batch_size=BATCH_SIZE,
+                num_workers=2,
+                in_order=False,
+            )
+        self.assertTrue(loader.in_order)
+
+    def test_slow_sample_not_blocking(self):
+        dataset = BlockingDataset(SAMPLE_NUM)
+        loader = DataLoader(
+            dataset, batch_size=BATCH_SIZE, num_workers=2, in_order=False
+        )
+        loader_iter = iter(loader)
+        try:
+            # the batches of the other worker are delivered while the
+            # first batch is blocked
+            indices = [
+                next(loader_iter).numpy().flatten().tolist() for _ in range(2)
+            ]
+            self.assertTrue(all(batch[0] != 0 for batch in indices))
+        finally:
+            dataset.event.set()
+        indices.extend(data.numpy().flatten().tolist() for data in loader_iter)
+        self.check_indices(indices)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -197,6 +197,35 @@ class TestProfiler(unittest.TestCase):
         prof.stop()
 
 
+class TestIncrementalSummary(unittest.TestCase):
+    def test_incremental_summary(self):
+        x_value = np.random.randn(2, 3, 3)
+        x = paddle.to_tensor(
+            x_value, stop_gradient=False, place=paddle.CPUPlace()
+        )
+        prof = profiler.Profiler(
+            targets=[profiler.ProfilerTarget.CPU],
+            scheduler=(1, 5),
+            on_trace_ready=lambda prof: None,
+            incremental_summary=True,
+        )
+        prof.start()
+        for i in range(6):
+            y = x / 2.0
+            prof.step()
+        prof.stop()
+
+        statistic_data = prof._statistic_data
+        self.assertEqual(statistic_data.node_trees, {})
+        self.assertEqual(
+            statistic_data.event_summary.model_perspective_items[
+                'ProfileStep'
+            ].call,
+            4,
+        )
+        prof.summary()
+
+
 class TestGetProfiler(unittest.TestCase):
     def test_getprofiler(self):
         config_content = '''
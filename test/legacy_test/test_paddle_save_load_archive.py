@@ -0,0 +1,227 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+from paddle.framework import io as paddle_io
+
+
+class TestSaveLoadArchive(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build_obj(self):
+        layer = paddle.nn.Linear(10, 4)
+        opt = paddle.optimizer.Adam(parameters=layer.parameters())
+        layer(paddle.randn([2, 10])).mean().backward()
+        opt.step()
+        return {
+            'model': layer.state_dict(),
+            'opt': opt.state_dict(),
+            'epoch': 10,
+            'scalar': paddle.to_tensor(1.5),
+            'array': np.arange(12).reshape(3, 4)[:, ::2],
+            'list': [paddle.ones([2]), 'name'],
+        }
+
+    def check_value(self, loaded, expected):
+        if isinstance(expected, dict):
+            self.assertEqual(sorted(loaded.keys()), sorted(expected.keys()))
+            for key in expected:
+                self.check_value(loaded[key], expected[key])
+        elif isinstance(expected, (list, tuple)):
+            self.assertEqual(len(loaded), len(expected))
+            for v1, v2 in zip(loaded, expected):
+                self.check_value(v1, v2)
+        elif isinstance(expected, paddle.Tensor):
+            self.assertIsInstance(loaded, paddle.Tensor)
+            self.assertEqual(loaded.name, expected.name)
+            self.assertEqual(loaded.shape, expected.shape)
+            np.testing.assert_array_equal(loaded.numpy(), expected.numpy())
+        elif isinstance(expected, np.ndarray):
+            np.testing.assert_array_equal(loaded, expected)
+        else:
+            self.assertEqual(loaded, expected)
+
+    def test_save_load(self):
+        obj = self.build_obj()
+        paddle.save(obj, self.path, use_archive_format=True)
+        loaded = paddle.load(self.path)
+        self.check_value(loaded, obj)
+
+        layer = paddle.nn.Linear(10, 4)
+        layer.set_state_dict(loaded['model'])
+        for key, value in layer.state_dict().items():
+            np.testing.assert_array_equal(
+                value.numpy(), obj['model'][key].numpy()
+            )
+
+    def test_return_numpy(self):
+        obj = self.build_obj()
+        paddle.save(obj, self.path, use_archive_format=True)
+        loaded = paddle.load(self.path, return_numpy=True)
+        weight = loaded['model']['weight']
+        self.assertIsInstance(weight, np.ndarray)
+        np.testing.assert_array_equal(weight, obj['model']['weight'].numpy())
+        # copy-on-write view, the archive is not modified
+        weight[:] = 0
+        np.testing.assert_array_equal(
+            paddle.load(self.path, return_numpy=True)['model']['weight'],
+            obj['model']['weight'].numpy(),
+        )
+
+    def test_lazy_materialize(self):
+        state_dict = {
+            'w1': paddle.randn([4, 4]),
+            'w2': paddle.randn([4, 4]),
+        }
+        paddle.save(state_dict, self.path, use_archive_format=True)
+        loaded = paddle.load(self.path)
+        self.assertFalse(
+            any(isinstance(v, paddle.Tensor) for v in dict.values(loaded))
+        )
+        w1 = loaded['w1']
+        self.assertIs(loaded['w1'], w1)
+        self.assertNotIsInstance(dict.__getitem__(loaded, 'w2'), paddle.Tensor)
+        self.check_value(dict(loaded), state_dict)
+
+    def test_single_tensor(self):
+        tensor = paddle.randn([3, 5])
+        paddle.save(tensor, self.path, use_archive_format=True)
+        self.check_value(paddle.load(self.path), tensor)
+
+    def test_memory_buffer(self):
+        obj = self.build_obj()
+        tensor = paddle.randn([2, 3])
+        byio = BytesIO()
+        paddle.save(obj, byio, use_archive_format=True)
+        paddle.save(tensor, byio, use_archive_format=True)
+        byio.seek(0)
+        self.check_value(paddle.load(byio), obj)
+        self.check_value(paddle.load(byio), tensor)
+
+    def test_error(self):
+        with self.assertRaises(TypeError):
+            paddle.save({}, self.path, use_archive_format=1)
+        with self.assertRaises(ValueError):
+            paddle.save(
+                {},
+                self.path,
+                use_archive_format=True,
+                use_binary_format=True,
+            )
+        with self.assertRaises(ValueError):
+            paddle.save(
+                paddle.nn.Linear(2, 2), self.path, use_archive_format=True
+            )
+
+
+class TestAsyncSaveArchive(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'ckpt', 'model.pdparams')
+        self.chunk_size = paddle_io._ASYNC_SAVE_CHUNK_SIZE
+        # split every weight into several chunks
+        paddle_io._ASYNC_SAVE_CHUNK_SIZE = 1024
+
+    def tearDown(self):
+        paddle_io._ASYNC_SAVE_CHUNK_SIZE = self.chunk_size
+        self.temp_dir.cleanup()
+
+    def build_state_dict(self):
+        return {
+            'w1': paddle.randn([64, 33]),
+            'w2': paddle.randn([7]).astype('float16'),
+            'step': paddle.to_tensor(3, dtype='int64'),
+            'array': np.arange(100),
+            'epoch': 1,
+        }
+
+    def test_async_save(self):
+        for max_host_memory in [None, 4096, 1]:
+            state_dict = self.build_state_dict()
+            expected = {
+                k: v.numpy() if isinstance(v, paddle.Tensor) else v
+                for k, v in state_dict.items()
+            }
+            paddle.async_save(
+                state_dict,
+                self.path,
+                use_archive_format=True,
+                num_threads=3,
+                max_host_memory=max_host_memory,
+                fsync=True,
+            )
+            # saved values are copied before async_save returns
+            state_dict['w1'].set_value(paddle.zeros([64, 33]))
+            paddle.clear_async_save_task_queue()
+
+            loaded = paddle.load(self.path, return_numpy=True)
+            for key, value in expected.items():
+                np.testing.assert_array_equal(loaded[key], value)
+            self.assertEqual(
+                os.listdir(os.path.dirname(self.path)), ['model.pdparams']
+            )
+
+    def test_atomic_replace(self):
+        state_dict = self.build_state_dict()
+        paddle.async_save(state_dict, self.path, fsync=True)
+        paddle.clear_async_save_task_queue()
+        np.testing.assert_array_equal(
+            paddle.load(self.path)['w1'].numpy(), state_dict['w1'].numpy()
+        )
+        self.assertEqual(
+            os.listdir(os.path.dirname(self.path)), ['model.pdparams']
+        )
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            paddle.async_save({}, BytesIO(), use_archive_format=True)
+        with self.assertRaises(ValueError):
+            paddle.async_save({}, self.path, num_threads=0)
+        with self.assertRaises(ValueError):
+            paddle.async_save({}, self.path, max_host_memory=0)
+
+
+class TestSaveLoadArchiveStatic(unittest.TestCase):
+    def test_static_load(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        path = os.path.join(temp_dir.name, 'tensor.pdtensor')
+        array = np.random.random([3, 4]).astype('float32')
+        paddle.disable_static()
+        paddle.save(
+            {'x': paddle.to_tensor(array)}, path, use_archive_format=True
+        )
+        paddle.enable_static()
+        loaded = paddle.load(path)['x']
+        self.assertIsInstance(loaded, paddle.base.core.LoDTensor)
+        np.testing.assert_array_equal(np.array(loaded), array)
+        paddle.disable_static()
+        temp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle import profiler
+from paddle.profiler.compact_trace import _save_compact_trace
+
+
+class HostPythonNode:
+    def __init__(self, name, type, start_ns, end_ns, process_id, thread_id):
+        self.name = name
+        self.type = type
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.process_id = process_id
+        self.thread_id = thread_id
+        self.children_node = []
+        self.runtime_node = []
+        self.device_node = []
+        self.mem_node = []
+
+
+class DevicePythonNode:
+    def __init__(
+        self, name, type, start_ns, end_ns, device_id, context_id, stream_id
+    ):
+        self.name = name
+        self.type = type
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.device_id = device_id
+        self.context_id = context_id
+        self.stream_id = stream_id
+
+
+class ProfilerResult:
+    def __init__(self, node_trees):
+        self.node_trees = node_trees
+
+    def get_data(self):
+        return self.node_trees
+
+
+def build_result(offset, num_steps=2):
+    root_node = HostPythonNode(
+        'Root Node', profiler.TracerEventType.UserDefined, 0, 0, 1000, 1001
+    )
+    for step in range(num_steps):
+        start = offset + step * 1000
+        step_node = HostPythonNode(
+            f'ProfileStep#{step}',
+            profiler.TracerEventType.ProfileStep,
+            start,
+            start + 1000,
+            1000,
+            1001,
+        )
+        allreduce_node = HostPythonNode(
+            'c_allreduce_sum',
+            profiler.TracerEventType.Operator,
+            start + 100,
+            start + 200,
+            1000,
+            1001,
+        )
+        launch_node = HostPythonNode(
+            'cudaLaunchKernel',
+            profiler.TracerEventType.CudaRuntime,
+            start + 100,
+            start + 150,
+            1000,
+            1001,
+        )
+        kernel_node = DevicePythonNode(
+            'ncclKernel_AllReduce',
+            profiler.TracerEventType.Kernel,
+            start + 300,
+            start + 900,
+            0,
+            0,
+            7,
+        )
+        launch_node.device_node.append(kernel_node)
+        allreduce_node.runtime_node.append(launch_node)
+        step_node.children_node.append(allreduce_node)
+        root_node.children_node.append(step_node)
+    return ProfilerResult({1001: root_node})
+
+
+class TestCompactTrace(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def save_traces(self):
+        # The clock of rank 1 is 500ns ahead of rank 0.
+        for rank, clock_offset_ns in [(0, 0), (1, 500)]:
+            _save_compact_trace(
+                build_result(10**9 + clock_offset_ns),
+                os.path.join(
+                    self.temp_dir.name, f'rank{rank}.paddle_trace.npz'
+                ),
+                rank=rank,
+                clock_offset_ns=clock_offset_ns,
+            )
+
+    def test_merge_traces(self):
+        self.save_traces()
+        for align, offset in [(None, 500), ('clock', 0), ('communication', 0)]:
+            trace = profiler.merge_traces(self.temp_dir.name, align=align)
+            self.assertEqual(trace.ranks, [0, 1])
+            self.assertEqual(len(trace), 2 * 2 * 4)
+            starts = trace.columns['start_ns']
+            self.assertTrue(np.all(starts[1:] >= starts[:-1]))
+
+            is_step = (
+                trace.columns['type']
+                == profiler.TracerEventType.ProfileStep.value
+            )
+            rank0 = is_step & (trace.columns['rank'] == 0)
+            rank1 = is_step & (trace.columns['rank'] == 1)
+            np.testing.assert_array_equal(
+                starts[rank1] - starts[rank0], [offset, offset]
+            )
+        self.assertEqual(trace.clock_offsets, {0: 0, 1: 500})
+
+    def test_export_chrome_tracing(self):
+        self.save_traces()
+        trace = profiler.merge_traces(self.temp_dir.name)
+        start_ns, end_ns = trace.time_range()
+        self.assertEqual(start_ns, 10**9)
+
+        path = os.path.join(self.temp_dir.name, 'merged.json')
+        trace.export_chrome_tracing(path, start_ns, start_ns + 999, ranks=[1])
+        with open(path) as f:
+            events = json.load(f)['traceEvents']
+        events = [event for event in events if event.get('ph') == 'X']
+        self.assertEqual(len(events), 4)
+        self.assertTrue(all(event['pid'] == 1 for event in events))
+        self.assertEqual(
+            {event['name'] for event in events},
+            {
+                'ProfileStep#0',
+                'c_allreduce_sum',
+                'cudaLaunchKernel',
+                'ncclKernel_AllReduce',
+            },
+        )
+        kernel_event = next(e for e in events if e['cat'] == 'Kernel')
+        self.assertEqual(kernel_event['tid'], 'GPU:0 stream 7')
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            profiler.merge_traces(self.temp_dir.name)
+        with self.assertRaises(ValueError):
+            profiler.merge_traces(self.temp_dir.name, align='step')
+
+    def test_profiler(self):
+        x = paddle.to_tensor(np.random.randn(2, 3, 3), place=paddle.CPUPlace())
+        with profiler.Profiler(
+            targets=[profiler.ProfilerTarget.CPU],
+            scheduler=(1, 3),
+            on_trace_ready=profiler.export_compact_tracing(self.temp_dir.name),
+        ) as prof:
+            for i in range(4):
+                y = x / 2.0
+                prof.step()
+
+        trace = profiler.merge_traces(self.temp_dir.name)
+        self.assertGreater(len(trace), 0)
+        self.assertIn(
+            'ProfileStep#1', [str(name) for name in trace.names.tolist()]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
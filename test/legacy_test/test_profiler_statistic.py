@@ -1044,6 +1044,150 @@ class TestProfilerStatistic(unittest.TestCase):
                 )
             )
 
+    def test_statistic_merge(self):
+        def build_step(step, offset):
+            step_node = HostPythonNode(
+                f'ProfileStep#{step}',
+                profiler.TracerEventType.ProfileStep,
+                offset,
+                offset + 100,
+                1000,
+                1001,
+            )
+            conv2d_node = HostPythonNode(
+                'conv2d',
+                profiler.TracerEventType.Operator,
+                offset + 10,
+                offset + 10 + 20 * (step + 1),
+                1000,
+                1001,
+            )
+            launchkernel_node = HostPythonNode(
+                'cudalaunchkernel',
+                profiler.TracerEventType.CudaRuntime,
+                offset + 10,
+                offset + 15,
+                1000,
+                1001,
+            )
+            kernel_node = DevicePythonNode(
+                'conv2d_kernel',
+                profiler.TracerEventType.Kernel,
+                offset + 20,
+                offset + 50,
+                0,
+                0,
+                0,
+            )
+            conv2d_node.mem_node.append(
+                MemPythonNode(
+                    offset + 12,
+                    0,
+                    profiler_statistic.TracerMemEventType.Allocate,
+                    1000,
+                    1001,
+                    20,
+                    'place(gpu:0)',
+                    200,
+                    200,
+                    800 + step,
+                    800,
+                )
+            )
+            launchkernel_node.device_node.append(kernel_node)
+            conv2d_node.runtime_node.append(launchkernel_node)
+            step_node.children_node.append(conv2d_node)
+            return step_node
+
+        def build_tree(steps):
+            root_node = HostPythonNode(
+                'Root Node',
+                profiler.TracerEventType.UserDefined,
+                0,
+                float('inf'),
+                1000,
+                1001,
+            )
+            for step in steps:
+                root_node.children_node.append(build_step(step, step * 200))
+            return {'thread1001': root_node}
+
+        extra_info = {
+            'Process Cpu Utilization': '1.02',
+            'System Cpu Utilization': '0.68',
+        }
+        expected = profiler_statistic.StatisticData(
+            build_tree([0, 1, 2]), extra_info
+        )
+        merged = profiler_statistic.StatisticData({}, {})
+        for step in [0, 1, 2]:
+            merged.merge(
+                profiler_statistic.StatisticData(build_tree([step]), extra_info)
+            )
+
+        self.assertEqual(merged.node_trees, {})
+        self.assertEqual(merged.extra_info, extra_info)
+        for event_type in [
+            profiler.TracerEventType.ProfileStep,
+            profiler.TracerEventType.Operator,
+            profiler.TracerEventType.CudaRuntime,
+        ]:
+            self.assertEqual(
+                merged.time_range_summary.get_cpu_range_sum(event_type),
+                expected.time_range_summary.get_cpu_range_sum(event_type),
+            )
+            self.assertEqual(
+                merged.time_range_summary.call_times[event_type],
+                expected.time_range_summary.call_times[event_type],
+            )
+        self.assertEqual(
+            merged.time_range_summary.get_gpu_range_sum(
+                0, profiler.TracerEventType.Kernel
+            ),
+            90,
+        )
+        self.assertEqual(
+            merged.time_range_summary.GPUTimeRange[0][
+                profiler.TracerEventType.Kernel
+            ],
+            expected.time_range_summary.GPUTimeRange[0][
+                profiler.TracerEventType.Kernel
+            ],
+        )
+
+        merged_item = merged.event_summary.items['conv2d']
+        expected_item = expected.event_summary.items['conv2d']
+        self.assertEqual(merged_item.call, 3)
+        self.assertEqual(merged_item.cpu_time, expected_item.cpu_time)
+        self.assertEqual(merged_item.gpu_time, expected_item.gpu_time)
+        self.assertEqual(merged_item.min_cpu_time, 20)
+        self.assertEqual(merged_item.max_cpu_time, 60)
+        self.assertEqual(merged_item.devices['conv2d_kernel'].call, 3)
+        self.assertEqual(
+            merged.event_summary.kernel_items['conv2d_kernel'].gpu_time, 90
+        )
+        self.assertEqual(
+            merged.event_summary.model_perspective_items['ProfileStep'].call,
+            3,
+        )
+
+        memory_summary = merged.memory_summary
+        self.assertEqual(
+            memory_summary.allocated_items['place(gpu:0)'][
+                'conv2d'
+            ].allocation_count,
+            3,
+        )
+        self.assertEqual(
+            memory_summary.allocated_items['place(gpu:0)'][
+                'conv2d'
+            ].increase_size,
+            60,
+        )
+        self.assertEqual(
+            memory_summary.peak_allocation_values['place(gpu:0)'], 802
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import urllib.request
+
+import numpy as np
+
+import paddle
+from paddle import profiler
+from paddle.io import DataLoader, Dataset
+from paddle.profiler.step_timer import LogHistogram, StepTimer
+
+
+class RandomDataset(Dataset):
+    def __getitem__(self, idx):
+        return np.random.random([10]).astype('float32')
+
+    def __len__(self):
+        return 16
+
+
+class TestLogHistogram(unittest.TestCase):
+    def test_percentiles(self):
+        np.random.seed(2024)
+        values = np.random.exponential(1e6, size=10000).astype('int64')
+        histogram = LogHistogram()
+        for value in values:
+            histogram.record(int(value))
+        self.assertEqual(histogram.count, len(values))
+        self.assertEqual(histogram.max, values.max())
+        expected = np.percentile(values, [50, 90, 99])
+        np.testing.assert_allclose(
+            histogram.percentiles([50, 90, 99]), expected, rtol=0.01
+        )
+
+    def test_empty(self):
+        self.assertEqual(LogHistogram().percentiles([50, 99]), [0, 0])
+
+
+class TestStepTimer(unittest.TestCase):
+    def test_rolling_window(self):
+        timer = StepTimer(window=10)
+        timer.record('forward', 1.0)
+        self.assertEqual(timer.summary(), {})
+
+        timer.enable()
+        for _ in range(25):
+            timer.record('forward', 0.001)
+            with timer.phase('backward'):
+                pass
+            timer.step()
+        summary = timer.summary()
+        self.assertEqual(set(summary.keys()), {'forward', 'backward', 'batch'})
+        # The window keeps the previous and the current records
+        self.assertEqual(summary['forward']['count'], 15)
+        self.assertAlmostEqual(summary['forward']['p99'], 0.001, delta=1e-5)
+
+        timer.reset()
+        self.assertEqual(timer.summary(), {})
+
+    def test_prometheus(self):
+        timer = StepTimer()
+        timer.enable()
+        timer.record('reader', 0.5)
+        text = timer.to_prometheus()
+        self.assertIn(
+            'paddle_step_phase_seconds{phase="reader",quantile="0.99"}', text
+        )
+        self.assertIn('paddle_step_phase_seconds_count{phase="reader"} 1', text)
+
+        server = timer.start_http_server(0, '127.0.0.1')
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(
+                f'http://127.0.0.1:{port}/metrics'
+            ) as response:
+                self.assertEqual(response.read().decode('utf-8'), text)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_dataloader_and_profiler(self):
+        paddle.disable_static()
+        timer = profiler.step_timer()
+        timer.reset()
+        timer.enable()
+        loader = DataLoader(RandomDataset(), batch_size=4)
+        prof = profiler.Profiler(timer_only=True)
+        prof.start()
+        for _ in loader:
+            prof.step()
+        prof.stop()
+        timer.disable()
+
+        summary = timer.summary()
+        self.assertEqual(summary['reader']['count'], 4)
+        self.assertEqual(summary['batch']['count'], 4)
+        timer.reset()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Microbenchmark of the guard overhead per call, run it by:
+# >>> python benchmark_guard.py
+# It reports the cost of the compiled guard and of the guard lambda built from
+# the same expressions, for a frame hitting the guard and a frame missing it.
+
+import sys
+import timeit
+
+import paddle
+from paddle.jit.sot import symbolic_translate
+from paddle.jit.sot.opcode_translator.executor.executor_cache import (
+    OpcodeExecutorCache,
+)
+from paddle.jit.sot.utils import min_graph_size_guard
+
+ITERS = 10000
+
+
+class SmallNet(paddle.nn.Layer):
+    def __init__(self, num_layers):
+        super().__init__()
+        self.layers = paddle.nn.LayerList(
+            [paddle.nn.Linear(4, 4) for _ in range(num_layers)]
+        )
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = layer(x)
+        return x
+
+
+def small_ops(net, x, y, scale, bias):
+    out = net(x) * scale + bias
+    return out + y
+
+
+def make_frame(net, x, y, scale, bias):
+    return sys._getframe()
+
+
+def bench(fn, frame):
+    cost = timeit.timeit(lambda: fn(frame), number=ITERS)
+    return cost / ITERS * 1e6
+
+
+def main():
+    net = SmallNet(8)
+    inputs = [net, paddle.rand([2, 4]), paddle.rand([2, 4]), 2.0, 1]
+    with min_graph_size_guard(0):
+        symbolic_translate(small_ops)(*inputs)
+    guarded_fns = OpcodeExecutorCache().cache[small_ops.__code__]
+    _, guard_fn = next(iter(guarded_fns))
+
+    lambda_guard = eval(guard_fn.lambda_expr, guard_fn.__globals__)
+    num_checks = len(guard_fn.lambda_expr.split(" and "))
+    hit_frame = make_frame(*inputs)
+    miss_frame = make_frame(*inputs[:3], 3.0, 1)
+    assert guard_fn(hit_frame) and lambda_guard(hit_frame)
+    assert not guard_fn(miss_frame) and not lambda_guard(miss_frame)
+
+    print(f"guard checks: {num_checks}, iters: {ITERS}")
+    for name, frame in [("hit", hit_frame), ("miss", miss_frame)]:
+        print(
+            f"[{name}] compiled guard: {bench(guard_fn, frame):.2f} us, "
+            f"guard lambda: {bench(lambda_guard, frame):.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
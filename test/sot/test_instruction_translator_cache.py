@@ -27,8 +27,15 @@ from test_case_base import (
 
 from paddle.jit.sot.opcode_translator.custom_code import CustomCode
 from paddle.jit.sot.opcode_translator.executor.executor_cache import (
+    GuardedFunctions,
     OpcodeExecutorCache,
 )
+from paddle.jit.sot.opcode_translator.executor.guard import (
+    StringifyExpression,
+    get_dispatch_keys,
+    make_guard,
+)
+from paddle.jit.sot.utils import tmp_name_guard
 
 
 def fake_frames() -> (
@@ -150,6 +157,53 @@ class TestOpcodeExecutorCache(unittest.TestCase):
             self.assertEqual(ctx.translate_count, 2)
 
 
+def make_constant_guard(value, counter):
+    lambda_expr = f"lambda frame: frame.f_locals['x'] == {value}"
+
+    def guard(frame):
+        counter.append(value)
+        return frame.f_locals['x'] == value
+
+    guard.lambda_expr = lambda_expr
+    guard.dispatch_keys = get_dispatch_keys(lambda_expr)
+    return guard
+
+
+class TestGuardedFunctions(unittest.TestCase):
+    def test_dispatch(self):
+        counter = []
+        guarded_fns = GuardedFunctions()
+        for value in range(10):
+            guarded_fns.append(
+                (CustomCode(None, False), make_constant_guard(value, counter))
+            )
+        guarded_fns.append((CustomCode(None, False), lambda frame: True))
+        self.assertEqual(guarded_fns.dispatch_key, "frame.f_locals['x']")
+        self.assertEqual(len(guarded_fns.buckets), 10)
+
+        frame = types.SimpleNamespace(f_locals={'x': 7})
+        candidates = guarded_fns.candidates(frame)
+        # the unkeyed guard and the guard of 7
+        self.assertEqual(candidates, [10, 7])
+        for entry_id in candidates:
+            guarded_fns.entries[entry_id][1](frame)
+        self.assertEqual(counter, [7])
+
+        frame = types.SimpleNamespace(f_locals={'x': [7]})
+        self.assertEqual(len(guarded_fns.candidates(frame)), 11)
+
+    def test_evict(self):
+        guarded_fns = GuardedFunctions()
+        for value in range(3):
+            guarded_fns.append(
+                (CustomCode(None, False), make_constant_guard(value, []))
+            )
+        guarded_fns.hit(0)
+        guarded_fns.evict()
+        self.assertEqual(list(guarded_fns.entries.keys()), [2, 0])
+        self.assertEqual(set(guarded_fns.buckets.keys()), {0, 2})
+
+
 def foo(x):
     return x + 1
 
@@ -161,5 +215,38 @@ class TestCacheExceedLimit(TestCaseBase):
             self.assert_results(foo, input)
 
 
+class TestMakeGuard(unittest.TestCase):
+    def test_cheap_check_first(self):
+        calls = []
+
+        def expensive_check(value):
+            calls.append(value)
+            return value
+
+        with tmp_name_guard():
+            x_tracer = StringifyExpression("frame.f_locals['x']", [], {})
+            y_tracer = StringifyExpression("frame.f_locals['y']", [], {})
+            guard = make_guard(
+                [
+                    StringifyExpression(
+                        "expensive_check({}) == 1",
+                        [x_tracer],
+                        {"expensive_check": expensive_check},
+                    ),
+                    StringifyExpression(
+                        f"id(type({{}})) == {id(int)}", [y_tracer], {}
+                    ),
+                ]
+            )
+
+        # The cheap check fails, so the expensive one is skipped
+        self.assertFalse(
+            guard(types.SimpleNamespace(f_locals={'x': 1, 'y': 1.0}))
+        )
+        self.assertEqual(calls, [])
+        self.assertTrue(guard(types.SimpleNamespace(f_locals={'x': 1, 'y': 1})))
+        self.assertEqual(calls, [1])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tempfile
+import unittest
+
+import numpy as np
+from test_case_base import (
+    TestCaseBase,
+    test_instruction_translator_cache_context,
+)
+
+import paddle
+from paddle.jit import sot
+
+
+def inner(x):
+    return x * 2
+
+
+def foo(x, y):
+    z = inner(x) + y
+    # Break graph, the rest of the function is a resume function
+    print("break graph")
+    return z - 1
+
+
+class TestAotExport(TestCaseBase):
+    def test_export_and_load(self):
+        x = paddle.rand([2, 3])
+        y = paddle.rand([2, 3])
+        with tempfile.TemporaryDirectory() as path:
+            with test_instruction_translator_cache_context() as ctx:
+                out = sot.export(foo, (x, y), path)
+                np.testing.assert_allclose(out.numpy(), foo(x, y).numpy())
+                self.assertGreater(ctx.translate_count, 0)
+
+            # Load in a clean cache, as if in an inference process
+            with test_instruction_translator_cache_context() as ctx:
+                loaded_foo = sot.load(foo, path)
+                out = loaded_foo(x, y)
+                np.testing.assert_allclose(out.numpy(), foo(x, y).numpy())
+                self.assertEqual(ctx.translate_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
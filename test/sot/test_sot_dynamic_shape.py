@@ -0,0 +1,77 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from test_case_base import (
+    TestCaseBase,
+    test_instruction_translator_cache_context,
+)
+
+import paddle
+from paddle.jit.sot.infer_meta import DynamicDimRecorder, MetaInfo
+from paddle.jit.sot.utils import dynamic_dim_threshold_guard
+
+
+def foo(x, y):
+    z = paddle.matmul(x, y)
+    return z * 2 + 1
+
+
+class TestDynamicDim(TestCaseBase):
+    def test_dynamic_seq_len(self):
+        y = paddle.rand([8, 4])
+        with dynamic_dim_threshold_guard(2):
+            with test_instruction_translator_cache_context() as ctx:
+                for seq_len in [3, 5, 7, 9, 11]:
+                    x = paddle.rand([2, seq_len, 8])
+                    self.assert_results(foo, x, y)
+                # The second length makes dim 1 dynamic
+                self.assertEqual(ctx.translate_count, 2)
+
+                # Static dims are still guarded
+                self.assert_results(foo, paddle.rand([4, 13, 8]), y)
+                self.assertEqual(ctx.translate_count, 3)
+
+    def test_disabled(self):
+        y = paddle.rand([8, 4])
+        with dynamic_dim_threshold_guard(0):
+            with test_instruction_translator_cache_context() as ctx:
+                for seq_len in [3, 5, 7]:
+                    x = paddle.rand([2, seq_len, 8])
+                    self.assert_results(foo, x, y)
+                self.assertEqual(ctx.translate_count, 3)
+
+
+class TestDynamicDimRecorder(unittest.TestCase):
+    def test_record(self):
+        recorder = DynamicDimRecorder()
+        recorder.clear()
+        with dynamic_dim_threshold_guard(3):
+            self.assertEqual(recorder.record("x", [2, 3]), ())
+            self.assertEqual(recorder.record("x", [2, 4]), ())
+            self.assertEqual(recorder.record("x", [2, 5]), (1,))
+            self.assertEqual(recorder.record("y", [2, 6]), ())
+        recorder.clear()
+
+    def test_meta_info(self):
+        x = paddle.rand([2, 3, 4])
+        meta = MetaInfo.from_tensor(x, dynamic_dims=(1,))
+        self.assertEqual(meta.shape, [2, -1, 4])
+        self.assertEqual(meta.dynamic_dims(), (1,))
+        self.assertTrue(meta.is_dynamic_shape())
+
+
+if __name__ == "__main__":
+    unittest.main()
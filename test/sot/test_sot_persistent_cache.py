@@ -0,0 +1,140 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from test_case_base import (
+    TestCaseBase,
+    test_instruction_translator_cache_context,
+)
+
+import paddle
+from paddle.jit.sot.opcode_translator.executor.persistent_cache import (
+    PersistentCache,
+    parse_guarded_ids,
+    replace_guarded_ids,
+)
+from paddle.jit.sot.utils import sot_cache_dir_guard
+
+
+def foo(x, y):
+    z = x + y
+    return z * 2 + 1
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear = paddle.nn.Linear(4, 4)
+
+    def forward(self, x):
+        return self.linear(x) + 1
+
+
+def count_entries(cache_dir):
+    return sum(len(files) for _, _, files in os.walk(cache_dir))
+
+
+class TestPersistentCache(TestCaseBase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_restore_function(self):
+        x = paddle.rand([2, 3])
+        y = paddle.rand([2, 3])
+        with sot_cache_dir_guard(self.temp_dir.name):
+            with test_instruction_translator_cache_context() as ctx:
+                self.assert_results(foo, x, y)
+                self.assertEqual(ctx.translate_count, 1)
+            self.assertGreater(count_entries(self.temp_dir.name), 0)
+
+            # The in-memory cache is cleared, as if the process restarted
+            with test_instruction_translator_cache_context() as ctx:
+                self.assert_results(foo, x, y)
+                self.assertEqual(ctx.translate_count, 0)
+                self.assertEqual(PersistentCache().hit_count, 1)
+
+                # The cached guard misses with a different shape
+                self.assert_results(foo, paddle.rand([4]), paddle.rand([4]))
+                self.assertEqual(ctx.translate_count, 1)
+
+    def test_restore_layer(self):
+        net = SimpleNet()
+        x = paddle.rand([2, 4])
+        with sot_cache_dir_guard(self.temp_dir.name):
+            with test_instruction_translator_cache_context() as ctx:
+                self.assert_results(net.forward, x)
+                self.assertEqual(ctx.translate_count, 1)
+
+            # A new layer is bound to the cached translation
+            new_net = SimpleNet()
+            with test_instruction_translator_cache_context() as ctx:
+                self.assert_results(new_net.forward, x)
+                self.assertEqual(ctx.translate_count, 0)
+
+    def test_disabled(self):
+        x = paddle.rand([2, 3])
+        y = paddle.rand([2, 3])
+        with test_instruction_translator_cache_context() as ctx:
+            self.assert_results(foo, x, y)
+            self.assertEqual(ctx.translate_count, 1)
+        self.assertEqual(count_entries(self.temp_dir.name), 0)
+
+
+class TestGuardedIds(unittest.TestCase):
+    def test_replace_guarded_ids(self):
+        guard_expr = (
+            "lambda frame: id(frame.f_locals['self']) == 1234 and "
+            "id(type(frame.f_locals['x'])) == 5678 and "
+            "frame.f_locals['x'] == 12345"
+        )
+        self.assertEqual(
+            parse_guarded_ids(guard_expr),
+            {
+                1234: "frame.f_locals['self']",
+                5678: "type(frame.f_locals['x'])",
+            },
+        )
+        self.assertEqual(
+            replace_guarded_ids(guard_expr, {1234: 1, 5678: 2}),
+            "lambda frame: id(frame.f_locals['self']) == 1 and "
+            "id(type(frame.f_locals['x'])) == 2 and "
+            "frame.f_locals['x'] == 12345",
+        )
+
+    def test_replace_chained_guarded_ids(self):
+        guard_expr = (
+            "lambda frame: id(frame.f_locals['a']) == 1 and "
+            "id(frame.f_locals['b']) == 2"
+        )
+        # The id replaced by the first mapping is not replaced again
+        self.assertEqual(
+            replace_guarded_ids(guard_expr, {1: 2, 2: 3}),
+            "lambda frame: id(frame.f_locals['a']) == 2 and "
+            "id(frame.f_locals['b']) == 3",
+        )
+        self.assertEqual(
+            replace_guarded_ids(guard_expr, {1: 2, 2: 1}),
+            "lambda frame: id(frame.f_locals['a']) == 2 and "
+            "id(frame.f_locals['b']) == 1",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
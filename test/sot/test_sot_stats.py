@@ -0,0 +1,94 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+from test_case_base import (
+    TestCaseBase,
+    test_instruction_translator_cache_context,
+)
+
+import paddle
+from paddle.jit import sot
+
+
+def foo(x, y):
+    z = x + y
+    return z * 2
+
+
+def print_break_graph(x, y):
+    z = x + y
+    print(z)
+    return z * 2
+
+
+def find_stats(fn):
+    code = fn.__code__
+    key = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+    return sot.stats()[key]
+
+
+class TestSotStats(TestCaseBase):
+    def setUp(self):
+        sot.reset_stats()
+
+    def tearDown(self):
+        sot.reset_stats()
+
+    def test_translate_and_guard(self):
+        with test_instruction_translator_cache_context():
+            x = paddle.rand([2, 3])
+            y = paddle.rand([2, 3])
+            self.assert_results(foo, x, y)
+            self.assert_results(foo, x, y)
+            self.assert_results(foo, paddle.rand([4]), paddle.rand([4]))
+
+        foo_stats = find_stats(foo)
+        self.assertEqual(foo_stats["translate_count"], 2)
+        self.assertEqual(foo_stats["hit_count"], 1)
+        self.assertEqual(foo_stats["miss_count"], 2)
+        self.assertGreater(foo_stats["translate_time"], 0)
+        self.assertEqual(len(foo_stats["subgraph_sizes"]), 2)
+
+    def test_break_graph(self):
+        with test_instruction_translator_cache_context():
+            x = paddle.rand([2, 3])
+            y = paddle.rand([2, 3])
+            self.assert_results(print_break_graph, x, y)
+
+        break_graphs = find_stats(print_break_graph)["break_graphs"]
+        self.assertEqual(sum(break_graphs.values()), 1)
+        location = next(iter(break_graphs))
+        self.assertIn(print_break_graph.__code__.co_filename, location)
+
+    def test_export_and_reset(self):
+        with test_instruction_translator_cache_context():
+            self.assert_results(foo, paddle.rand([2]), paddle.rand([2]))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "stats.json")
+            sot.export_stats(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), sot.stats())
+
+        sot.reset_stats()
+        self.assertEqual(sot.stats(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()